@@ -0,0 +1,96 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from core.alert_rules import AlertEngine, parse_rules
+
+NAMES = [f"worker{i}" for i in range(200)] + ["chrome", "firefox", "python", "java", "node", "postgres"]
+
+
+def make_rules(count, rng):
+    lines = []
+    for i in range(count):
+        kind = i % 10
+        if kind == 0:
+            lines.append(f"cpu > {rng.randint(50, 99)} for {rng.randint(0, 60)}s")
+        elif kind == 1:
+            lines.append(f"memory > {rng.randint(50, 99)} for {rng.randint(0, 60)}s")
+        elif kind == 2:
+            lines.append(f"process * cpu > {rng.randint(60, 99)} for {rng.randint(0, 60)}s")
+        elif kind == 3:
+            lines.append(f"process worker{rng.randint(0, 20)}* rss > {rng.randint(100, 2000)}MB")
+        else:
+            name = rng.choice(NAMES)
+            metric = rng.choice(["cpu", "rss", "memory"])
+            value = {"cpu": f"{rng.randint(10, 90)}", "rss": f"{rng.randint(50, 4000)}MB", "memory": f"{rng.randint(1, 20)}"}[metric]
+            lines.append(f"process {name} {metric} > {value} for {rng.randint(0, 30)}s cooldown 5m")
+    return parse_rules("\n".join(lines))
+
+
+def make_table(count, rng):
+    table = []
+    for pid in range(1, count + 1):
+        table.append({
+            'pid': pid,
+            'name': NAMES[pid % len(NAMES)],
+            'cpu_percent': rng.random() * 100 if pid % 50 == 0 else rng.random() * 5,
+            'memory_percent': rng.random() * 10,
+            'rss': rng.randint(1, 3000) * 1024 ** 2
+        })
+    return table
+
+
+def make_snapshot(table, tick, rng):
+    # Stable per-process baselines with +/-10% jitter, like a real process table
+    processes = []
+    for base in table:
+        jitter = 0.9 + rng.random() * 0.2
+        processes.append({
+            'pid': base['pid'],
+            'name': base['name'],
+            'cpu_percent': base['cpu_percent'] * jitter,
+            'memory_percent': base['memory_percent'] * jitter,
+            'rss': int(base['rss'] * jitter)
+        })
+    return {
+        'time': 1_000_000.0 + tick,
+        'cpu_percent': rng.random() * 100,
+        'memory': {'percent': rng.random() * 100},
+        'processes': processes
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark alert rule evaluation per collector tick")
+    parser.add_argument('--rules', type=int, default=1000)
+    parser.add_argument('--processes', type=int, default=5000)
+    parser.add_argument('--ticks', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = AlertEngine(make_rules(args.rules, rng))
+    table = make_table(args.processes, rng)
+    snapshots = [make_snapshot(table, t, rng) for t in range(args.ticks)]
+
+    timings = []
+    fired = 0
+    for snap in snapshots:
+        start = time.perf_counter()
+        fired += len(engine.evaluate(snap))
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings = np.array(timings)
+    print(f"{args.rules} rules x {args.processes} processes, {args.ticks} ticks")
+    print(f"  p50 {np.percentile(timings, 50):.2f} ms  p95 {np.percentile(timings, 95):.2f} ms  "
+          f"max {timings.max():.2f} ms  alerts fired {fired}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from core.booster_policy import DEFAULT_POLICY, compile_policy, load_policy
+from core.process_window import ProcessWindowStats
+
+NAMES = [f"worker{i}" for i in range(200)] + ["chrome", "firefox", "msedge", "code", "python", "java", "node"]
+USERS = ["root", "alice", "bob", "www-data"]
+MODES = ("fast", "deep", "extreme", "contain")
+
+
+def make_table(count, rng):
+    # A process tree: every process hangs off one of the first few hundred
+    table = []
+    for pid in range(1, count + 1):
+        table.append({
+            'pid': pid,
+            'ppid': rng.randint(1, min(pid - 1, 300)) if pid > 1 else 0,
+            'name': NAMES[pid % len(NAMES)],
+            'username': USERS[pid % len(USERS)],
+            'cpu_percent': rng.random() * 100 if pid % 40 == 0 else rng.random() * 5,
+            'rss': (rng.randint(200, 3000) if pid % 25 == 0 else rng.randint(1, 150)) * 1024 ** 2
+        })
+    return table
+
+
+def make_snapshot(table, tick, interval, rng):
+    processes = []
+    for base in table:
+        jitter = 0.9 + rng.random() * 0.2
+        processes.append(dict(base, cpu_percent=base['cpu_percent'] * jitter, rss=int(base['rss'] * jitter)))
+    return {'time': 1_000_000.0 + tick * interval, 'processes': processes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Booster policy evaluation on one collector snapshot")
+    parser.add_argument('--processes', type=int, default=5000)
+    parser.add_argument('--ticks', type=int, default=50)
+    parser.add_argument('--interval', type=float, default=2.0, help="collector interval the window sees")
+    parser.add_argument('--policy', metavar='PATH', help="policy JSON to time instead of the default")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    policy = load_policy(args.policy) if args.policy else compile_policy(DEFAULT_POLICY)
+    window = ProcessWindowStats(interval=args.interval)
+    policy.window = window
+    table = make_table(args.processes, rng)
+    snapshots = [make_snapshot(table, t, args.interval, rng) for t in range(args.ticks)]
+
+    # Warm the sliding window first, as the collector would have
+    for snap in snapshots:
+        window.add_sample(snap['time'], snap['processes'])
+        policy.observe(snap)
+
+    print(f"{len(policy.rules)} rules x {args.processes} processes, {args.ticks} ticks")
+    if any(rule.match.has_sustained for rule in policy.rules):
+        observe = []
+        for snap in snapshots:
+            start = time.perf_counter()
+            policy.observe(snap)
+            observe.append((time.perf_counter() - start) * 1000)
+        observe = np.array(observe)
+        print(f"  observe        p50 {np.percentile(observe, 50):7.2f} ms  p95 {np.percentile(observe, 95):7.2f} ms")
+
+    for mode in MODES:
+        timings = []
+        actions = 0
+        for snap in snapshots:
+            start = time.perf_counter()
+            actions = len(policy.evaluate(snap, mode))
+            timings.append((time.perf_counter() - start) * 1000)
+        timings = np.array(timings)
+        print(f"  {mode:<14} p50 {np.percentile(timings, 50):7.2f} ms  p95 {np.percentile(timings, 95):7.2f} ms  "
+              f"max {timings.max():7.2f} ms  {actions} actions")
+
+
+if __name__ == "__main__":
+    main()
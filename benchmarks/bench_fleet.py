@@ -0,0 +1,111 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.fleet import FleetAgent, FleetAggregator, host_id
+
+# Starts an aggregator and N agents on 127.0.0.1, feeds each agent synthetic
+# snapshots, and checks that every host shows up with its full process table.
+# A second agent reusing a live agent's name is expected to be rejected.
+
+
+class FakeCollector:
+    def __init__(self, processes, seed):
+        self.rng = random.Random(seed)
+        self.processes = processes
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def tick(self):
+        snapshot = {
+            'time': time.time(),
+            'cpu_percent': self.rng.random() * 100,
+            'memory': {'percent': 50.0, 'total': 16 * 1024 ** 3, 'used': 8 * 1024 ** 3},
+            'processes': [{'pid': pid, 'name': f"proc{pid}", 'cpu_percent': self.rng.random() * 10,
+                           'rss': self.rng.randint(1, 500) * 1024 ** 2}
+                          for pid in range(1, self.processes + 1)]
+        }
+        for callback in list(self.subscribers):
+            callback(snapshot)
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an aggregator and several agents on localhost")
+    parser.add_argument('--agents', type=int, default=5)
+    parser.add_argument('--processes', type=int, default=300, help="synthetic processes per agent")
+    parser.add_argument('--seconds', type=float, default=3.0, help="how long the agents stream")
+    parser.add_argument('--timeout', type=float, default=15.0)
+    args = parser.parse_args()
+
+    aggregator = FleetAggregator(host='127.0.0.1', port=0, max_frames_per_sec=20.0, burst=20)
+    aggregator.start()
+    collectors = [FakeCollector(args.processes, seed=i) for i in range(args.agents)]
+    agents = [FleetAgent(c, '127.0.0.1', aggregator.port, hostname=f"agent-{i}", reconnect_delay=0.2)
+              for i, c in enumerate(collectors)]
+    duplicate = FleetAgent(FakeCollector(args.processes, seed=99), '127.0.0.1', aggregator.port,
+                           hostname='agent-0', reconnect_delay=0.2)
+    failures = []
+    try:
+        for agent in agents:
+            agent.start()
+        if not wait_for(lambda: all(a.connected for a in agents), args.timeout):
+            failures.append("not every agent connected")
+        duplicate.start()
+
+        started = time.monotonic()
+        while time.monotonic() - started < args.seconds:
+            for collector in collectors + [duplicate.collector]:
+                collector.tick()
+            time.sleep(0.1)
+
+        expected = {host_id(f"agent-{i}", '127.0.0.1') for i in range(args.agents)}
+
+        def complete():
+            hosts = {h['id']: h for h in aggregator.get_hosts()}
+            return set(hosts) == expected and all(
+                hosts[h]['connected'] and hosts[h]['processes'] == args.processes for h in expected)
+        if not wait_for(complete, args.timeout):
+            failures.append("hosts missing or incomplete")
+
+        hosts = aggregator.get_hosts()
+        for h in hosts:
+            print(f"  {h['id']:<24} {'online' if h['connected'] else 'offline':<8} "
+                  f"{h['processes']:>6} processes  {h['frames']:>4} frames  {h['bytes'] / 1024:8.1f} KB")
+        if len(hosts) != args.agents:
+            failures.append(f"expected {args.agents} hosts, got {len(hosts)}")
+        if not aggregator.rejected:
+            failures.append("duplicate agent-0 was not rejected")
+    finally:
+        duplicate.stop()
+        for agent in agents:
+            agent.stop()
+        aggregator.stop()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"OK: {args.agents} agents on 127.0.0.1 all reported {args.processes} processes")
+
+
+if __name__ == "__main__":
+    main()
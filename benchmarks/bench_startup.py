@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# Modules that must not be loaded before the first window paint
+DEFERRED = ('numpy', 'matplotlib', 'gui.monitor_panel', 'gui.performance_panel')
+
+
+def import_child():
+    # Everything startup does short of opening a window: the main window and
+    # task panel modules, the collector's first tick and the alert engine
+    # evaluating it. Needs no display.
+    import gui.main_window
+    import gui.task_panel
+    from core.collector import get_collector
+    from core.alert_rules import get_alert_engine
+    from core.memory_diagnostics import get_memory_diagnostics
+
+    get_memory_diagnostics()
+    get_alert_engine().evaluate(get_collector().collect_once())
+    print(json.dumps([m for m in DEFERRED if m in sys.modules]))
+
+
+def check_imports():
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--import-child'],
+                          capture_output=True, text=True, cwd=ROOT, timeout=60)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"exit {proc.returncode}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def child(started):
+    # Runs in a fresh interpreter so import costs are counted every time
+    import tkinter as tk
+    from gui.main_window import CoreSenseApp
+
+    root = tk.Tk()
+    app = CoreSenseApp(root)
+    result = {}
+
+    def painted(event):
+        if not result:
+            result['first_paint'] = time.time() - started
+            result['loaded'] = [m for m in DEFERRED if m in sys.modules]
+            root.after(0, shutdown)
+
+    def shutdown():
+        app.collector.stop()
+        root.destroy()
+
+    root.bind('<Expose>', painted)
+    root.mainloop()
+    print(json.dumps(result))
+
+
+def run_once():
+    started = time.time()
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', repr(started)],
+                          capture_output=True, text=True, cwd=ROOT, timeout=60)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time from launch to the first paint of the main window")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float, help="fail if the median first paint is slower than this")
+    parser.add_argument('--baseline', help="JSON file from a previous --save run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown over the baseline (0.2 = 20%%)")
+    parser.add_argument('--save', help="write the result as JSON to this file")
+    parser.add_argument('--imports-only', action='store_true',
+                        help="only check that startup leaves the deferred modules unloaded (no display needed)")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--import-child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(float(args.child))
+        return
+    if args.import_child:
+        import_child()
+        return
+
+    loaded = check_imports()
+    if loaded:
+        print(f"FAIL: startup imports {', '.join(loaded)}")
+        sys.exit(1)
+    print(f"startup imports: none of {', '.join(DEFERRED)} loaded")
+    if args.imports_only:
+        return
+
+    try:
+        results = [run_once() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"Startup benchmark could not open a window: {e}")
+        print("Run it with a display, e.g. under xvfb-run.")
+        sys.exit(2)
+
+    times = sorted(r['first_paint'] for r in results)
+    median = statistics.median(times)
+    loaded = sorted({m for r in results for m in r['loaded']})
+    print(f"first paint over {args.runs} runs: median {median * 1000:.0f} ms  "
+          f"min {times[0] * 1000:.0f} ms  max {times[-1] * 1000:.0f} ms")
+
+    failed = False
+    if loaded:
+        print(f"  FAIL: loaded before first paint: {', '.join(loaded)}")
+        failed = True
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"  FAIL: median {median:.3f}s exceeds --max-seconds {args.max_seconds:.3f}s")
+        failed = True
+    if args.baseline:
+        with open(args.baseline) as f:
+            base = json.load(f)['median_seconds']
+        change = median / base - 1
+        print(f"  baseline {base * 1000:.0f} ms, change {change:+.1%}")
+        if change > args.tolerance:
+            print(f"  FAIL: slower than baseline by more than {args.tolerance:.0%}")
+            failed = True
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'median_seconds': median, 'runs': times}, f, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import psutil
+
+from core.collector import MetricsCollector
+from core.system_monitor import SystemMonitor
+
+NAMES = [f"worker{i}" for i in range(200)] + ["chrome", "firefox", "python", "java", "node", "postgres"]
+MemInfo = namedtuple('MemInfo', 'rss vms')
+
+
+class FakeProcess:
+    # Just enough of psutil.Process for the collectors under test
+    def __init__(self, row, attrs=None):
+        self.pid = row['pid']
+        self._row = row
+        if attrs is not None:
+            self.info = {a: self._value(a) for a in attrs}
+
+    def _value(self, attr):
+        if attr == 'memory_info':
+            return MemInfo(self._row['rss'], self._row['rss'] * 2)
+        return self._row.get(attr)
+
+    def name(self):
+        return self._row['name']
+
+    def cpu_percent(self, interval=None):
+        return self._row['cpu_percent']
+
+    def memory_info(self):
+        return self._value('memory_info')
+
+    def as_dict(self, attrs):
+        return {a: self._value(a) for a in attrs}
+
+
+def make_table(count, rng):
+    return [{
+        'pid': pid,
+        'ppid': 1,
+        'name': NAMES[pid % len(NAMES)],
+        'username': 'user',
+        'cpu_percent': rng.random() * 100 if pid % 50 == 0 else rng.random() * 5,
+        'memory_percent': rng.random() * 10,
+        'rss': rng.randint(1, 3000) * 1024 ** 2
+    } for pid in range(1, count + 1)]
+
+
+def fake_psutil(table):
+    by_pid = {row['pid']: row for row in table}
+
+    def process_iter(attrs=None, ad_value=None):
+        for row in table:
+            yield FakeProcess(row, attrs)
+
+    def process(pid):
+        if pid not in by_pid:
+            raise psutil.NoSuchProcess(pid)
+        return FakeProcess(by_pid[pid])
+
+    return mock.patch.multiple(psutil, process_iter=process_iter, Process=process)
+
+
+def read_syscalls():
+    # Read/write syscalls issued by this process so far (Linux only)
+    try:
+        with open('/proc/self/io') as f:
+            io = dict(line.split(': ') for line in f.read().splitlines())
+        return int(io['syscr']), int(io['syscw'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def collectors():
+    sm = SystemMonitor()
+    collector = MetricsCollector()
+    return {
+        'get_top_processes': lambda: sm.get_top_processes(limit=50),
+        'search_processes': lambda: sm.search_processes('worker1'),
+        'get_heavy_processes': lambda: sm.get_heavy_processes(),
+        'collect_processes': collector._collect_processes
+    }
+
+
+def syscall_overhead():
+    # What reading /proc/self/io itself costs, measured back to back
+    first = read_syscalls()
+    second = read_syscalls()
+    if not first or not second:
+        return (0, 0)
+    return (second[0] - first[0], second[1] - first[1])
+
+
+def run(fn, ticks, alloc_ticks):
+    fn()
+    overhead = syscall_overhead()
+    timings = []
+    syscalls = []
+    for _ in range(ticks):
+        # /proc/self/io is read outside the timed region
+        before = read_syscalls()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+        after = read_syscalls()
+        if before and after:
+            syscalls.append((after[0] - before[0] - overhead[0], after[1] - before[1] - overhead[1]))
+
+    # Allocation tracking slows every call, so it gets its own ticks
+    peaks, blocks = [], []
+    tracemalloc.start()
+    for _ in range(alloc_ticks):
+        tracemalloc.reset_peak()
+        base = tracemalloc.take_snapshot()
+        current, _ = tracemalloc.get_traced_memory()
+        fn()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        diff = tracemalloc.take_snapshot().compare_to(base, 'filename')
+        blocks.append(sum(max(d.count_diff, 0) for d in diff))
+    tracemalloc.stop()
+
+    timings.sort()
+    result = {
+        'p50_ms': statistics.median(timings),
+        'p95_ms': timings[min(int(len(timings) * 0.95), len(timings) - 1)],
+        'p99_ms': timings[min(int(len(timings) * 0.99), len(timings) - 1)],
+        'max_ms': timings[-1],
+        'mean_ms': statistics.fmean(timings),
+        'alloc_peak_kb': statistics.median(peaks) / 1024 if peaks else None,
+        'alloc_blocks_retained': statistics.median(blocks) if blocks else None
+    }
+    if syscalls:
+        result['syscr'] = statistics.median(s[0] for s in syscalls)
+        result['syscw'] = statistics.median(s[1] for s in syscalls)
+    return result
+
+
+def compare(results, baseline, threshold, metric):
+    regressions = []
+    for table, funcs in results.items():
+        for name, current in funcs.items():
+            old = baseline.get(table, {}).get(name)
+            if not old or not old.get(metric):
+                continue
+            change = current[metric] / old[metric] - 1
+            flag = "  REGRESSION" if change > threshold else ""
+            print(f"  {table:>12} {name:<22} {old[metric]:9.2f} -> {current[metric]:9.2f} ms  {change:+7.1%}{flag}")
+            if flag:
+                regressions.append((table, name, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SystemMonitor and collector process scans")
+    parser.add_argument('--sizes', default='100,1000,5000,20000', help="fake process table sizes")
+    parser.add_argument('--live', action='store_true', help="also run against the live process table")
+    parser.add_argument('--live-only', action='store_true', help="only run against the live process table")
+    parser.add_argument('--ticks', type=int, default=30)
+    parser.add_argument('--alloc-ticks', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="JSON results from an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.15, help="slowdown that counts as a regression (0.15 = 15%%)")
+    parser.add_argument('--metric', default='p50_ms', choices=('p50_ms', 'p95_ms', 'mean_ms'))
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = {}
+    tables = [] if args.live_only else [int(s) for s in args.sizes.split(',') if s]
+    for size in tables:
+        table = make_table(size, rng)
+        with fake_psutil(table):
+            funcs = collectors()
+            results[f"fake-{size}"] = {name: run(fn, args.ticks, args.alloc_ticks) for name, fn in funcs.items()}
+    if args.live or args.live_only:
+        results['live'] = {name: run(fn, args.ticks, args.alloc_ticks) for name, fn in collectors().items()}
+
+    for table, funcs in results.items():
+        print(f"{table}:")
+        for name, r in funcs.items():
+            allocs = (f"  alloc peak {r['alloc_peak_kb']:9.1f} KB  retained {r['alloc_blocks_retained']:.0f} blocks"
+                      if r['alloc_peak_kb'] is not None else "")
+            sys_calls = f"  syscalls r{r['syscr']:.0f}/w{r['syscw']:.0f}" if 'syscr' in r else ""
+            print(f"  {name:<22} p50 {r['p50_ms']:8.2f}  p95 {r['p95_ms']:8.2f}  p99 {r['p99_ms']:8.2f} ms"
+                  f"{allocs}{sys_calls}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'meta': {'python': platform.python_version(), 'psutil': psutil.__version__,
+                                'platform': platform.platform(), 'ticks': args.ticks, 'time': time.time()},
+                       'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        print(f"\ncompared with {args.compare} ({args.metric}, threshold {args.threshold:.0%}):")
+        regressions = compare(results, baseline, args.threshold, args.metric)
+        if regressions:
+            print(f"{len(regressions)} regression(s)")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
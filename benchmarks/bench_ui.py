@@ -0,0 +1,261 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.collector import get_collector
+
+# Drives the real panels on a live Tk event loop with synthetic data. Needs a
+# display; on a headless machine run it under Xvfb:
+#   xvfb-run -a python benchmarks/bench_ui.py
+
+
+class LoopProbe:
+    # Schedules itself every interval_ms; how late each callback runs is the
+    # time the event loop was blocked by whatever ran before it
+    def __init__(self, root, interval_ms=10):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.label = 'idle'
+        self.samples = []
+        self.running = False
+
+    def start(self):
+        self.running = True
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        self.running = False
+
+    def _tick(self):
+        if not self.running:
+            return
+        now = time.perf_counter()
+        self.samples.append((self.label, max((now - self._expected) * 1000, 0.0)))
+        self._expected = now + self.interval_ms / 1000
+        self.root.after(self.interval_ms, self._tick)
+
+
+def make_tasks(count, rng):
+    tasks = []
+    for i in range(1, count + 1):
+        subtasks = [{'id': j, 'description': f"Step {j} of task {i}", 'progress': rng.choice((0, 50, 100)),
+                     'completed': rng.random() < 0.3} for j in range(1, rng.randint(0, 5) + 1)]
+        tasks.append({
+            'id': i,
+            'description': f"Synthetic task {i} " + "x" * rng.randint(0, 60),
+            'priority': rng.choice(('Low', 'Medium', 'High', 'Critical')),
+            'category': rng.choice(('Work', 'Personal', 'Study')),
+            'deadline': f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'status': 'Pending',
+            'progress': rng.randint(0, 100),
+            'tags': [],
+            'notes': '',
+            'subtasks': subtasks,
+            'created_at': '2026-01-01 00:00',
+            'updated_at': '2026-01-01 00:00'
+        })
+    return tasks
+
+
+def make_processes(count, rng):
+    return [{'pid': pid, 'name': f"proc{pid}", 'cpu_percent': rng.random() * 100, 'memory_percent': rng.random() * 10,
+             'rss': rng.randint(1, 2000) * 1024 ** 2, 'major_faults_per_sec': rng.random() * 5}
+            for pid in range(1, count + 1)]
+
+
+def fill_collector(collector, processes, rng, seconds=600):
+    # Ten minutes of history so every graph has a full window to draw
+    now = time.time()
+    collector.history.clear()
+    for i in range(int(seconds / collector.interval)):
+        collector.history.append({
+            'time': now - seconds + i * collector.interval,
+            'cpu_percent': rng.random() * 100, 'mem_percent': 40 + rng.random() * 20,
+            'swap_percent': rng.random() * 5, 'load1': rng.random() * 4,
+            'psi_cpu': rng.random() * 20, 'psi_memory': rng.random() * 5, 'psi_io': rng.random() * 10,
+            'ctx_per_sec': rng.random() * 20000, 'irq_per_sec': rng.random() * 10000,
+            'swap_in_per_sec': rng.random() * 1024 ** 2, 'swap_out_per_sec': rng.random() * 1024 ** 2,
+            'major_faults_per_sec': rng.random() * 50
+        })
+    psi = {r: {'some': {'avg10': rng.random() * 20, 'avg60': 1.0, 'avg300': 1.0, 'total': 0}} for r in ('cpu', 'memory', 'io')}
+    collector.latest = {
+        'time': now, 'psi': psi, 'load': [1.0, 0.8, 0.5], 'cgroup': None, 'processes': processes,
+        'rates': {'ctx_switches_per_sec': 12000.0, 'interrupts_per_sec': 6000.0,
+                  'swap_in_bytes_per_sec': 0.0, 'swap_out_bytes_per_sec': 0.0,
+                  'major_faults_per_sec': 3.0, 'minor_faults_per_sec': 900.0}
+    }
+
+
+def task_steps(container, args, rng):
+    from gui.task_panel import TaskPanel
+    frame = tk.Frame(container)
+    frame.pack(fill='both', expand=True)
+    panel = TaskPanel(frame)
+    panel.task_manager.tasks = make_tasks(args.tasks, rng)
+    steps = [('tasks.refresh_task_list', panel.refresh_task_list)] * args.frames
+    return steps, frame.destroy
+
+
+def monitor_steps(container, args, rng):
+    from gui.monitor_panel import MonitorPanel
+    frame = tk.Frame(container)
+    frame.pack(fill='both', expand=True)
+    panel = MonitorPanel(frame)
+    processes = make_processes(args.processes, rng)
+    collector = get_collector()
+    fill_collector(collector, processes, rng)
+    panel.monitor.get_top_processes = lambda limit=50, sort_by='memory_percent': processes[:limit]
+    for _ in range(60):
+        panel.cpu_data.append(rng.random() * 100)
+        panel.mem_data.append(40 + rng.random() * 20)
+
+    steps = [('monitor.update_process_list', panel._update_process_list),
+             ('monitor.update_pressure_label', lambda: panel._update_pressure_label(collector.latest))] * args.frames
+    return steps, frame.destroy, panel
+
+
+def graph_steps(root, panel, args):
+    before = set(root.winfo_children())
+    panel.show_cpu_graph()
+    panel.show_memory_graph()
+    panel.show_pressure_graph()
+    windows = [w for w in root.winfo_children() if w not in before and hasattr(w, 'ani')]
+
+    steps = []
+    for window in windows:
+        ani = window.ani
+        label = f"graph.{window.title().lower().replace(' ', '_').replace('&', 'and')}"
+
+        def redraw(ani=ani):
+            ani._func(0)
+            ani._fig.canvas.draw()
+        steps.extend([(label, redraw)] * args.frames)
+
+    def close():
+        for window in windows:
+            window.ani.event_source.stop()
+            window.destroy()
+    return steps, close
+
+
+def percentiles(values):
+    if not values:
+        return None
+    values = sorted(values)
+    pick = lambda q: values[min(int(len(values) * q), len(values) - 1)]
+    return {'p50': statistics.median(values), 'p95': pick(0.95), 'p99': pick(0.99), 'max': values[-1], 'count': len(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure main-thread stalls in the CoreSense panels")
+    parser.add_argument('--tasks', type=int, default=500, help="synthetic tasks in the task tree")
+    parser.add_argument('--processes', type=int, default=5000, help="synthetic process table size")
+    parser.add_argument('--frames', type=int, default=20, help="repetitions of each UI operation")
+    parser.add_argument('--gap-ms', type=int, default=50, help="idle time between operations")
+    parser.add_argument('--probe-ms', type=int, default=10, help="event-loop probe interval")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write the report as JSON to this file")
+    parser.add_argument('--max-stall-ms', type=float, help="exit non-zero if any stall is longer than this")
+    args = parser.parse_args()
+
+    if args.output:
+        args.output = os.path.abspath(args.output)
+    # TaskPanel loads and saves tasks.json in the working directory
+    os.chdir(tempfile.mkdtemp(prefix='coresense-bench-ui-'))
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"UI benchmark needs a display ({e}); run it under xvfb-run.")
+        sys.exit(2)
+    root.geometry("1400x900")
+    rng = random.Random(args.seed)
+    probe = LoopProbe(root, args.probe_ms)
+    frames = {}
+
+    task_queue, close_tasks = task_steps(root, args, rng)
+    queue = list(task_queue)
+    cleanups = [close_tasks]
+
+    def build_monitor():
+        close_tasks()
+        monitor_queue, close_monitor, panel = monitor_steps(root, args, rng)
+        graph_queue, close_graphs = graph_steps(root, panel, args)
+        queue.extend(monitor_queue + graph_queue)
+        cleanups.extend([close_graphs, close_monitor])
+    queue.append(('build.monitor_panel', build_monitor))
+
+    def run_next():
+        if not queue:
+            finish()
+            return
+        label, fn = queue.pop(0)
+        probe.label = label
+        start = time.perf_counter()
+        fn()
+
+        # Work the step pushed onto the loop with after(0) (e.g. the monitor's
+        # tree rebuild) runs before this marker, so it counts toward the frame
+        def done():
+            root.update_idletasks()
+            frames.setdefault(label, []).append((time.perf_counter() - start) * 1000)
+            probe.label = 'idle'
+            root.after(args.gap_ms, run_next)
+        root.after(0, done)
+
+    def finish():
+        probe.stop()
+        for cleanup in cleanups:
+            try:
+                cleanup()
+            except tk.TclError:
+                pass
+        root.quit()
+
+    probe.start()
+    root.after(200, run_next)
+    root.mainloop()
+
+    report = {'frames': {}, 'loop_latency': {}, 'worst_stalls': []}
+    for label, times in frames.items():
+        report['frames'][label] = percentiles(times)
+    by_label = {}
+    for label, lag in probe.samples:
+        by_label.setdefault(label, []).append(lag)
+    for label, lags in by_label.items():
+        report['loop_latency'][label] = percentiles(lags)
+    report['worst_stalls'] = [{'label': label, 'ms': lag}
+                              for label, lag in sorted(probe.samples, key=lambda s: s[1], reverse=True)[:10]]
+    report['config'] = vars(args)
+
+    print("Frame times (ms):")
+    for label, p in sorted(report['frames'].items()):
+        print(f"  {label:<34} p50 {p['p50']:8.1f}  p95 {p['p95']:8.1f}  max {p['max']:8.1f}")
+    print(f"Event-loop latency, {args.probe_ms} ms probe (ms):")
+    for label, p in sorted(report['loop_latency'].items()):
+        print(f"  {label:<34} p50 {p['p50']:8.1f}  p99 {p['p99']:8.1f}  max {p['max']:8.1f}")
+    print("Worst stalls:")
+    for stall in report['worst_stalls']:
+        print(f"  {stall['ms']:8.1f} ms  {stall['label']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    root.destroy()
+    worst = report['worst_stalls'][0]['ms'] if report['worst_stalls'] else 0.0
+    if args.max_stall_ms is not None and worst > args.max_stall_ms:
+        print(f"FAIL: worst stall {worst:.1f} ms exceeds --max-stall-ms {args.max_stall_ms:.1f}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
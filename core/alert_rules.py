@@ -0,0 +1,402 @@
+import fnmatch
+import operator
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from core.plugins import metric_name
+
+ALERT_RULES_PATH = os.path.join(os.path.dirname(__file__), '..', 'alert_rules.txt')
+
+OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+
+SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4, '%': 1}
+TIME_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+SYSTEM_METRICS = {
+    'cpu': lambda snap: snap.get('cpu_percent'),
+    'memory': lambda snap: snap.get('memory', {}).get('percent'),
+}
+
+
+def system_metric(name):
+    # Anything with a dot is '<plugin>.<metric>' from a collector plugin; it
+    # reads as None (rule skipped) until that plugin reports
+    if name in SYSTEM_METRICS:
+        return SYSTEM_METRICS[name]
+    plugin, dot, key = name.partition('.')
+    if not dot or not plugin or not key:
+        return None
+    return lambda snap: snap.get('plugins', {}).get(plugin, {}).get(key)
+
+
+def plugin_metric_name(name):
+    # Plugins report under metric_name() of their module and keys, so a rule
+    # written as 'My-Plugin.Temp C' has to match 'my_plugin.temp_c'
+    plugin, dot, key = name.partition('.')
+    if not dot or not plugin or not key:
+        return name
+    return f"{metric_name(plugin)}.{metric_name(key)}"
+
+
+PROCESS_METRICS = {
+    'cpu': 'cpu_percent',
+    'memory': 'memory_percent',
+    'rss': 'rss',
+}
+
+RULE_RE = re.compile(
+    r'^(?:process\s+(?P<pattern>\S+)\s+)?'
+    r'(?P<metric>[\w.:-]+)\s*(?P<op>>=|<=|>|<)\s*(?P<value>[\d.]+)\s*(?P<unit>[a-zA-Z%]*)'
+    r'(?:\s+for\s+(?P<for>[\d.]+)\s*(?P<for_unit>[smh]?))?'
+    r'(?:\s+clear\s+(?P<clear>[\d.]+)\s*(?P<clear_unit>[a-zA-Z%]*))?'
+    r'(?:\s+cooldown\s+(?P<cooldown>[\d.]+)\s*(?P<cooldown_unit>[smh]?))?\s*$'
+)
+
+
+def _numpy():
+    # Only process rules need numpy; the default rules are system-wide, so
+    # it stays out of startup
+    import numpy
+    return numpy
+
+
+def _size(value, unit, line_no):
+    unit = unit.upper() if unit != '%' else unit
+    if unit not in SIZE_UNITS:
+        raise ValueError(f"Line {line_no}: unknown unit '{unit}'")
+    return float(value) * SIZE_UNITS[unit]
+
+
+def _duration(value, unit):
+    if value is None:
+        return 0.0
+    return float(value) * TIME_UNITS[unit or '']
+
+
+def _format(metric, value):
+    if metric == 'rss':
+        return f"{value / 1024 ** 2:.0f}MB"
+    return f"{value:.1f}"
+
+
+class AlertRule:
+    def __init__(self, text, metric, op, threshold, pattern=None, duration=0.0,
+                 clear=None, cooldown=300.0, hysteresis=0.05):
+        self.text = text
+        self.metric = metric
+        self.op_symbol = op
+        self.op = OPERATORS[op]
+        self.threshold = threshold
+        self.pattern = pattern
+        self.duration = duration
+        self.cooldown = cooldown
+        if clear is None:
+            margin = abs(threshold) * hysteresis
+            clear = threshold - margin if op in ('>', '>=') else threshold + margin
+        self.clear = clear
+        self.clear_op = operator.gt if op in ('>', '>=') else operator.lt
+        self.read = system_metric(metric) if pattern is None else None
+
+    @property
+    def is_process_rule(self):
+        return self.pattern is not None
+
+
+def parse_rules(text, default_cooldown=300.0, hysteresis=0.05):
+    rules = []
+    for line_no, raw in enumerate(text.splitlines(), 1):
+        line = raw.split('#', 1)[0].strip()
+        if not line:
+            continue
+        m = RULE_RE.match(line)
+        if not m:
+            raise ValueError(f"Line {line_no}: cannot parse rule '{line}'")
+
+        metric = m.group('metric').lower()
+        pattern = m.group('pattern')
+        if pattern is None and metric not in SYSTEM_METRICS:
+            metric = plugin_metric_name(metric)
+        if pattern is not None and metric not in PROCESS_METRICS:
+            raise ValueError(f"Line {line_no}: unknown process metric '{metric}'")
+        if pattern is None and system_metric(metric) is None:
+            raise ValueError(f"Line {line_no}: unknown system metric '{metric}'")
+
+        clear = None
+        if m.group('clear') is not None:
+            clear = _size(m.group('clear'), m.group('clear_unit'), line_no)
+        cooldown = default_cooldown
+        if m.group('cooldown') is not None:
+            cooldown = _duration(m.group('cooldown'), m.group('cooldown_unit'))
+
+        rules.append(AlertRule(
+            text=line,
+            metric=metric,
+            op=m.group('op'),
+            threshold=_size(m.group('value'), m.group('unit'), line_no),
+            pattern=pattern,
+            duration=_duration(m.group('for'), m.group('for_unit')),
+            clear=clear,
+            cooldown=cooldown,
+            hysteresis=hysteresis
+        ))
+    return rules
+
+
+def load_rules(path=ALERT_RULES_PATH, **kwargs):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return parse_rules(f.read(), **kwargs)
+
+
+class _RuleState:
+    def __init__(self):
+        self.pending = {}
+        self.active = set()
+        self.last_fired = {}
+        self.prune_at = 1024
+        # Process rules keep their tracked targets as pid-sorted arrays so a
+        # tick only touches Python code for targets that actually fire.
+        # Created on the first evaluation.
+        self.pids = None
+        self.since = None
+        self.is_active = None
+
+
+class AlertEngine:
+    def __init__(self, rules=None, max_alerts=200):
+        self.alerts = deque(maxlen=max_alerts)
+        self.alert_count = 0
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._pattern_cache = {}
+        self.set_rules(rules or [])
+
+    def set_rules(self, rules):
+        with self._lock:
+            self.rules = list(rules)
+            self._states = [_RuleState() for _ in self.rules]
+            self._system_rules = [i for i, r in enumerate(self.rules) if not r.is_process_rule]
+            self._process_rules = [i for i, r in enumerate(self.rules) if r.is_process_rule]
+            self._pattern_cache = {}
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def on_snapshot(self, snapshot):
+        self.evaluate(snapshot)
+
+    def evaluate(self, snapshot):
+        now = snapshot.get('time', time.time())
+        fired = []
+        with self._lock:
+            for i in self._system_rules:
+                rule = self.rules[i]
+                value = rule.read(snapshot)
+                if value is None:
+                    continue
+                self._step(i, rule, now, 'system', value,
+                           rule.op(value, rule.threshold),
+                           rule.clear_op(value, rule.clear), fired)
+
+            if self._process_rules:
+                self._evaluate_processes(snapshot.get('processes', []), now, fired)
+
+            self.alerts.extend(fired)
+            self.alert_count += len(fired)
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            for alert in fired:
+                try:
+                    callback(alert)
+                except Exception as e:
+                    print(f"Alert subscriber error: {e}")
+        return fired
+
+    def _evaluate_processes(self, processes, now, fired):
+        np = _numpy()
+        count = len(processes)
+        columns = {
+            metric: np.fromiter((proc.get(field) or 0.0 for proc in processes), dtype=np.float64, count=count)
+            for metric, field in PROCESS_METRICS.items()
+        }
+        pids = np.fromiter((proc['pid'] for proc in processes), dtype=np.int64, count=count)
+        # Names and patterns are compared lower-cased, exact or glob alike
+        by_name = {}
+        for j, proc in enumerate(processes):
+            by_name.setdefault((proc.get('name') or "").lower(), []).append(j)
+        by_name = {name: np.array(idx, dtype=np.intp) for name, idx in by_name.items()}
+        everyone = np.arange(count)
+
+        for i in self._process_rules:
+            rule = self.rules[i]
+            state = self._states[i]
+            if state.pids is None:
+                state.pids = np.empty(0, dtype=np.int64)
+                state.since = np.empty(0)
+                state.is_active = np.empty(0, dtype=bool)
+            idx = self._match(rule.pattern, by_name, everyone)
+            values = columns[rule.metric][idx]
+            target_pids = pids[idx]
+
+            breach = rule.op(values, rule.threshold)
+            if not state.pids.size and not breach.any():
+                continue
+            found = np.zeros(idx.size, dtype=bool)
+            since = np.full(idx.size, now)
+            active = np.zeros(idx.size, dtype=bool)
+            if state.pids.size:
+                pos = np.searchsorted(state.pids, target_pids)
+                pos[pos >= state.pids.size] = 0
+                found = state.pids[pos] == target_pids
+                since = np.where(found, state.since[pos], now)
+                active = found & state.is_active[pos]
+
+            keep = np.where(active, rule.clear_op(values, rule.clear), breach)
+            firing = keep & ~active & (now - since >= rule.duration)
+            active = (active | firing)[keep]
+
+            order = np.argsort(target_pids[keep], kind='stable')
+            state.pids = target_pids[keep][order]
+            state.since = since[keep][order]
+            state.is_active = active[order]
+
+            for j in np.nonzero(firing)[0]:
+                pid = int(target_pids[j])
+                proc = processes[idx[j]]
+                self._fire(rule, state, now, pid, float(values[j]), fired,
+                           label=f"{proc.get('name')} (PID {pid})")
+
+    def _match(self, pattern, by_name, everyone):
+        np = _numpy()
+        if pattern == '*':
+            return everyone
+        pattern = pattern.lower()
+        if not any(c in pattern for c in '*?['):
+            return by_name.get(pattern, np.empty(0, dtype=np.intp))
+
+        cache = self._pattern_cache.setdefault(pattern, {})
+        parts = []
+        for name, idx in by_name.items():
+            hit = cache.get(name)
+            if hit is None:
+                hit = cache[name] = fnmatch.fnmatchcase(name, pattern)
+            if hit:
+                parts.append(idx)
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(parts)
+
+    def _step(self, index, rule, now, target, value, breach, holding, fired):
+        state = self._states[index]
+        if target in state.active:
+            if not holding:
+                state.active.discard(target)
+                state.pending.pop(target, None)
+            return
+        if not breach:
+            state.pending.pop(target, None)
+            return
+
+        since = state.pending.setdefault(target, now)
+        if now - since < rule.duration:
+            return
+
+        state.active.add(target)
+        state.pending.pop(target, None)
+        self._fire(rule, state, now, target, value, fired)
+
+    def _fire(self, rule, state, now, target, value, fired, label=None):
+        last = state.last_fired.get(target)
+        if last is not None and now - last < rule.cooldown:
+            return
+
+        if len(state.last_fired) > state.prune_at:
+            state.last_fired = {t: ts for t, ts in state.last_fired.items() if now - ts < rule.cooldown}
+            state.prune_at = max(1024, 2 * len(state.last_fired))
+        state.last_fired[target] = now
+
+        message = f"{rule.metric} {_format(rule.metric, value)} {rule.op_symbol} {_format(rule.metric, rule.threshold)}"
+        fired.append({
+            'time': datetime.fromtimestamp(now).isoformat(),
+            'rule': rule.text,
+            'target': label or target,
+            'value': round(value, 2),
+            'message': f"{label}: {message}" if label else message
+        })
+
+    def notify(self, message, target='coresense'):
+        # Alerts raised by CoreSense itself rather than a rule
+        alert = {
+            'time': datetime.now().isoformat(),
+            'rule': None,
+            'target': target,
+            'value': None,
+            'message': message
+        }
+        with self._lock:
+            self.alerts.append(alert)
+            self.alert_count += 1
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(alert)
+            except Exception as e:
+                print(f"Alert subscriber error: {e}")
+
+    def check_plugins(self, names):
+        # Called once plugins are discovered: a rule on a plugin that does
+        # not exist would otherwise just never fire
+        names = set(names)
+        with self._lock:
+            rules = [self.rules[i] for i in self._system_rules]
+        for rule in rules:
+            plugin, dot, _ = rule.metric.partition('.')
+            if dot and plugin not in names:
+                print(f"Alert rule '{rule.text}' uses plugin '{plugin}', which was not found")
+
+    def cache_size(self):
+        with self._lock:
+            return sum(len(cache) for cache in self._pattern_cache.values())
+
+    def clear_caches(self):
+        # Pattern matches are kept per process name ever seen
+        with self._lock:
+            self._pattern_cache = {}
+
+    def get_recent_alerts(self, limit=20):
+        with self._lock:
+            return list(self.alerts)[-limit:]
+
+
+_alert_engine = None
+_alert_engine_lock = threading.Lock()
+
+
+def get_alert_engine():
+    global _alert_engine
+    with _alert_engine_lock:
+        if _alert_engine is None:
+            from core.collector import get_collector
+            try:
+                rules = load_rules()
+            except ValueError as e:
+                print(f"Alert rules error: {e}")
+                rules = []
+            _alert_engine = AlertEngine(rules)
+            collector = get_collector()
+            collector.subscribe(_alert_engine.on_snapshot)
+            collector.plugins.on_discovered(_alert_engine.check_plugins)
+        return _alert_engine
@@ -0,0 +1,215 @@
+import heapq
+import json
+import os
+import threading
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from core.keyed_ring import SlotTable
+
+EVENTS_PATH = os.path.join(os.path.dirname(__file__), '..', 'anomaly_events.jsonl')
+
+SYSTEM_SERIES = [
+    ('cpu', 'CPU %', 1.0),
+    ('memory', 'Memory %', 0.5),
+]
+
+
+class AnomalyDetector:
+    # One EWMA mean/variance pair per series plus an hour-of-day seasonal
+    # baseline. All series live in flat arrays so a tick is a handful of
+    # vectorized operations regardless of how many series are tracked.
+
+    def __init__(self, alpha=0.05, seasonal_alpha=0.02, threshold=4.0, warmup=30,
+                 seasonal_warmup=20, top_n=10, stale_ticks=30, events_path=EVENTS_PATH,
+                 max_events_bytes=4 * 1024 * 1024, capacity=64):
+        self.alpha = alpha
+        self.seasonal_alpha = seasonal_alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.seasonal_warmup = seasonal_warmup
+        self.top_n = top_n
+        self.stale_ticks = stale_ticks
+        self.events_path = events_path
+        self.max_events_bytes = max_events_bytes
+
+        self.events = deque(maxlen=200)
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._tick = 0
+
+        self._labels = {}
+        self._table = SlotTable(capacity)
+        self._table.add_array('last_seen', fill=0, dtype=np.int64)
+        self._table.add_array('mean')
+        self._table.add_array('var')
+        self._table.add_array('count', fill=0, dtype=np.int64)
+        self._table.add_array('floor', fill=1.0)
+        self._table.add_array('active', fill=False, dtype=bool)
+        self._table.add_array('s_mean', (24,))
+        self._table.add_array('s_var', (24,))
+        self._table.add_array('s_count', (24,), fill=0, dtype=np.int64)
+
+        for key, label, floor in SYSTEM_SERIES:
+            self._slot_for(key, label, floor)
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def _slot_for(self, key, label, floor):
+        slot, new = self._table.slot(key)
+        if new:
+            self._labels[key] = label
+            self._table['floor'][slot] = floor
+        self._table['last_seen'][slot] = self._tick
+        return slot
+
+    def _release_stale(self):
+        last_seen = self._table['last_seen']
+        stale = [key for key, slot in self._table.slots.items()
+                 if key.startswith('proc:') and self._tick - last_seen[slot] > self.stale_ticks]
+        for key in stale:
+            self._table.release(key)
+            del self._labels[key]
+
+    def on_snapshot(self, snapshot):
+        values = {
+            'cpu': snapshot.get('cpu_percent', 0.0),
+            'memory': snapshot.get('memory', {}).get('percent', 0.0),
+        }
+        self.update(snapshot['time'], values, snapshot.get('processes', []))
+
+    def update(self, timestamp, system_values, processes=()):
+        with self._lock:
+            self._tick += 1
+            slots = []
+            values = []
+            for key, label, floor in SYSTEM_SERIES:
+                if key in system_values:
+                    slots.append(self._slot_for(key, label, floor))
+                    values.append(system_values[key])
+
+            top = set()
+            if processes:
+                top.update(p['pid'] for p in heapq.nlargest(self.top_n, processes, key=lambda p: p.get('cpu_percent', 0.0)))
+                top.update(p['pid'] for p in heapq.nlargest(self.top_n, processes, key=lambda p: p.get('rss', 0)))
+            for proc in processes:
+                if proc['pid'] not in top:
+                    continue
+                base = f"proc:{proc['pid']}:{proc.get('name') or ''}"
+                slots.append(self._slot_for(base + ':cpu', f"{proc.get('name')} ({proc['pid']}) CPU %", 1.0))
+                values.append(proc.get('cpu_percent', 0.0))
+                slots.append(self._slot_for(base + ':rss', f"{proc.get('name')} ({proc['pid']}) RSS MB", 5.0))
+                values.append(proc.get('rss', 0) / (1024 * 1024))
+
+            self._release_stale()
+            if not slots:
+                return []
+
+            t = self._table
+            idx = np.fromiter(slots, dtype=np.intp, count=len(slots))
+            x = np.fromiter(values, dtype=np.float64, count=len(values))
+            hour = datetime.fromtimestamp(timestamp).hour
+
+            mean = t['mean'][idx]
+            std = np.maximum(np.sqrt(t['var'][idx]), t['floor'][idx])
+            diff = x - mean
+            z = diff / std
+
+            s_mean = t['s_mean'][hour, idx]
+            s_std = np.maximum(np.sqrt(t['s_var'][hour, idx]), t['floor'][idx])
+            s_ready = t['s_count'][hour, idx] >= self.seasonal_warmup
+            s_z = np.where(s_ready, (x - s_mean) / s_std, z)
+
+            ready = t['count'][idx] >= self.warmup
+            anomalous = ready & (np.abs(z) > self.threshold) & (np.abs(s_z) > self.threshold)
+            onset = anomalous & ~t['active'][idx]
+            # A process that left the top-N this tick is no longer judged,
+            # so it must not stay flagged until its slot goes stale
+            t['active'][:] = False
+            t['active'][idx] = anomalous
+
+            a = np.where(t['count'][idx] == 0, 1.0, self.alpha)
+            t['mean'][idx] = mean + a * diff
+            t['var'][idx] = (1 - a) * (t['var'][idx] + a * diff * diff)
+            t['count'][idx] += 1
+
+            sa = np.where(t['s_count'][hour, idx] == 0, 1.0, self.seasonal_alpha)
+            s_diff = x - s_mean
+            t['s_mean'][hour, idx] = s_mean + sa * s_diff
+            t['s_var'][hour, idx] = (1 - sa) * (t['s_var'][hour, idx] + sa * s_diff * s_diff)
+            t['s_count'][hour, idx] += 1
+
+            new_events = []
+            for i in np.nonzero(onset)[0]:
+                key = t.keys[idx[i]]
+                label = self._labels[key]
+                new_events.append({
+                    'time': datetime.fromtimestamp(timestamp).isoformat(),
+                    'series': key,
+                    'label': label,
+                    'value': round(float(x[i]), 2),
+                    'expected': round(float(mean[i]), 2),
+                    'z': round(float(z[i]), 2),
+                    'direction': 'high' if z[i] > 0 else 'low'
+                })
+            self.events.extend(new_events)
+            subscribers = list(self._subscribers)
+
+        if new_events:
+            self._persist(new_events)
+            for callback in subscribers:
+                for event in new_events:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        print(f"Anomaly subscriber error: {e}")
+        return new_events
+
+    def _persist(self, events):
+        try:
+            # One previous generation is kept as .1
+            size = os.path.getsize(self.events_path) if os.path.exists(self.events_path) else 0
+            if self.max_events_bytes and size > self.max_events_bytes:
+                os.replace(self.events_path, self.events_path + '.1')
+            with open(self.events_path, 'a') as f:
+                for event in events:
+                    f.write(json.dumps(event) + "\n")
+        except Exception as e:
+            print(f"Anomaly persist error: {e}")
+
+    def is_anomalous(self, key):
+        with self._lock:
+            slot = self._table.slots.get(key)
+            return slot is not None and bool(self._table['active'][slot])
+
+    def get_anomalous_pids(self):
+        with self._lock:
+            pids = set()
+            active = self._table['active']
+            for key, slot in self._table.slots.items():
+                if key.startswith('proc:') and active[slot]:
+                    pids.add(int(key.split(':')[1]))
+            return pids
+
+    def get_recent_events(self, limit=20):
+        with self._lock:
+            return list(self.events)[-limit:]
+
+
+_anomaly_detector = None
+_anomaly_detector_lock = threading.Lock()
+
+
+def get_anomaly_detector():
+    global _anomaly_detector
+    with _anomaly_detector_lock:
+        if _anomaly_detector is None:
+            from core.collector import get_collector
+            _anomaly_detector = AnomalyDetector()
+            get_collector().subscribe(_anomaly_detector.on_snapshot)
+        return _anomaly_detector
@@ -0,0 +1,222 @@
+import json
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+
+HISTORY_LOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'boost_history.jsonl')
+LEGACY_HISTORY_PATH = os.path.join(os.path.dirname(__file__), '..', 'boost_history.json')
+
+# One fixed-size index record per entry: epoch time, byte offset and length
+# of the JSON line, and the boost mode, so paging and filtering by mode or
+# date never parse entries outside the requested page.
+INDEX_RECORD = struct.Struct('<dQI16s')
+# The index starts with a header naming the log file it describes (its inode)
+# and a generation bumped on every compaction. Compaction replaces the log
+# before the index, so a crash in between leaves an index whose header no
+# longer matches the log; _repair then rebuilds it from the log.
+INDEX_HEADER = struct.Struct('<8sQQ')
+INDEX_MAGIC = b'CSBHIDX1'
+
+
+def _entry_time(entry):
+    try:
+        return datetime.fromisoformat(entry['time']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return time.time()
+
+
+class BoostHistory:
+    def __init__(self, path=HISTORY_LOG_PATH, max_age_days=180, max_bytes=16 * 1024 * 1024):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + '.idx'
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._repair()
+
+    def _log_id(self):
+        return os.stat(self.path).st_ino
+
+    def _load_index(self):
+        # Returns (header, records); header is None if missing or unreadable
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None, []
+        if len(data) < INDEX_HEADER.size or data[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            return None, []
+        header = INDEX_HEADER.unpack_from(data)
+        data = data[INDEX_HEADER.size:]
+        usable = len(data) - len(data) % INDEX_RECORD.size
+        return header, list(INDEX_RECORD.iter_unpack(data[:usable]))
+
+    def _read_index(self):
+        return self._load_index()[1]
+
+    def _repair(self):
+        # The data line is written before its index record, so after a crash
+        # the index can only lag behind the log: drop index records past the
+        # end of the log and re-index any complete lines after the last one.
+        # An index written for a different log is discarded and rebuilt.
+        with self._lock:
+            open(self.path, 'ab').close()
+            size = os.path.getsize(self.path)
+            header, indexed = self._load_index()
+            if header is None or header[2] != self._log_id():
+                if header is not None:
+                    print("Boost history index does not match the log; rebuilding")
+                indexed = []
+            else:
+                self.generation = header[1]
+            records = [r for r in indexed if r[1] + r[2] <= size]
+            end = records[-1][1] + records[-1][2] if records else 0
+            if end < size:
+                with open(self.path, 'r+b') as f:
+                    f.seek(end)
+                    offset = end
+                    for line in f:
+                        if not line.endswith(b'\n'):
+                            # A torn final write; drop it so the next append
+                            # starts on a fresh line
+                            f.truncate(offset)
+                            break
+                        try:
+                            entry = json.loads(line)
+                            records.append(self._record(entry, offset, len(line)))
+                        except ValueError:
+                            pass
+                        offset += len(line)
+            if header is None or records != indexed:
+                self._write_index(records)
+
+    @staticmethod
+    def _record(entry, offset, length):
+        mode = str(entry.get('mode', '')).encode('utf-8')[:16]
+        return (_entry_time(entry), offset, length, mode)
+
+    def _write_index(self, records):
+        tmp = self.index_path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.generation, self._log_id()))
+            for record in records:
+                f.write(INDEX_RECORD.pack(*record))
+        os.replace(tmp, self.index_path)
+
+    def append(self, entry):
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+        with self._lock:
+            with open(self.path, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self.index_path, 'ab') as f:
+                f.write(INDEX_RECORD.pack(*self._record(entry, offset, len(line))))
+            if self._needs_compaction(offset + len(line)):
+                self._compact()
+
+    def _needs_compaction(self, size):
+        if self.max_bytes and size > self.max_bytes * 1.25:
+            return True
+        if self.max_age_days:
+            with open(self.index_path, 'rb') as f:
+                f.seek(INDEX_HEADER.size)
+                head = f.read(INDEX_RECORD.size)
+            if len(head) == INDEX_RECORD.size:
+                # Only rewrite once a day's worth of entries has expired
+                oldest = INDEX_RECORD.unpack(head)[0]
+                return oldest < time.time() - (self.max_age_days + 1) * 86400
+        return False
+
+    def _compact(self):
+        records = self._read_index()
+        if self.max_age_days:
+            cutoff = time.time() - self.max_age_days * 86400
+            records = [r for r in records if r[0] >= cutoff]
+        if self.max_bytes:
+            kept, total = [], 0
+            for record in reversed(records):
+                if total + record[2] > self.max_bytes:
+                    break
+                kept.append(record)
+                total += record[2]
+            records = kept[::-1]
+
+        tmp = self.path + '.tmp'
+        compacted = []
+        with open(self.path, 'rb') as src, open(tmp, 'wb') as dst:
+            for t, offset, length, mode in records:
+                src.seek(offset)
+                compacted.append((t, dst.tell(), length, mode))
+                dst.write(src.read(length))
+            dst.flush()
+            os.fsync(dst.fileno())
+        # Log first: the new index names the new log, so an interrupted
+        # compaction is caught by _repair instead of serving stale offsets
+        os.replace(tmp, self.path)
+        self.generation += 1
+        self._write_index(compacted)
+
+    def query(self, mode=None, since=None, until=None, offset=0, limit=50):
+        # Newest first. Returns (entries, number of matching entries).
+        with self._lock:
+            records = self._read_index()
+        mode_key = mode.encode('utf-8')[:16] if mode else None
+        matches = [r for r in reversed(records)
+                   if (mode_key is None or r[3].rstrip(b'\0') == mode_key)
+                   and (since is None or r[0] >= since)
+                   and (until is None or r[0] < until)]
+
+        entries = []
+        if matches[offset:offset + limit]:
+            with open(self.path, 'rb') as f:
+                for _, pos, length, _ in matches[offset:offset + limit]:
+                    f.seek(pos)
+                    try:
+                        entries.append(json.loads(f.read(length)))
+                    except ValueError:
+                        continue
+        return entries, len(matches)
+
+    def latest(self):
+        entries, _ = self.query(limit=1)
+        return entries[0] if entries else None
+
+    def migrate_legacy(self, legacy_path=LEGACY_HISTORY_PATH):
+        # boost_history.json kept the newest 30 entries, newest first
+        if not os.path.exists(legacy_path):
+            return 0
+        try:
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        existing = {(r[0], r[3]) for r in self._read_index()}
+        migrated = 0
+        for entry in sorted(legacy, key=_entry_time):
+            if (_entry_time(entry), str(entry.get('mode', '')).encode('utf-8')[:16].ljust(16, b'\0')) in existing:
+                continue
+            self.append(entry)
+            migrated += 1
+        os.replace(legacy_path, legacy_path + '.migrated')
+        return migrated
+
+
+_boost_history = None
+_boost_history_lock = threading.Lock()
+
+
+def get_boost_history():
+    global _boost_history
+    with _boost_history_lock:
+        if _boost_history is None:
+            _boost_history = BoostHistory()
+            try:
+                _boost_history.migrate_legacy()
+            except OSError as e:
+                print(f"Boost history migration error: {e}")
+        return _boost_history
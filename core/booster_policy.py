@@ -0,0 +1,371 @@
+import fnmatch
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+POLICY_PATH = os.path.join(os.path.dirname(__file__), '..', 'booster_policy.json')
+
+ACTIONS = ('renice', 'ionice', 'affinity', 'suspend', 'throttle', 'contain', 'terminate')
+
+# Policy file format (booster_policy.json):
+#   "protect": processes that are never touched (name globs and pids)
+#   "rules":   checked in order, the first rule that matches a process wins
+#       "modes":  booster modes the rule applies to (omit for all modes)
+#       "match":  every key must hold; "any" is a list of alternative matches
+#                 name / user (glob or list of globs), cmdline (regex),
+#                 subtree (glob of an ancestor process name),
+#                 cpu_above (%), rss_above_mb, sustained_seconds,
+#                 cpu_p90_above (% over the collector's sliding window),
+#                 rss_growth_above_mb_min (RSS slope over the same window)
+#       "action": renice | ionice | affinity | suspend | throttle | contain | terminate
+#                 throttle duty-cycles the process with SIGSTOP/SIGCONT to a CPU
+#                 share; contain combines affinity, ionice and throttle
+#       "args":   nice, ioclass, value, cpus, share (0-1)
+#   "governor": optional auto-boost settings (see core/governor.py), e.g.
+#       {"mode": "contain", "sustain_seconds": 10, "cooldown_seconds": 30,
+#        "max_actions_per_minute": 5, "contain": {"cpus": "2-3", "share": 0.5},
+#        "thresholds": {"cpu": [85, 70], "psi_memory": [10, 5]}}
+HEAVY = {'any': [{'cpu_p90_above': 35}, {'rss_above_mb': 200}]}
+
+DEFAULT_POLICY = {
+    'protect': {
+        'pids': [0, 4],
+        'names': ['system', 'system idle process', 'idle', 'registry', 'smss.exe',
+                  'coresense*', 'python*', 'pythonw*', 'py', 'main']
+    },
+    'rules': [
+        {'name': 'Runaway CPU', 'modes': ['fast'], 'match': {'cpu_p90_above': 85}, 'action': 'terminate'},
+        {'name': 'Heavy process', 'modes': ['fast'], 'match': HEAVY, 'action': 'renice', 'args': {'nice': 10}},
+        {'name': 'High CPU', 'modes': ['deep'], 'match': {'cpu_p90_above': 70}, 'action': 'terminate'},
+        {'name': 'Heavy process', 'modes': ['deep'], 'match': HEAVY, 'action': 'renice', 'args': {'nice': 10}},
+        {'name': 'Heavy browser/editor', 'modes': ['extreme'],
+         'match': dict(HEAVY, name=['chrome*', 'firefox*', 'msedge*', 'code*']), 'action': 'terminate'},
+        {'name': 'Heavy process', 'modes': ['extreme'], 'match': HEAVY, 'action': 'renice', 'args': {'nice': 10}},
+        {'name': 'Heavy process', 'modes': ['contain'], 'match': HEAVY, 'action': 'contain', 'args': {'ioclass': 'idle'}},
+    ]
+}
+
+
+def load_policy(path=POLICY_PATH):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return compile_policy(json.load(f))
+    return compile_policy(DEFAULT_POLICY)
+
+
+def _globs(value):
+    patterns = [value] if isinstance(value, str) else list(value)
+    return re.compile('|'.join(fnmatch.translate(p.lower()) for p in patterns))
+
+
+class _Match:
+    # Numeric thresholds are checked for the whole process table at once with
+    # numpy; string and tree predicates only run on the surviving candidates.
+
+    def __init__(self, spec, rule_name):
+        unknown = set(spec) - {'any', 'name', 'user', 'cmdline', 'subtree', 'cpu_above', 'rss_above_mb',
+                               'sustained_seconds', 'cpu_p90_above', 'rss_growth_above_mb_min'}
+        if unknown:
+            raise ValueError(f"Rule '{rule_name}': unknown match keys {sorted(unknown)}")
+
+        self.cpu_above = spec.get('cpu_above')
+        self.rss_above = spec['rss_above_mb'] * 1024 * 1024 if 'rss_above_mb' in spec else None
+        self.sustained = float(spec.get('sustained_seconds', 0))
+        self.cpu_p90_above = spec.get('cpu_p90_above')
+        self.rss_growth_above = spec.get('rss_growth_above_mb_min')
+        self.name = _globs(spec['name']) if 'name' in spec else None
+        self.user = _globs(spec['user']) if 'user' in spec else None
+        self.cmdline = re.compile(spec['cmdline'], re.IGNORECASE) if 'cmdline' in spec else None
+        self.subtree = _globs(spec['subtree']) if 'subtree' in spec else None
+        self.any = [_Match(sub, rule_name) for sub in spec.get('any', [])]
+        self.since = {}
+
+    def threshold_mask(self, table):
+        mask = np.ones(table.count, dtype=bool)
+        if self.cpu_above is not None:
+            mask &= table.cpu > self.cpu_above
+        if self.rss_above is not None:
+            mask &= table.rss > self.rss_above
+        if self.cpu_p90_above is not None:
+            mask &= table.cpu_p90 > self.cpu_p90_above
+        if self.rss_growth_above is not None:
+            mask &= table.rss_growth > self.rss_growth_above
+        if self.any:
+            any_mask = np.zeros(table.count, dtype=bool)
+            for sub in self.any:
+                any_mask |= sub.threshold_mask(table)
+            mask &= any_mask
+        return mask
+
+    def observe(self, table, now):
+        if self.sustained:
+            breaching = table.pids[self.threshold_mask(table)].tolist()
+            since = self.since
+            self.since = {pid: since.get(pid, now) for pid in breaching}
+        for sub in self.any:
+            sub.observe(table, now)
+
+    def mask(self, table, now):
+        mask = self.threshold_mask(table)
+        if self.name is not None:
+            mask &= table.field_mask(self.name, 'name')
+        if self.user is not None:
+            mask &= table.field_mask(self.user, 'username')
+        if self.sustained:
+            held = [pid for pid, t in self.since.items() if now - t >= self.sustained]
+            mask &= np.isin(table.pids, held)
+        if self.any and any(sub.sustained or sub.name or sub.user or sub.has_predicates for sub in self.any):
+            any_mask = np.zeros(table.count, dtype=bool)
+            for sub in self.any:
+                sub_mask = sub.mask(table, now)
+                if sub.has_predicates:
+                    sub_mask[sub_mask] = [sub.check(table, j) for j in np.nonzero(sub_mask)[0]]
+                any_mask |= sub_mask
+            mask &= any_mask
+        return mask
+
+    @property
+    def has_sustained(self):
+        return bool(self.sustained) or any(sub.has_sustained for sub in self.any)
+
+    @property
+    def has_predicates(self):
+        return self.cmdline is not None or self.subtree is not None
+
+    def check(self, table, j):
+        proc = table.processes[j]
+        if self.subtree and not table.in_subtree(self.subtree, proc['pid']):
+            return False
+        if self.cmdline and not self.cmdline.search(table.cmdline(proc['pid'])):
+            return False
+        return True
+
+
+class ProcessTable:
+    def __init__(self, processes, window=None):
+        self.processes = processes
+        self.window = window
+        self.count = len(processes)
+        self.pids = np.fromiter((p['pid'] for p in processes), dtype=np.int64, count=self.count)
+        self.cpu = np.fromiter((p.get('cpu_percent', 0.0) for p in processes), dtype=np.float64, count=self.count)
+        self.rss = np.fromiter((p.get('rss', 0) for p in processes), dtype=np.float64, count=self.count)
+        self._by_pid = None
+        self._cmdlines = {}
+        self._glob_cache = {}
+        self._codes = {}
+        self._window_stats = None
+
+    def _lookup_window(self):
+        if self._window_stats is None:
+            if self.window is not None:
+                p90, slope = self.window.lookup(self.pids)
+            else:
+                p90 = slope = np.full(self.count, np.nan)
+            # Processes the window has not seen long enough fall back to the
+            # snapshot's own reading and to "no growth".
+            self._window_stats = (np.where(np.isnan(p90), self.cpu, p90), np.nan_to_num(slope, nan=0.0))
+        return self._window_stats
+
+    @property
+    def cpu_p90(self):
+        return self._lookup_window()[0]
+
+    @property
+    def rss_growth(self):
+        return self._lookup_window()[1]
+
+    def field_mask(self, pattern, field):
+        # Globs are matched once per distinct name/user, then broadcast
+        if field not in self._codes:
+            index = {}
+            codes = np.fromiter((index.setdefault(p.get(field) or '', len(index)) for p in self.processes),
+                                dtype=np.intp, count=self.count)
+            self._codes[field] = (list(index), codes)
+        values, codes = self._codes[field]
+        hits = np.fromiter((self.name_matches(pattern, v) for v in values), dtype=bool, count=len(values))
+        return hits[codes]
+
+    def name_matches(self, pattern, name):
+        key = (pattern.pattern, name)
+        hit = self._glob_cache.get(key)
+        if hit is None:
+            hit = self._glob_cache[key] = pattern.match(name.lower()) is not None
+        return hit
+
+    def in_subtree(self, pattern, pid):
+        if self._by_pid is None:
+            self._by_pid = {p['pid']: p for p in self.processes}
+        seen = set()
+        proc = self._by_pid.get(self._by_pid[pid].get('ppid')) if pid in self._by_pid else None
+        while proc is not None and proc['pid'] not in seen:
+            if self.name_matches(pattern, proc.get('name') or ''):
+                return True
+            seen.add(proc['pid'])
+            proc = self._by_pid.get(proc.get('ppid'))
+        return False
+
+    def cmdline(self, pid):
+        if pid not in self._cmdlines:
+            try:
+                import psutil
+                self._cmdlines[pid] = ' '.join(psutil.Process(pid).cmdline())
+            except Exception:
+                self._cmdlines[pid] = ''
+        return self._cmdlines[pid]
+
+
+class PolicyRule:
+    def __init__(self, spec):
+        self.name = spec.get('name') or spec.get('action', 'rule')
+        self.action = spec.get('action')
+        if self.action not in ACTIONS:
+            raise ValueError(f"Rule '{self.name}': unknown action '{self.action}'")
+        self.args = dict(spec.get('args', {}))
+        self.modes = set(spec['modes']) if spec.get('modes') else None
+        self.match = _Match(spec.get('match', {}), self.name)
+
+    def applies_to(self, mode):
+        return self.modes is None or mode in self.modes
+
+
+class BoosterPolicy:
+    def __init__(self, rules, protect_names=(), protect_pids=()):
+        self.rules = rules
+        self.protect_names = _globs(list(protect_names)) if protect_names else None
+        self.protect_pids = set(protect_pids) | {os.getpid()}
+        self.window = None
+        self._observing = [rule for rule in rules if rule.match.has_sustained]
+        self._lock = threading.Lock()
+
+    def observe(self, snapshot):
+        if not self._observing:
+            return
+        table = ProcessTable(snapshot.get('processes', []))
+        now = snapshot.get('time', time.time())
+        with self._lock:
+            for rule in self._observing:
+                rule.match.observe(table, now)
+
+    def evaluate(self, snapshot, mode):
+        table = ProcessTable(snapshot.get('processes', []), self.window)
+        now = snapshot.get('time', time.time())
+        claimed = np.zeros(table.count, dtype=bool)
+        claimed |= np.isin(table.pids, list(self.protect_pids))
+        if self.protect_names is not None:
+            claimed |= table.field_mask(self.protect_names, 'name')
+
+        plan = []
+        with self._lock:
+            for rule in self.rules:
+                if not rule.applies_to(mode):
+                    continue
+                mask = rule.match.mask(table, now) & ~claimed
+                for j in np.nonzero(mask)[0]:
+                    if rule.match.has_predicates and not rule.match.check(table, j):
+                        continue
+                    claimed[j] = True
+                    proc = table.processes[j]
+                    plan.append({
+                        'pid': proc['pid'],
+                        'name': proc.get('name') or '',
+                        'rule': rule.name,
+                        'action': rule.action,
+                        'args': rule.args,
+                        'cpu': round(float(table.cpu[j]), 1),
+                        'rss_mb': round(float(table.rss[j]) / (1024 * 1024), 1)
+                    })
+        return plan
+
+
+def compile_policy(spec):
+    protect = spec.get('protect', {})
+    rules = [PolicyRule(rule) for rule in spec.get('rules', [])]
+    return BoosterPolicy(rules, protect.get('names', []), protect.get('pids', []))
+
+
+def estimate_freed(plan):
+    rss_mb = sum(a['rss_mb'] for a in plan if a['action'] == 'terminate')
+    cpu = sum(a['cpu'] for a in plan if a['action'] in ('terminate', 'suspend'))
+    cpu += sum(a['cpu'] * (1 - a['args'].get('share', 1.0)) for a in plan if a['action'] in ('throttle', 'contain'))
+    deprioritised = sum(a['cpu'] for a in plan if a['action'] in ('renice', 'ionice', 'affinity', 'contain'))
+    return {'rss_mb': round(rss_mb, 1), 'cpu': round(cpu, 1), 'cpu_deprioritised': round(deprioritised, 1)}
+
+
+def apply_plan(plan, sm, grace=3.0, throttle=None, defaults=None):
+    # Everything short of terminate goes through the ThrottleManager, which
+    # records the original settings so a single restore can undo the boost.
+    if throttle is None:
+        from core.throttle import get_throttle_manager
+        throttle = get_throttle_manager()
+    defaults = defaults or {}
+
+    results = []
+    terminate = [a for a in plan if a['action'] == 'terminate']
+    for a in plan:
+        if a['action'] == 'terminate':
+            continue
+        args = dict(defaults, **a['args'])
+        if a['action'] == 'renice':
+            ok = throttle.set_nice(a['pid'], args.get('nice', 10))
+        elif a['action'] == 'ionice':
+            ok = throttle.set_ionice(a['pid'], args.get('ioclass', 'idle'), args.get('value'))
+        elif a['action'] == 'affinity':
+            ok = throttle.set_affinity(a['pid'], args.get('cpus', [0]))
+        elif a['action'] == 'throttle':
+            ok = throttle.throttle(a['pid'], args.get('share', 0.25))
+        elif a['action'] == 'contain':
+            ok = throttle.contain(a['pid'], args.get('cpus'), args.get('ioclass', 'idle'), args.get('share'))
+        else:
+            ok = throttle.suspend(a['pid'])
+        results.append(dict(a, args=args, outcome='applied' if ok else 'failed'))
+
+    if terminate:
+        report = sm.kill_processes([a['pid'] for a in terminate], grace=grace)
+        for a in terminate:
+            results.append(dict(a, outcome=report.get(a['pid'], {}).get('outcome', 'failed')))
+    return results
+
+
+def describe_action(action):
+    args = action['args']
+    if action['action'] == 'renice':
+        return f"renice to {args.get('nice', 10)}"
+    if action['action'] == 'ionice':
+        return f"ionice {args.get('ioclass', 'idle')}"
+    if action['action'] == 'affinity':
+        return f"pin to CPUs {args.get('cpus', [0])}"
+    if action['action'] == 'throttle':
+        return f"throttle to {args.get('share', 0.25):.0%} CPU"
+    if action['action'] == 'contain':
+        parts = []
+        if args.get('cpus'):
+            parts.append(f"CPUs {args['cpus']}")
+        if args.get('ioclass'):
+            parts.append(f"ionice {args['ioclass']}")
+        if args.get('share'):
+            parts.append(f"{args['share']:.0%} CPU")
+        return f"contain ({', '.join(parts) or 'no limits'})"
+    return action['action']
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+
+def get_booster_policy(reload=False):
+    global _policy
+    with _policy_lock:
+        if _policy is None or reload:
+            from core.collector import get_collector
+            from core.process_window import get_process_window
+            collector = get_collector()
+            if _policy is not None:
+                collector.unsubscribe(_policy.observe)
+            _policy = load_policy()
+            _policy.window = get_process_window()
+            collector.subscribe(_policy.observe)
+        return _policy
@@ -0,0 +1,182 @@
+import os
+import threading
+import time
+
+
+def find_cgroup2_mount():
+    # Usually /sys/fs/cgroup, but /sys/fs/cgroup/unified on hybrid hosts
+    try:
+        with open('/proc/self/mountinfo') as f:
+            for line in f:
+                fields = line.split()
+                sep = fields.index('-')
+                if fields[sep + 1] == 'cgroup2':
+                    return fields[4]
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def process_cgroup(pid='self'):
+    try:
+        with open(f'/proc/{pid}/cgroup') as f:
+            for line in f:
+                if line.startswith('0::'):
+                    return line[3:].strip()
+    except OSError:
+        pass
+    return None
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_int(path):
+    text = _read(path)
+    if text is None:
+        return None
+    text = text.strip()
+    return None if text == 'max' else int(text)
+
+
+def _read_keyed(path):
+    text = _read(path)
+    if text is None:
+        return {}
+    values = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(' ')
+        try:
+            values[key] = int(value)
+        except ValueError:
+            continue
+    return values
+
+
+class CgroupMonitor:
+    # cgroup v2 accounting read straight from the hierarchy. Usage, limits
+    # and throttling for a group come from its own cpu.stat / memory.* files,
+    # which the kernel already aggregates over every process inside it.
+
+    def __init__(self, mount=None):
+        self.mount = mount or find_cgroup2_mount()
+        self.available = self.mount is not None and os.path.exists(os.path.join(self.mount, 'cgroup.procs'))
+        self.own_path = process_cgroup() if self.available else None
+        self._prev = {}
+        self._lock = threading.Lock()
+
+    def _dir(self, path):
+        return os.path.join(self.mount, path.lstrip('/'))
+
+    def _limits(self, path):
+        # The effective limit is the tightest one on the way to the root
+        limits = {'cpu': None, 'memory.max': None, 'memory.high': None}
+
+        def tighten(key, value):
+            if value is not None and (limits[key] is None or value < limits[key]):
+                limits[key] = value
+
+        current = path
+        while True:
+            d = self._dir(current)
+            cpu_max = (_read(os.path.join(d, 'cpu.max')) or '').split()
+            if len(cpu_max) == 2 and cpu_max[0] != 'max':
+                tighten('cpu', int(cpu_max[0]) / int(cpu_max[1]))
+            tighten('memory.max', _read_int(os.path.join(d, 'memory.max')))
+            tighten('memory.high', _read_int(os.path.join(d, 'memory.high')))
+            if current in ('/', ''):
+                break
+            current = os.path.dirname(current.rstrip('/')) or '/'
+        return limits['cpu'], limits['memory.max'], limits['memory.high']
+
+    def sample(self, path=None, now=None):
+        if not self.available:
+            return None
+        path = path or self.own_path or '/'
+        d = self._dir(path)
+        cpu = _read_keyed(os.path.join(d, 'cpu.stat'))
+        if not cpu:
+            return None
+        now = now or time.time()
+        cpu_quota, memory_max, memory_high = self._limits(path)
+        memory_current = _read_int(os.path.join(d, 'memory.current'))
+        events = _read_keyed(os.path.join(d, 'memory.events'))
+
+        result = {
+            'path': path,
+            'cpu_quota_cores': cpu_quota,
+            'memory_current': memory_current,
+            'memory_max': memory_max,
+            'memory_high': memory_high,
+            'memory_percent_of_max': memory_current / memory_max * 100 if memory_current and memory_max else None,
+            'nr_throttled': cpu.get('nr_throttled', 0),
+            'throttled_usec': cpu.get('throttled_usec', 0),
+            'oom_kills': events.get('oom_kill', 0)
+        }
+
+        with self._lock:
+            prev = self._prev.get(path)
+            self._prev[path] = (now, cpu)
+        if prev is not None and now > prev[0]:
+            dt = now - prev[0]
+            cores = max(cpu.get('usage_usec', 0) - prev[1].get('usage_usec', 0), 0) / dt / 1e6
+            periods = cpu.get('nr_periods', 0) - prev[1].get('nr_periods', 0)
+            throttled = cpu.get('nr_throttled', 0) - prev[1].get('nr_throttled', 0)
+            result['cpu_cores_used'] = cores
+            result['cpu_percent_of_quota'] = cores / cpu_quota * 100 if cpu_quota else None
+            result['throttled_percent'] = throttled / periods * 100 if periods > 0 else 0.0
+            result['throttled_usec_per_sec'] = (cpu.get('throttled_usec', 0) - prev[1].get('throttled_usec', 0)) / dt
+        return result
+
+    def list_groups(self, root='/', max_depth=3):
+        # Every cgroup under root (down to max_depth) with its member count
+        # and usage, busiest first. The default is the whole hierarchy; on
+        # systemd hosts CoreSense's own group is just its leaf scope.
+        if not self.available:
+            return []
+        root = root or '/'
+        now = time.time()
+        groups = []
+        stack = [(root, 0)]
+        seen = set()
+        while stack:
+            path, depth = stack.pop()
+            d = self._dir(path)
+            procs = _read(os.path.join(d, 'cgroup.procs'))
+            if procs is None:
+                continue
+            seen.add(path)
+            group = self.sample(path, now) or {'path': path}
+            group['processes'] = len(procs.split())
+            group['pids'] = [int(p) for p in procs.split()[:200]]
+            groups.append(group)
+            if depth < max_depth:
+                try:
+                    with os.scandir(d) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((os.path.join(path, entry.name), depth + 1))
+                except OSError:
+                    continue
+        with self._lock:
+            for stale in [p for p in self._prev if p not in seen and p != self.own_path]:
+                del self._prev[stale]
+        groups.sort(key=lambda g: (g.get('cpu_cores_used') or 0, g.get('memory_current') or 0), reverse=True)
+        return groups
+
+
+_cgroup_monitor = None
+_cgroup_monitor_lock = threading.Lock()
+
+
+def get_cgroup_monitor():
+    global _cgroup_monitor
+    with _cgroup_monitor_lock:
+        if _cgroup_monitor is None:
+            _cgroup_monitor = CgroupMonitor()
+        return _cgroup_monitor
@@ -0,0 +1,268 @@
+import heapq
+import os
+import threading
+import time
+from collections import deque
+
+import psutil
+
+from core.plugins import PluginManager
+from core.profiler import get_profiler
+from core.system_monitor import SystemMonitor
+
+
+class MetricsCollector:
+    def __init__(self, interval=2.0, history_size=1800):
+        self.interval = interval
+        self.disk_path = 'C:\\' if os.name == 'nt' else '/'
+        self.history = deque(maxlen=history_size)
+        self.latest = None
+        self.running = False
+        self.monitor = SystemMonitor()
+        self.profiler = get_profiler()
+        self.plugins = PluginManager()
+        self._prev_counters = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.plugins.start()
+
+    def stop(self):
+        self.running = False
+        self._stop_event.set()
+        self.plugins.stop()
+
+    def _run(self):
+        # Prime psutil's cpu_percent counters so the first real tick is meaningful
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        while True:
+            # The next tick is scheduled one interval after this wait starts;
+            # only a whole interval of lateness past that is a lost sample
+            scheduled = time.perf_counter() + self.interval
+            if self._stop_event.wait(self.interval):
+                break
+            missed = int((time.perf_counter() - scheduled) / self.interval)
+            if missed > 0:
+                self.profiler.count('collector.dropped_samples', missed)
+            try:
+                with self.profiler.timer('collector.tick'):
+                    self.collect_once()
+            except Exception as e:
+                print(f"Collector error: {e}")
+
+    def _step(self, name, fn, *args):
+        with self.profiler.timer(f'collector.{name}'):
+            return fn(*args)
+
+    def collect_once(self):
+        snapshot = {
+            'time': time.time(),
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'cpu_per_core': psutil.cpu_percent(interval=None, percpu=True),
+            'memory': self._step('memory', self._collect_memory),
+            'swap': self._step('swap', self._collect_swap),
+            'load': self.monitor.get_load_average(),
+            'disk': self._step('disk', self._collect_disk),
+            'net': self._step('net', self._collect_net),
+            'psi': self._step('psi', self.monitor.get_pressure),
+            'cgroup': self._step('cgroup', self.monitor.get_cgroup_usage),
+            'processes': self._step('processes', self._collect_processes),
+            'plugins': self.plugins.values()
+        }
+        snapshot['rates'] = self._step('rates', self._collect_rates, snapshot)
+
+        with self._lock:
+            self.latest = snapshot
+            self.history.append(self._system_sample(snapshot))
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            try:
+                with self.profiler.timer(f"subscriber.{getattr(callback, '__qualname__', 'callback')}"):
+                    callback(snapshot)
+            except Exception as e:
+                print(f"Collector subscriber error: {e}")
+
+        return snapshot
+
+    def _collect_memory(self):
+        try:
+            mem = psutil.virtual_memory()
+            return {
+                'total': mem.total,
+                'available': mem.available,
+                'used': mem.used,
+                'percent': mem.percent,
+                **{k: v for k, v in SystemMonitor._memory_breakdown(mem).items() if not k.endswith('_gb')}
+            }
+        except Exception:
+            return {'total': 0, 'available': 0, 'used': 0, 'percent': 0.0}
+
+    def _collect_swap(self):
+        try:
+            swap = psutil.swap_memory()
+            return {'total': swap.total, 'used': swap.used, 'percent': swap.percent}
+        except Exception:
+            return {'total': 0, 'used': 0, 'percent': 0.0}
+
+    def _collect_disk(self):
+        try:
+            usage = psutil.disk_usage(self.disk_path)
+            disk = {'path': self.disk_path, 'total': usage.total, 'used': usage.used,
+                    'free': usage.free, 'percent': usage.percent}
+        except Exception:
+            disk = {'path': self.disk_path, 'total': 0, 'used': 0, 'free': 0, 'percent': 0.0}
+        try:
+            io = psutil.disk_io_counters()
+            if io:
+                disk['read_bytes'] = io.read_bytes
+                disk['write_bytes'] = io.write_bytes
+        except Exception:
+            pass
+        return disk
+
+    def _collect_net(self):
+        try:
+            net = psutil.net_io_counters()
+            return {
+                'bytes_sent': net.bytes_sent,
+                'bytes_recv': net.bytes_recv,
+                'packets_sent': net.packets_sent,
+                'packets_recv': net.packets_recv
+            }
+        except Exception:
+            return {}
+
+    def _collect_rates(self, snapshot):
+        # Per-second rates from the change in cumulative counters since the
+        # previous tick, so nothing here has to sleep. The PSI stall total
+        # becomes the exact share of this interval tasks spent stalled.
+        now = snapshot['time']
+        counters = self.monitor.get_cpu_counters()
+        counters.update(self.monitor.get_vm_counters())
+        psi_totals = {(res, kind): v['total'] for res, kinds in snapshot['psi'].items() for kind, v in kinds.items()}
+        faults = self._process_faults(snapshot['processes'])
+        prev = self._prev_counters
+        self._prev_counters = (now, counters, psi_totals, faults)
+        if prev is None or now <= prev[0]:
+            return {}
+
+        dt = now - prev[0]
+        rates = {f'{k}_per_sec': max(v - prev[1][k], 0) / dt for k, v in counters.items() if k in prev[1]}
+        for (res, kind), total in psi_totals.items():
+            if (res, kind) in prev[2]:
+                snapshot['psi'][res][kind]['stall_percent'] = min((total - prev[2][(res, kind)]) / dt / 1e4, 100.0)
+        for proc in snapshot['processes']:
+            key = (proc['pid'], proc['name'])
+            if key in faults and key in prev[3]:
+                proc['major_faults_per_sec'] = max(faults[key] - prev[3][key], 0) / dt
+        return rates
+
+    def _process_faults(self, processes, top_n=10):
+        # Only the top processes by CPU and by RSS: one small /proc read each
+        top = {}
+        for proc in heapq.nlargest(top_n, processes, key=lambda p: p['cpu_percent']):
+            top[proc['pid']] = proc
+        for proc in heapq.nlargest(top_n, processes, key=lambda p: p['rss']):
+            top[proc['pid']] = proc
+        faults = {}
+        for pid, proc in top.items():
+            count = self.monitor.get_process_major_faults(pid)
+            if count is not None:
+                faults[(pid, proc['name'])] = count
+        return faults
+
+    def _collect_processes(self):
+        procs = []
+        for proc in psutil.process_iter(['pid', 'ppid', 'name', 'username', 'cpu_percent', 'memory_percent', 'memory_info']):
+            try:
+                info = proc.info
+                mem_info = info.get('memory_info')
+                procs.append({
+                    'pid': info['pid'],
+                    'ppid': info.get('ppid') or 0,
+                    'name': info.get('name') or "",
+                    'username': info.get('username') or "",
+                    'cpu_percent': info.get('cpu_percent') or 0.0,
+                    'memory_percent': info.get('memory_percent') or 0.0,
+                    'rss': mem_info.rss if mem_info else 0
+                })
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.profiler.count('psutil.process_scans')
+        self.profiler.count('psutil.process_queries', len(procs))
+        return procs
+
+    def _system_sample(self, snapshot):
+        sample = {
+            'time': snapshot['time'],
+            'cpu_percent': snapshot['cpu_percent'],
+            'mem_percent': snapshot['memory']['percent'],
+            'swap_percent': snapshot['swap']['percent'],
+            'load1': snapshot['load'][0],
+            'psi_cpu': self._psi_value(snapshot, 'cpu'),
+            'psi_memory': self._psi_value(snapshot, 'memory'),
+            'psi_io': self._psi_value(snapshot, 'io'),
+            'ctx_per_sec': snapshot['rates'].get('ctx_switches_per_sec'),
+            'irq_per_sec': snapshot['rates'].get('interrupts_per_sec'),
+            'swap_in_per_sec': snapshot['rates'].get('swap_in_bytes_per_sec'),
+            'swap_out_per_sec': snapshot['rates'].get('swap_out_bytes_per_sec'),
+            'major_faults_per_sec': snapshot['rates'].get('major_faults_per_sec'),
+            'cgroup_cpu_percent': (snapshot['cgroup'] or {}).get('cpu_percent_of_quota'),
+            'cgroup_mem_percent': (snapshot['cgroup'] or {}).get('memory_percent_of_max'),
+            'cgroup_throttled_percent': (snapshot['cgroup'] or {}).get('throttled_percent')
+        }
+        # Plugin metrics go in as '<plugin>.<metric>', the name alert rules use
+        for plugin, values in snapshot.get('plugins', {}).items():
+            for key, value in values.items():
+                sample[f'{plugin}.{key}'] = value
+        return sample
+
+    def _psi_value(self, snapshot, resource):
+        some = snapshot['psi'].get(resource, {}).get('some')
+        if some is None:
+            return None
+        return some.get('stall_percent', some['avg10'])
+
+    def get_latest(self):
+        with self._lock:
+            return self.latest
+
+    def get_history(self, since=None):
+        with self._lock:
+            samples = list(self.history)
+        if since is None:
+            return samples
+        return [s for s in samples if s['time'] >= since]
+
+
+_collector = None
+_collector_lock = threading.Lock()
+
+
+def get_collector():
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = MetricsCollector()
+        return _collector
@@ -0,0 +1,213 @@
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _DirInfo:
+    __slots__ = ('mtime_ns', 'ino', 'own_bytes', 'own_files', 'subdirs', 'total_bytes', 'total_files', 'errors')
+
+    def __init__(self, mtime_ns, ino):
+        self.mtime_ns = mtime_ns
+        self.ino = ino
+        self.own_bytes = 0
+        self.own_files = 0
+        self.subdirs = []
+        self.total_bytes = 0
+        self.total_files = 0
+        self.errors = 0
+
+
+class DiskAnalyzer:
+    # Directory sizes cached per path and keyed by the directory's mtime and
+    # inode. A directory whose mtime/inode are unchanged keeps its file sizes
+    # and subdirectory list, so a rescan costs one stat() per directory and
+    # only changed directories are listed again. Files rewritten in place do
+    # not touch their directory's mtime; "full rescan" drops the cache.
+
+    def __init__(self, workers=8):
+        self.workers = workers
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._pending = 0
+        self._done = threading.Event()
+        self._pool = None
+        self._dev = None
+        self._seen = None
+        self._cancel = threading.Event()
+        self.stats = {}
+
+    def cancel(self):
+        self._cancel.set()
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache = {}
+
+    def cache_size(self):
+        with self._lock:
+            return len(self._cache)
+
+    def scanning(self):
+        return self._scan_lock.locked()
+
+    def scan(self, path, progress=None, progress_interval=0.25):
+        path = os.path.abspath(path)
+        with self._scan_lock:
+            start = time.perf_counter()
+            self._cancel.clear()
+            self._done.clear()
+            self._seen = set()
+            self.stats = {'dirs': 0, 'listed': 0, 'cached': 0, 'errors': 0}
+            try:
+                self._dev = os.stat(path).st_dev
+            except OSError:
+                return None
+
+            reporter = None
+            if progress is not None:
+                reporter = threading.Thread(target=self._report, args=(progress, progress_interval), daemon=True)
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                self._pool = pool
+                self._submit(path)
+                if reporter is not None:
+                    reporter.start()
+                self._done.wait()
+            self._pool = None
+
+            with self._lock:
+                if not self._cancel.is_set():
+                    for stale in [p for p in self._cache if p not in self._seen and self._under(p, path)]:
+                        del self._cache[stale]
+                self._total(path)
+                root = self._cache.get(path)
+            result = dict(self.stats, path=path, seconds=time.perf_counter() - start,
+                          bytes=root.total_bytes if root else 0, files=root.total_files if root else 0)
+            if reporter is not None:
+                reporter.join()
+                progress(dict(result, finished=True))
+            return result
+
+    @staticmethod
+    def _under(child, parent):
+        return child == parent or child.startswith(parent.rstrip(os.sep) + os.sep)
+
+    def _report(self, progress, interval):
+        while not self._done.wait(interval):
+            with self._lock:
+                snapshot = dict(self.stats)
+            progress(dict(snapshot, finished=False))
+
+    def _submit(self, path):
+        with self._lock:
+            self._pending += 1
+        self._pool.submit(self._scan_dir, path)
+
+    def _scan_dir(self, path):
+        listed = False
+        info = None
+        try:
+            if self._cancel.is_set():
+                return
+            st = os.stat(path)
+            with self._lock:
+                self._seen.add(path)
+                cached = self._cache.get(path)
+            if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.ino == st.st_ino:
+                info = cached
+            else:
+                info = self._list(path, st)
+                listed = True
+                with self._lock:
+                    self._cache[path] = info
+            for name in info.subdirs:
+                self._submit(os.path.join(path, name))
+        except OSError:
+            with self._lock:
+                self.stats['errors'] += 1
+        finally:
+            with self._lock:
+                if info is not None:
+                    self.stats['dirs'] += 1
+                    self.stats['listed' if listed else 'cached'] += 1
+                self._pending -= 1
+                if self._pending == 0:
+                    self._done.set()
+
+    def _list(self, path, st):
+        info = _DirInfo(st.st_mtime_ns, st.st_ino)
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    est = entry.stat(follow_symlinks=False)
+                except OSError:
+                    info.errors += 1
+                    continue
+                if stat.S_ISDIR(est.st_mode):
+                    # Stay on one filesystem, like du -x
+                    if est.st_dev == self._dev:
+                        info.subdirs.append(entry.name)
+                    continue
+                info.own_files += 1
+                info.own_bytes += getattr(est, 'st_blocks', 0) * 512 or est.st_size
+        return info
+
+    def _total(self, root):
+        # Post-order without recursion; deep trees would hit the recursion limit
+        stack = [(root, False)]
+        while stack:
+            path, expanded = stack.pop()
+            info = self._cache.get(path)
+            if info is None:
+                continue
+            if not expanded:
+                stack.append((path, True))
+                stack.extend((os.path.join(path, name), False) for name in info.subdirs)
+                continue
+            total_bytes, total_files = info.own_bytes, info.own_files
+            for name in info.subdirs:
+                child = self._cache.get(os.path.join(path, name))
+                if child is not None:
+                    total_bytes += child.total_bytes
+                    total_files += child.total_files
+            info.total_bytes, info.total_files = total_bytes, total_files
+
+    def children(self, path):
+        # Subdirectories of a scanned path plus one row for its own files,
+        # largest first.
+        path = os.path.abspath(path)
+        with self._lock:
+            info = self._cache.get(path)
+            if info is None:
+                return []
+            rows = []
+            for name in info.subdirs:
+                child = self._cache.get(os.path.join(path, name))
+                if child is not None:
+                    rows.append({'name': name, 'path': os.path.join(path, name), 'is_dir': True,
+                                 'bytes': child.total_bytes, 'files': child.total_files})
+            if info.own_files:
+                rows.append({'name': '(files)', 'path': path, 'is_dir': False,
+                             'bytes': info.own_bytes, 'files': info.own_files})
+        rows.sort(key=lambda r: r['bytes'], reverse=True)
+        return rows
+
+    def get_total(self, path):
+        with self._lock:
+            info = self._cache.get(os.path.abspath(path))
+            return (info.total_bytes, info.total_files) if info else None
+
+
+_disk_analyzer = None
+_disk_analyzer_lock = threading.Lock()
+
+
+def get_disk_analyzer():
+    global _disk_analyzer
+    with _disk_analyzer_lock:
+        if _disk_analyzer is None:
+            _disk_analyzer = DiskAnalyzer()
+        return _disk_analyzer
@@ -0,0 +1,338 @@
+import queue
+import socket
+import struct
+import threading
+import time
+
+MAGIC = b'CSF1'
+FRAME = struct.Struct('!4sBI')
+SYSTEM = struct.Struct('!dffQQII')
+PROC = struct.Struct('!IfQB')
+
+MSG_HELLO = 1
+MSG_KEYFRAME = 2
+MSG_DELTA = 3
+
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+# A client has this long after connecting to say HELLO
+HANDSHAKE_TIMEOUT = 10.0
+RSS_QUANTUM = 64 * 1024
+
+
+def pack_frame(kind, payload):
+    return FRAME.pack(MAGIC, kind, len(payload)) + payload
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_frame(sock):
+    magic, kind, length = FRAME.unpack(_recv_exact(sock, FRAME.size))
+    if magic != MAGIC or length > MAX_FRAME_BYTES:
+        raise ConnectionError("bad frame header")
+    return kind, _recv_exact(sock, length)
+
+
+class SnapshotEncoder:
+    # Keeps the process table last sent to the aggregator and encodes each
+    # new snapshot as only the processes that appeared, changed or exited.
+
+    def __init__(self):
+        self._table = {}
+
+    def reset(self):
+        self._table = {}
+
+    def encode(self, snapshot, keyframe=False):
+        if keyframe:
+            self._table = {}
+        mem = snapshot.get('memory', {})
+        upserts = []
+        table = {}
+        for proc in snapshot.get('processes', []):
+            pid = proc['pid']
+            name = proc.get('name') or ''
+            entry = (name, round(proc.get('cpu_percent', 0.0), 1), proc.get('rss', 0) // RSS_QUANTUM)
+            table[pid] = entry
+            prev = self._table.get(pid)
+            if prev == entry:
+                continue
+            name_bytes = name.encode('utf-8')[:255] if prev is None or prev[0] != name else b''
+            upserts.append(PROC.pack(pid, entry[1], entry[2] * RSS_QUANTUM, len(name_bytes)) + name_bytes)
+
+        removed = [pid for pid in self._table if pid not in table]
+        self._table = table
+
+        header = SYSTEM.pack(snapshot.get('time', time.time()), snapshot.get('cpu_percent', 0.0),
+                             mem.get('percent', 0.0), mem.get('total', 0), mem.get('used', 0),
+                             len(upserts), len(removed))
+        payload = header + b''.join(upserts) + struct.pack(f'!{len(removed)}I', *removed)
+        return pack_frame(MSG_KEYFRAME if keyframe else MSG_DELTA, payload)
+
+
+def decode_snapshot(payload, processes):
+    timestamp, cpu, mem_percent, mem_total, mem_used, n_upserts, n_removed = SYSTEM.unpack_from(payload, 0)
+    offset = SYSTEM.size
+    for _ in range(n_upserts):
+        pid, proc_cpu, rss, name_len = PROC.unpack_from(payload, offset)
+        offset += PROC.size
+        proc = processes.get(pid)
+        if proc is None:
+            proc = processes[pid] = {'pid': pid, 'name': ''}
+        if name_len:
+            proc['name'] = payload[offset:offset + name_len].decode('utf-8', errors='replace')
+            offset += name_len
+        proc['cpu_percent'] = proc_cpu
+        proc['rss'] = rss
+    for pid in struct.unpack_from(f'!{n_removed}I', payload, offset):
+        processes.pop(pid, None)
+    return {
+        'time': timestamp,
+        'cpu_percent': cpu,
+        'memory': {'percent': mem_percent, 'total': mem_total, 'used': mem_used}
+    }
+
+
+class FleetAgent:
+    def __init__(self, collector, host, port, hostname=None, max_queue=8, reconnect_delay=2.0):
+        self.collector = collector
+        self.host = host
+        self.port = port
+        self.hostname = hostname or socket.gethostname()
+        self.reconnect_delay = reconnect_delay
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.connected = False
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._encoder = SnapshotEncoder()
+        self._lock = threading.Lock()
+        self._keyframe = True
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self.collector.subscribe(self.on_snapshot)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self.collector.unsubscribe(self.on_snapshot)
+
+    def on_snapshot(self, snapshot):
+        if not self.connected:
+            return
+        with self._lock:
+            if self._queue.full():
+                # The aggregator is not keeping up: discard the backlog and
+                # resend the full table instead of an unbroken delta chain.
+                self._drain()
+                self._keyframe = True
+            frame = self._encoder.encode(snapshot, keyframe=self._keyframe)
+            self._keyframe = False
+            self._queue.put_nowait(frame)
+
+    def _drain(self):
+        while True:
+            try:
+                self._queue.get_nowait()
+                self.frames_dropped += 1
+            except queue.Empty:
+                return
+
+    def _run(self):
+        while self._running:
+            try:
+                with socket.create_connection((self.host, self.port), timeout=10) as sock:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    # A small send buffer makes a slow aggregator show up as a
+                    # full queue here within a few frames rather than megabytes.
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024)
+                    sock.sendall(pack_frame(MSG_HELLO, self.hostname.encode('utf-8')))
+                    with self._lock:
+                        self._drain()
+                        self._keyframe = True
+                    self.connected = True
+                    while self._running:
+                        try:
+                            frame = self._queue.get(timeout=1.0)
+                        except queue.Empty:
+                            continue
+                        sock.sendall(frame)
+                        self.frames_sent += 1
+            except OSError as e:
+                print(f"Fleet agent connection error: {e}")
+            finally:
+                self.connected = False
+            if self._running:
+                time.sleep(self.reconnect_delay)
+
+
+def host_id(name, address):
+    return f"{name}@{address}"
+
+
+class HostState:
+    def __init__(self, name, address):
+        self.id = host_id(name, address)
+        self.name = name
+        self.address = address
+        self.system = {}
+        self.processes = {}
+        self.connected = True
+        self.last_seen = time.time()
+        self.frames = 0
+        self.bytes = 0
+        self.throttled = 0
+
+
+class FleetAggregator:
+    # The ingest port is unauthenticated, so it only listens on loopback
+    # unless the caller asks for a wider bind address.
+    def __init__(self, host='127.0.0.1', port=9700, max_frames_per_sec=2.0, burst=5):
+        self.host = host
+        self.port = port
+        self.max_frames_per_sec = max_frames_per_sec
+        self.burst = burst
+        self.hosts = {}
+        self.rejected = 0
+        self._conns = set()
+        self._lock = threading.Lock()
+        self._server = None
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+        self._server = socket.create_server((self.host, self.port))
+        self.port = self._server.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def stop(self):
+        self._running = False
+        if self._server:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+        with self._lock:
+            conns = list(self._conns)
+        for conn in conns:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, addr = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn, addr), daemon=True).start()
+
+    def _handle(self, conn, addr):
+        state = None
+        tokens = float(self.burst)
+        last = time.monotonic()
+        with self._lock:
+            self._conns.add(conn)
+        try:
+            with conn:
+                conn.settimeout(HANDSHAKE_TIMEOUT)
+                kind, payload = read_frame(conn)
+                if kind != MSG_HELLO:
+                    return
+                conn.settimeout(None)
+                name = payload.decode('utf-8', errors='replace') or f"{addr[0]}:{addr[1]}"
+                # Hosts are told apart by name and address; a second live
+                # agent claiming both would overwrite the first one's table
+                key = host_id(name, addr[0])
+                with self._lock:
+                    state = self.hosts.get(key)
+                    if state is not None and state.connected:
+                        if not self.rejected:
+                            print(f"Fleet aggregator: rejected duplicate agent '{name}' from {addr[0]}")
+                        self.rejected += 1
+                        state = None
+                        return
+                    if state is None:
+                        state = self.hosts[key] = HostState(name, addr[0])
+                    state.connected = True
+                    state.processes = {}
+
+                synced = False
+                while self._running:
+                    # Per-host token bucket: when a host sends faster than
+                    # allowed we simply stop reading, and TCP flow control
+                    # pushes the back-pressure onto the agent's send queue.
+                    now = time.monotonic()
+                    tokens = min(self.burst, tokens + (now - last) * self.max_frames_per_sec)
+                    last = now
+                    if tokens < 1.0:
+                        state.throttled += 1
+                        time.sleep((1.0 - tokens) / self.max_frames_per_sec)
+                        continue
+                    tokens -= 1.0
+
+                    kind, payload = read_frame(conn)
+                    if kind == MSG_KEYFRAME:
+                        synced = True
+                    elif kind != MSG_DELTA or not synced:
+                        continue
+                    with self._lock:
+                        if kind == MSG_KEYFRAME:
+                            state.processes = {}
+                        state.system = decode_snapshot(payload, state.processes)
+                        state.last_seen = time.time()
+                        state.frames += 1
+                        state.bytes += len(payload) + FRAME.size
+        except (OSError, ConnectionError, struct.error) as e:
+            if self._running:
+                print(f"Fleet aggregator connection from {addr[0]} closed: {e}")
+        finally:
+            with self._lock:
+                self._conns.discard(conn)
+                if state is not None:
+                    state.connected = False
+
+    def get_hosts(self):
+        with self._lock:
+            hosts = []
+            for state in self.hosts.values():
+                hosts.append({
+                    'id': state.id,
+                    'name': state.name,
+                    'address': state.address,
+                    'connected': state.connected,
+                    'cpu_percent': state.system.get('cpu_percent', 0.0),
+                    'mem_percent': state.system.get('memory', {}).get('percent', 0.0),
+                    'processes': len(state.processes),
+                    'last_seen': state.last_seen,
+                    'frames': state.frames,
+                    'bytes': state.bytes,
+                    'throttled': state.throttled
+                })
+            return sorted(hosts, key=lambda h: h['id'])
+
+    def get_host_processes(self, host, limit=50, sort_by='cpu_percent'):
+        with self._lock:
+            state = self.hosts.get(host)
+            if state is None:
+                return []
+            procs = [dict(p) for p in state.processes.values()]
+        procs.sort(key=lambda p: p.get(sort_by, 0), reverse=True)
+        return procs[:limit]
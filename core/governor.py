@@ -0,0 +1,255 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+GOVERNOR_LOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'governor_log.jsonl')
+
+# Pressure triggers as (label, extract, threshold, clear). A trigger starts
+# breaching above its threshold and only stops once it falls to its clear
+# level, so a value hovering around the threshold cannot flap.
+TRIGGERS = {
+    'cpu': ('CPU %', lambda s: s.get('cpu_percent', 0.0), 85.0, 70.0),
+    'memory': ('Memory %', lambda s: s.get('memory', {}).get('percent', 0.0), 90.0, 80.0),
+    'psi_cpu': ('CPU pressure', lambda s: s.get('psi', {}).get('cpu', {}).get('some', {}).get('avg10'), 40.0, 20.0),
+    'psi_memory': ('Memory pressure', lambda s: s.get('psi', {}).get('memory', {}).get('some', {}).get('avg10'), 10.0, 5.0),
+}
+
+# Overridable from the "governor" section of booster_policy.json
+DEFAULT_SETTINGS = {
+    'mode': 'contain',
+    'sustain_seconds': 10,
+    'cooldown_seconds': 30,
+    'max_actions_per_minute': 5,
+    'effect_seconds': 20,
+    'contain': {'share': 0.5},
+    'thresholds': {}
+}
+
+
+class _Trigger:
+    def __init__(self, key, label, extract, threshold, clear):
+        self.key = key
+        self.label = label
+        self.extract = extract
+        self.threshold = threshold
+        self.clear = min(clear, threshold)
+        self.since = None
+        self.value = None
+
+
+class BoostGovernor:
+    # Watches every collector snapshot and applies the Booster policy when
+    # pressure has been sustained. A tick that is not acting is a few
+    # comparisons; the policy is only evaluated once a trigger has held for
+    # sustain_seconds and the cooldown and action budget allow it.
+
+    def __init__(self, collector, policy=None, mode='contain', sustain_seconds=10, cooldown_seconds=30,
+                 max_actions_per_minute=5, effect_seconds=20, contain=None, thresholds=None,
+                 log_path=GOVERNOR_LOG_PATH, max_log_bytes=4 * 1024 * 1024):
+        self.collector = collector
+        # None follows get_booster_policy(), so a policy reload takes effect
+        # on the next tick instead of the governor keeping the old one
+        self.policy = policy
+        self.mode = mode
+        self.sustain_seconds = sustain_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.max_actions_per_minute = max_actions_per_minute
+        self.effect_seconds = effect_seconds
+        self.contain = dict(contain or {})
+        self.log_path = log_path
+        self.max_log_bytes = max_log_bytes
+        self.enabled = False
+        self.event_count = 0
+
+        thresholds = thresholds or {}
+        self.triggers = []
+        for key, (label, extract, threshold, clear) in TRIGGERS.items():
+            threshold, clear = thresholds.get(key, (threshold, clear))
+            self.triggers.append(_Trigger(key, label, extract, threshold, clear))
+
+        self.events = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._action_times = deque()
+        self._last_boost = 0.0
+        self._episode = None
+        self._acted = set()
+        self._pending = []
+        self._busy = False
+
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.collector.subscribe(self.on_snapshot)
+
+    def stop(self):
+        self.enabled = False
+        self.collector.unsubscribe(self.on_snapshot)
+        for trigger in self.triggers:
+            trigger.since = None
+        self._episode = None
+
+    def on_snapshot(self, snapshot):
+        now = snapshot.get('time', time.time())
+        sustained = []
+        for trigger in self.triggers:
+            value = trigger.extract(snapshot)
+            trigger.value = value
+            if value is None:
+                trigger.since = None
+                continue
+            if trigger.since is None:
+                if value > trigger.threshold:
+                    trigger.since = now
+            elif value <= trigger.clear:
+                trigger.since = None
+            if trigger.since is not None and now - trigger.since >= self.sustain_seconds:
+                sustained.append(trigger)
+
+        with self._lock:
+            due = bool(self._pending) and now >= self._pending[0]['due']
+        if due:
+            self._measure_effects(now)
+
+        if not sustained:
+            if self._episode is not None and all(t.since is None for t in self.triggers):
+                self._log({'event': 'cleared', 'time': now, 'started': self._episode})
+                self._episode = None
+                self._acted = set()
+            return
+
+        if self._episode is None:
+            self._episode = now
+            self._log({'event': 'pressure', 'time': now,
+                       'triggers': {t.key: round(t.value, 2) for t in sustained}})
+
+        if self._busy or now - self._last_boost < self.cooldown_seconds:
+            return
+        while self._action_times and now - self._action_times[0] >= 60:
+            self._action_times.popleft()
+        budget = self.max_actions_per_minute - len(self._action_times)
+        if budget <= 0:
+            return
+
+        plan = [a for a in self._policy().evaluate(snapshot, self.mode) if a['pid'] not in self._acted]
+        if not plan:
+            return
+        plan = plan[:budget]
+        self._last_boost = now
+        self._action_times.extend([now] * len(plan))
+        self._acted.update(a['pid'] for a in plan)
+        self._busy = True
+        # Terminations wait out a grace period, which must not stall the
+        # collector thread this callback runs on.
+        threading.Thread(target=self._apply, args=(plan, now, sustained), daemon=True).start()
+
+    def _policy(self):
+        if self.policy is not None:
+            return self.policy
+        from core.booster_policy import get_booster_policy
+        return get_booster_policy()
+
+    def _apply(self, plan, now, sustained):
+        from core.booster_policy import apply_plan
+        from core.throttle import default_contain_cpus, parse_cpu_list
+        try:
+            defaults = dict(self.contain)
+            cpus = defaults.get('cpus', default_contain_cpus())
+            defaults['cpus'] = parse_cpu_list(cpus) if isinstance(cpus, str) else cpus
+            results = apply_plan(plan, self.collector.monitor, grace=3.0, defaults=defaults)
+            before = self._window_means(now - self.sustain_seconds, now)
+            event = {
+                'event': 'action',
+                'time': now,
+                'mode': self.mode,
+                'triggers': {t.key: round(t.value, 2) for t in sustained},
+                'actions': [{'pid': r['pid'], 'name': r['name'], 'rule': r['rule'], 'action': r['action'],
+                             'outcome': r['outcome'], 'cpu': r['cpu'], 'rss_mb': r['rss_mb']} for r in results],
+                'before': before
+            }
+            self._log(event)
+            with self._lock:
+                self._pending.append({'due': now + self.effect_seconds, 'time': now, 'before': before})
+        except Exception as e:
+            print(f"Governor error: {e}")
+        finally:
+            self._busy = False
+
+    def _measure_effects(self, now):
+        with self._lock:
+            due = [p for p in self._pending if now >= p['due']]
+            self._pending = [p for p in self._pending if now < p['due']]
+        for pending in due:
+            after = self._window_means(pending['due'] - self.effect_seconds / 2, pending['due'])
+            delta = {k: round(after[k] - pending['before'][k], 2)
+                     for k in after if pending['before'].get(k) is not None and after[k] is not None}
+            self._log({'event': 'effect', 'time': now, 'action_time': pending['time'],
+                       'before': pending['before'], 'after': after, 'delta': delta})
+
+    def _window_means(self, start, end):
+        samples = [s for s in self.collector.get_history(since=start) if s['time'] <= end]
+        if not samples:
+            return {'cpu_percent': None, 'mem_percent': None}
+        return {
+            'cpu_percent': round(sum(s['cpu_percent'] for s in samples) / len(samples), 2),
+            'mem_percent': round(sum(s['mem_percent'] for s in samples) / len(samples), 2)
+        }
+
+    def _log(self, event):
+        with self._lock:
+            self.events.append(event)
+            self.event_count += 1
+        try:
+            # Written from the collector and apply threads; one previous
+            # generation is kept as .1
+            with self._log_lock:
+                size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+                if self.max_log_bytes and size > self.max_log_bytes:
+                    os.replace(self.log_path, self.log_path + '.1')
+                with open(self.log_path, 'a') as f:
+                    f.write(json.dumps(event) + "\n")
+        except Exception as e:
+            print(f"Governor log error: {e}")
+
+    def get_status(self):
+        active = [t for t in self.triggers if t.since is not None]
+        return {
+            'enabled': self.enabled,
+            'mode': self.mode,
+            'under_pressure': self._episode is not None,
+            'triggers': {t.key: t.value for t in active},
+            'actions_last_minute': len(self._action_times)
+        }
+
+    def get_recent_events(self, limit=20):
+        with self._lock:
+            return list(self.events)[-limit:]
+
+
+def load_governor_settings(path=None):
+    from core.booster_policy import POLICY_PATH
+    settings = dict(DEFAULT_SETTINGS)
+    path = path or POLICY_PATH
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                settings.update(json.load(f).get('governor', {}))
+        except (OSError, ValueError) as e:
+            print(f"Governor settings error: {e}")
+    return settings
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor():
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            from core.collector import get_collector
+            _governor = BoostGovernor(get_collector(), **load_governor_settings())
+        return _governor
@@ -0,0 +1,141 @@
+import numpy as np
+
+
+class SlotTable:
+    # Maps keys (a pid, a series name) to slots in a set of numpy arrays, so
+    # per-key state updates as one vectorized operation. The slot is the last
+    # axis of every array; capacity doubles when the free list runs out and a
+    # released slot is reset to its array's fill value.
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.slots = {}
+        self.keys = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        self._arrays = {}
+        self._fills = {}
+
+    def add_array(self, name, shape=(), fill=0.0, dtype=np.float64):
+        self._arrays[name] = np.full(tuple(shape) + (self.capacity,), fill, dtype=dtype)
+        self._fills[name] = fill
+
+    def __getitem__(self, name):
+        # Always go through the table: growing replaces the arrays
+        return self._arrays[name]
+
+    def slot(self, key):
+        # Returns (slot, is_new)
+        slot = self.slots.get(key)
+        if slot is not None:
+            return slot, False
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.slots[key] = slot
+        self.keys[slot] = key
+        return slot, True
+
+    def release(self, key):
+        slot = self.slots.pop(key)
+        for name, arr in self._arrays.items():
+            arr[..., slot] = self._fills[name]
+        self.keys[slot] = None
+        self._free.append(slot)
+        return slot
+
+    def _grow(self):
+        old_cap = self.capacity
+        new_cap = old_cap * 2
+        for name, arr in self._arrays.items():
+            out = np.full(arr.shape[:-1] + (new_cap,), self._fills[name], dtype=arr.dtype)
+            out[..., :old_cap] = arr
+            self._arrays[name] = out
+        self.keys.extend([None] * (new_cap - old_cap))
+        self._free.extend(range(new_cap - 1, old_cap - 1, -1))
+        self.capacity = new_cap
+
+
+class RegressionRing:
+    # Sliding window of per-key samples, one column per tick. Each series is
+    # a (window, slots) ring; for the regressed series the least-squares sums
+    # (n, St, Sy, Stt, Sty, Syy) are kept per key, so adding the newest column
+    # and retiring the oldest is O(keys) however long the window is. Keys
+    # missing from a tick are released.
+
+    def __init__(self, window, series=('value',), regress='value', time_unit=1.0, capacity=512):
+        self.window = window
+        self.series = tuple(series)
+        self.regress = regress
+        self.time_unit = time_unit
+        self.table = SlotTable(capacity)
+        for name in self.series:
+            self.table.add_array(name, (window,), np.nan)
+            self.table.add_array(f'latest_{name}', (), 0.0)
+        self.table.add_array('sums', (6,), 0.0)
+        self.times = np.full(window, np.nan)
+        self.cursor = 0
+        self.ticks = 0
+        self._origin = None
+
+    def add(self, timestamp, keys, **values):
+        # values: series name -> sequence aligned with keys
+        if self._origin is None:
+            self._origin = timestamp
+        t_new = (timestamp - self._origin) / self.time_unit
+        table = self.table
+
+        slots = [table.slot(key)[0] for key in keys]
+        seen = set(keys)
+        for key in [k for k in table.slots if k not in seen]:
+            table.release(key)
+
+        sums = table['sums']
+        k = self.cursor
+        t_old = self.times[k]
+        if not np.isnan(t_old):
+            old = table[self.regress][k]
+            mask = ~np.isnan(old)
+            y = old[mask]
+            sums[0, mask] -= 1
+            sums[1, mask] -= t_old
+            sums[2, mask] -= y
+            sums[3, mask] -= t_old * t_old
+            sums[4, mask] -= t_old * y
+            sums[5, mask] -= y * y
+            for name in self.series:
+                table[name][k] = np.nan
+
+        if slots:
+            idx = np.fromiter(slots, dtype=np.intp, count=len(slots))
+            for name in self.series:
+                column = np.fromiter(values[name], dtype=np.float64, count=len(slots))
+                table[name][k, idx] = column
+                table[f'latest_{name}'][idx] = column
+            y = table[self.regress][k, idx]
+            sums[0, idx] += 1
+            sums[1, idx] += t_new
+            sums[2, idx] += y
+            sums[3, idx] += t_new * t_new
+            sums[4, idx] += t_new * y
+            sums[5, idx] += y * y
+
+        self.times[k] = t_new
+        self.cursor = (k + 1) % self.window
+        self.ticks += 1
+
+    def counts(self):
+        return self.table['sums'][0]
+
+    def latest(self, name):
+        return self.table[f'latest_{name}']
+
+    def fit(self):
+        # Per-slot (n, slope per time_unit, r^2)
+        n, st, sy, stt, sty, syy = self.table['sums']
+        sxx = n * stt - st * st
+        sxy = n * sty - st * sy
+        syy_c = n * syy - sy * sy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(sxx > 1e-12, sxy / sxx, 0.0)
+            r2 = np.where((sxx > 1e-12) & (syy_c > 1e-12), (sxy * sxy) / (sxx * syy_c), 0.0)
+        return n, slope, np.clip(r2, 0.0, 1.0)
@@ -0,0 +1,81 @@
+import threading
+
+import numpy as np
+
+from core.keyed_ring import RegressionRing
+
+
+class LeakDetector:
+    # Sliding-window least squares over each process's RSS history, keyed by
+    # (pid, name) in a RegressionRing, so a new sample costs O(processes)
+    # independent of how long the window is.
+
+    def __init__(self, window_seconds=3600, sample_every=10, min_samples=12,
+                 min_growth_mb_per_hour=5.0, min_confidence=0.6, capacity=512):
+        self.window_seconds = window_seconds
+        self.sample_every = sample_every
+        self.min_samples = min_samples
+        self.min_growth_mb_per_hour = min_growth_mb_per_hour
+        self.min_confidence = min_confidence
+
+        self.window = max(int(window_seconds // sample_every), 2)
+        self._lock = threading.Lock()
+        self._last_sample = 0.0
+        self._ring = RegressionRing(self.window, series=('rss_mb',), regress='rss_mb',
+                                    time_unit=3600.0, capacity=capacity)
+
+    def on_snapshot(self, snapshot):
+        now = snapshot['time']
+        if now - self._last_sample < self.sample_every:
+            return
+        self._last_sample = now
+        self.add_sample(now, snapshot.get('processes', []))
+
+    def add_sample(self, timestamp, processes):
+        keys = [(proc['pid'], proc.get('name') or "") for proc in processes]
+        rss_mb = [proc.get('rss', 0) / (1024 * 1024) for proc in processes]
+        with self._lock:
+            self._ring.add(timestamp, keys, rss_mb=rss_mb)
+
+    def get_suspects(self, limit=10):
+        with self._lock:
+            ring = self._ring
+            if not ring.table.slots:
+                return []
+            n, slope, r2 = ring.fit()
+            mask = ((n >= self.min_samples)
+                    & (slope >= self.min_growth_mb_per_hour)
+                    & (r2 >= self.min_confidence))
+            candidates = np.nonzero(mask)[0]
+            if candidates.size == 0:
+                return []
+            score = slope[candidates] * r2[candidates]
+            order = candidates[np.argsort(-score)][:limit]
+
+            latest = ring.latest('rss_mb')
+            suspects = []
+            for slot in order:
+                pid, name = ring.table.keys[slot]
+                suspects.append({
+                    'pid': pid,
+                    'name': name,
+                    'rss_mb': round(float(latest[slot]), 1),
+                    'growth_mb_per_hour': round(float(slope[slot]), 1),
+                    'confidence': round(float(r2[slot]), 2),
+                    'samples': int(n[slot])
+                })
+            return suspects
+
+
+_leak_detector = None
+_leak_detector_lock = threading.Lock()
+
+
+def get_leak_detector():
+    global _leak_detector
+    with _leak_detector_lock:
+        if _leak_detector is None:
+            from core.collector import get_collector
+            _leak_detector = LeakDetector()
+            get_collector().subscribe(_leak_detector.on_snapshot)
+        return _leak_detector
@@ -0,0 +1,148 @@
+import math
+
+# Seconds after a boost before the post-window starts
+SETTLE_SECONDS = 2.0
+
+METRICS = [
+    ('cpu_percent', 'CPU %'),
+    ('mem_percent', 'Memory %'),
+    ('swap_percent', 'Swap %'),
+    ('load1', 'Load (1 min)'),
+]
+
+# Two-sided 95% Student t critical values; larger df use the normal value
+_T95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+        9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042, 60: 2.000}
+
+
+def _t95(df):
+    if df < 1:
+        return float('inf')
+    for limit in sorted(_T95):
+        if df <= limit:
+            return _T95[limit]
+    return 1.96
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    rank = max(int(math.ceil(q / 100.0 * len(ordered))) - 1, 0)
+    return ordered[rank]
+
+
+def _autocorrelation(values, mean):
+    if len(values) < 3:
+        return 0.0
+    num = sum((a - mean) * (b - mean) for a, b in zip(values, values[1:]))
+    den = sum((v - mean) ** 2 for v in values)
+    return num / den if den > 0 else 0.0
+
+
+def summarize(values):
+    # Consecutive collector samples are strongly autocorrelated, so the
+    # standard error uses an effective sample size n * (1 - r) / (1 + r)
+    # from the lag-1 autocorrelation instead of pretending every sample is
+    # independent.
+    n = len(values)
+    if n == 0:
+        return None
+    mean = sum(values) / n
+    var = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
+    r = min(max(_autocorrelation(values, mean), 0.0), 0.95)
+    n_eff = max(n * (1 - r) / (1 + r), 1.0)
+    return {
+        'n': n,
+        'n_eff': round(n_eff, 1),
+        'mean': mean,
+        'p95': _percentile(values, 95),
+        'var': var,
+        'ci95': _t95(n_eff - 1) * math.sqrt(var / n_eff) if n > 1 else float('inf')
+    }
+
+
+def compare(before, after):
+    # Welch's interval for the difference of the window means
+    if before is None or after is None:
+        return None
+    va = before['var'] / before['n_eff']
+    vb = after['var'] / after['n_eff']
+    se = math.sqrt(va + vb)
+    if se > 0:
+        df = (va + vb) ** 2 / ((va ** 2 / max(before['n_eff'] - 1, 1)) + (vb ** 2 / max(after['n_eff'] - 1, 1)))
+    else:
+        df = before['n_eff'] + after['n_eff'] - 2
+    ci = _t95(df) * se if min(before['n'], after['n']) > 1 else float('inf')
+    delta = after['mean'] - before['mean']
+    return {
+        'delta': delta,
+        'ci95': ci,
+        'significant': abs(delta) > ci
+    }
+
+
+def measure(samples, boost_start, boost_end, pre_seconds, post_seconds, settle=SETTLE_SECONDS):
+    # Splits collector history into a pre-window ending at boost_start and a
+    # post-window starting settle seconds after boost_end.
+    pre = [s for s in samples if boost_start - pre_seconds <= s['time'] < boost_start]
+    post_start = boost_end + settle
+    post = [s for s in samples if post_start <= s['time'] <= post_start + post_seconds]
+
+    result = {'pre_seconds': pre_seconds, 'post_seconds': post_seconds, 'metrics': {}}
+    for key, label in METRICS:
+        before = summarize([s[key] for s in pre if s.get(key) is not None])
+        after = summarize([s[key] for s in post if s.get(key) is not None])
+        result['metrics'][key] = {
+            'label': label,
+            'before': _public(before),
+            'after': _public(after),
+            'change': _rounded(compare(before, after))
+        }
+
+    window = [s for s in samples if boost_start - pre_seconds <= s['time'] <= post_start + post_seconds]
+    result['series'] = {'t': [round(s['time'] - boost_start, 2) for s in window]}
+    for key, _ in METRICS:
+        result['series'][key] = [s.get(key) for s in window]
+    result['boost_seconds'] = round(boost_end - boost_start, 2)
+    result['settle_seconds'] = settle
+    return result
+
+
+def _public(summary):
+    if summary is None:
+        return None
+    return {k: _round(v) for k, v in summary.items() if k != 'var'}
+
+
+def _rounded(change):
+    if change is None:
+        return None
+    return {k: _round(v) for k, v in change.items()}
+
+
+def _round(value):
+    if isinstance(value, float):
+        return round(value, 3) if math.isfinite(value) else None
+    return value
+
+
+def format_report(result):
+    lines = [f"Before: last {result['pre_seconds']}s   After: {result['post_seconds']}s once settled"]
+    for key, metric in result['metrics'].items():
+        before, after, change = metric['before'], metric['after'], metric['change']
+        if before is None or after is None:
+            lines.append(f"{metric['label']}: not enough samples")
+            continue
+        lines.append(
+            f"{metric['label']}: {_fmt(before)} → {_fmt(after)}   "
+            f"Δ {change['delta']:+.2f} ± {_ci(change['ci95'])}"
+            f"{'  (significant)' if change['significant'] else '  (within noise)'}"
+        )
+    return '\n'.join(lines)
+
+
+def _fmt(summary):
+    return f"{summary['mean']:.2f} ± {_ci(summary['ci95'])} (p95 {summary['p95']:.2f}, n={summary['n']})"
+
+
+def _ci(value):
+    return "?" if value is None else f"{value:.2f}"
@@ -0,0 +1,222 @@
+import gc
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import psutil
+
+from core.profiler import get_profiler
+
+
+class MemoryDiagnostics:
+    # Periodic check of CoreSense's own memory. Object counts come from
+    # registered callables (history buffers, task lists, tree rows, graph
+    # windows); when RSS exceeds the budget the registered evictors drop
+    # caches and a warning is raised. With snapshots on, tracemalloc diffs
+    # show which allocation sites grew since the previous check.
+
+    def __init__(self, interval=60.0, budget_mb=None, top_n=15, frames=1):
+        self.interval = interval
+        self.budget_mb = budget_mb
+        self.top_n = top_n
+        self.frames = frames
+        self.snapshots = False
+        self.running = False
+        self.evictions = 0
+        self.last = None
+        self.warnings = deque(maxlen=50)
+        self._counters = {}
+        self._evictors = {}
+        self._warn_callbacks = []
+        self._over_budget = False
+        self._prev_snapshot = None
+        self._process = psutil.Process(os.getpid())
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def register_count(self, name, fn):
+        with self._lock:
+            self._counters[name] = fn
+
+    def register_evictor(self, name, fn):
+        with self._lock:
+            self._evictors[name] = fn
+
+    def on_warning(self, callback):
+        with self._lock:
+            self._warn_callbacks.append(callback)
+
+    def start(self, snapshots=False):
+        self.snapshots = snapshots
+        if snapshots and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        if self.running:
+            return
+        self.running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        self._stop_event.set()
+        if self.snapshots and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._prev_snapshot = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Memory diagnostics error: {e}")
+
+    def _rss_mb(self):
+        try:
+            return self._process.memory_info().rss / 1024 ** 2
+        except (psutil.Error, OSError):
+            return None
+
+    def _counts(self):
+        with self._lock:
+            counters = dict(self._counters)
+        counts = {}
+        for name, fn in counters.items():
+            try:
+                counts[name] = fn()
+            except Exception:
+                counts[name] = None
+        if self.snapshots:
+            # Walking every object is too slow to do without being asked
+            counts['gc.objects'] = len(gc.get_objects())
+        return counts
+
+    def _growth(self):
+        if not self.snapshots or not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ))
+        prev, self._prev_snapshot = self._prev_snapshot, snapshot
+        if prev is None:
+            return []
+        sites = []
+        for stat in snapshot.compare_to(prev, 'lineno')[:self.top_n]:
+            frame = stat.traceback[0]
+            sites.append({
+                'site': f"{frame.filename}:{frame.lineno}",
+                'size_kb': stat.size / 1024,
+                'size_diff_kb': stat.size_diff / 1024,
+                'count': stat.count,
+                'count_diff': stat.count_diff
+            })
+        return sites
+
+    def evict(self):
+        with self._lock:
+            evictors = dict(self._evictors)
+        freed = []
+        for name, fn in evictors.items():
+            try:
+                fn()
+                freed.append(name)
+            except Exception as e:
+                print(f"Cache eviction error ({name}): {e}")
+        gc.collect()
+        self.evictions += 1
+        get_profiler().count('memory.evictions')
+        return freed
+
+    def check(self):
+        now = time.time()
+        rss = self._rss_mb()
+        result = {
+            'time': now,
+            'rss_mb': rss,
+            'budget_mb': self.budget_mb,
+            'counts': self._counts(),
+            'growth': self._growth(),
+        }
+        if self.budget_mb and rss is not None:
+            if rss > self.budget_mb:
+                evicted = self.evict()
+                after = self._rss_mb()
+                result['evicted'] = evicted
+                result['rss_after_mb'] = after
+                # Warn on crossing the budget, not on every check above it
+                if not self._over_budget:
+                    after_text = f"{after:.0f} MB" if after is not None else "unknown"
+                    self._warn(now, f"CoreSense RSS {rss:.0f} MB over budget {self.budget_mb:.0f} MB "
+                                    f"(after evicting caches: {after_text})")
+                self._over_budget = after is not None and after > self.budget_mb
+            else:
+                self._over_budget = False
+        self.last = result
+        return result
+
+    def _warn(self, now, message):
+        warning = {'time': now, 'message': message}
+        self.warnings.append(warning)
+        print(message)
+        with self._lock:
+            callbacks = list(self._warn_callbacks)
+        for callback in callbacks:
+            try:
+                callback(message)
+            except Exception as e:
+                print(f"Memory warning subscriber error: {e}")
+
+    def report(self):
+        return {
+            'running': self.running,
+            'snapshots': self.snapshots,
+            'interval': self.interval,
+            'budget_mb': self.budget_mb,
+            'evictions': self.evictions,
+            'last': self.last,
+            'warnings': list(self.warnings)
+        }
+
+
+def _register_defaults(diag):
+    from core.collector import get_collector
+    from core.alert_rules import get_alert_engine
+
+    collector = get_collector()
+    engine = get_alert_engine()
+    diag.register_count('collector.history', lambda: len(collector.history))
+    diag.register_count('alerts.recent', lambda: len(engine.alerts))
+    diag.register_count('alerts.pattern_cache', engine.cache_size)
+    diag.register_count('profiler.sections', lambda: len(get_profiler().snapshot()['timers']))
+    diag.register_evictor('alerts.pattern_cache', engine.clear_caches)
+
+    # Only if the disk analyzer was ever opened; don't create one here
+    def disk_cache():
+        module = sys.modules.get('core.disk_analyzer')
+        return module.get_disk_analyzer().cache_size() if module else 0
+
+    def clear_disk_cache():
+        module = sys.modules.get('core.disk_analyzer')
+        if module and not module.get_disk_analyzer().scanning():
+            module.get_disk_analyzer().clear_cache()
+    diag.register_count('disk_analyzer.directories', disk_cache)
+    diag.register_evictor('disk_analyzer.cache', clear_disk_cache)
+    diag.on_warning(engine.notify)
+
+
+_memory_diagnostics = None
+_memory_diagnostics_lock = threading.Lock()
+
+
+def get_memory_diagnostics():
+    global _memory_diagnostics
+    with _memory_diagnostics_lock:
+        if _memory_diagnostics is None:
+            _memory_diagnostics = MemoryDiagnostics()
+            _register_defaults(_memory_diagnostics)
+        return _memory_diagnostics
@@ -0,0 +1,225 @@
+import heapq
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_value(value):
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class _Family:
+    def __init__(self, name, kind, help_text):
+        self.lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        self.name = name
+
+    def add(self, value, **labels):
+        if labels:
+            label_str = ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            self.lines.append(f"{self.name}{{{label_str}}} {_format_value(value)}")
+        else:
+            self.lines.append(f"{self.name} {_format_value(value)}")
+        return self
+
+
+def render_metrics(snapshot, top_n=10, per_pid=False):
+    families = []
+
+    def family(name, kind, help_text):
+        fam = _Family(name, kind, help_text)
+        families.append(fam)
+        return fam
+
+    family('coresense_cpu_percent', 'gauge', 'Total CPU utilisation in percent.').add(snapshot.get('cpu_percent', 0.0))
+    per_core = family('coresense_cpu_core_percent', 'gauge', 'Per-core CPU utilisation in percent.')
+    for core, value in enumerate(snapshot.get('cpu_per_core', [])):
+        per_core.add(value, core=core)
+
+    mem = snapshot.get('memory', {})
+    family('coresense_memory_total_bytes', 'gauge', 'Total physical memory.').add(mem.get('total', 0))
+    family('coresense_memory_used_bytes', 'gauge', 'Used physical memory.').add(mem.get('used', 0))
+    family('coresense_memory_available_bytes', 'gauge', 'Available physical memory.').add(mem.get('available', 0))
+    family('coresense_memory_percent', 'gauge', 'Used physical memory in percent.').add(mem.get('percent', 0.0))
+    breakdown = [k for k in ('cached', 'buffers', 'shared', 'slab') if k in mem]
+    if breakdown:
+        kinds = family('coresense_memory_breakdown_bytes', 'gauge', 'Page cache, buffers, shared memory and slab.')
+        for kind in breakdown:
+            kinds.add(mem[kind], kind=kind)
+
+    disk = snapshot.get('disk', {})
+    path = disk.get('path', '/')
+    family('coresense_disk_total_bytes', 'gauge', 'Total disk capacity.').add(disk.get('total', 0), path=path)
+    family('coresense_disk_used_bytes', 'gauge', 'Used disk space.').add(disk.get('used', 0), path=path)
+    family('coresense_disk_free_bytes', 'gauge', 'Free disk space.').add(disk.get('free', 0), path=path)
+    if 'read_bytes' in disk:
+        family('coresense_disk_read_bytes_total', 'counter', 'Bytes read from all disks.').add(disk['read_bytes'])
+        family('coresense_disk_written_bytes_total', 'counter', 'Bytes written to all disks.').add(disk['write_bytes'])
+
+    net = snapshot.get('net', {})
+    if net:
+        family('coresense_net_sent_bytes_total', 'counter', 'Bytes sent on all interfaces.').add(net.get('bytes_sent', 0))
+        family('coresense_net_received_bytes_total', 'counter', 'Bytes received on all interfaces.').add(net.get('bytes_recv', 0))
+        family('coresense_net_sent_packets_total', 'counter', 'Packets sent on all interfaces.').add(net.get('packets_sent', 0))
+        family('coresense_net_received_packets_total', 'counter', 'Packets received on all interfaces.').add(net.get('packets_recv', 0))
+
+    load = snapshot.get('load')
+    if load:
+        for window, value in zip((1, 5, 15), load):
+            family(f'coresense_load{window}', 'gauge', f'{window}-minute load average.').add(value)
+
+    psi = snapshot.get('psi', {})
+    if psi:
+        stall = family('coresense_pressure_stall_seconds_total', 'counter',
+                       'Cumulative time tasks were stalled on a resource (Linux PSI).')
+        avg10 = family('coresense_pressure_avg10_percent', 'gauge', 'Share of the last 10s tasks were stalled (Linux PSI).')
+        for resource, kinds in sorted(psi.items()):
+            for kind, values in sorted(kinds.items()):
+                stall.add(values['total'] / 1e6, resource=resource, kind=kind)
+                avg10.add(values['avg10'], resource=resource, kind=kind)
+
+    rates = snapshot.get('rates', {})
+    if 'ctx_switches_per_sec' in rates:
+        family('coresense_context_switches_per_second', 'gauge', 'Context switches per second.').add(rates['ctx_switches_per_sec'])
+        family('coresense_interrupts_per_second', 'gauge', 'Interrupts per second.').add(rates['interrupts_per_sec'])
+    if 'swap_in_bytes_per_sec' in rates:
+        swap = family('coresense_swap_bytes_per_second', 'gauge', 'Swap traffic in bytes per second.')
+        swap.add(rates['swap_in_bytes_per_sec'], direction='in')
+        swap.add(rates['swap_out_bytes_per_sec'], direction='out')
+    if 'major_faults_per_sec' in rates:
+        faults = family('coresense_page_faults_per_second', 'gauge', 'Page faults per second.')
+        faults.add(rates['major_faults_per_sec'], kind='major')
+        faults.add(rates['minor_faults_per_sec'], kind='minor')
+
+    cgroup = snapshot.get('cgroup')
+    if cgroup:
+        path = cgroup['path']
+        family('coresense_cgroup_throttled_periods_total', 'counter', 'CFS periods the cgroup was throttled.').add(
+            cgroup['nr_throttled'], cgroup=path)
+        family('coresense_cgroup_throttled_seconds_total', 'counter', 'Time the cgroup was throttled.').add(
+            cgroup['throttled_usec'] / 1e6, cgroup=path)
+        if cgroup.get('cpu_cores_used') is not None:
+            family('coresense_cgroup_cpu_cores', 'gauge', 'CPU used by the cgroup, in cores.').add(
+                cgroup['cpu_cores_used'], cgroup=path)
+        if cgroup['cpu_quota_cores']:
+            family('coresense_cgroup_cpu_quota_cores', 'gauge', 'Effective cpu.max quota, in cores.').add(
+                cgroup['cpu_quota_cores'], cgroup=path)
+        if cgroup['memory_current'] is not None:
+            family('coresense_cgroup_memory_bytes', 'gauge', 'Memory charged to the cgroup.').add(
+                cgroup['memory_current'], cgroup=path)
+        if cgroup['memory_max']:
+            family('coresense_cgroup_memory_max_bytes', 'gauge', 'Effective memory.max limit.').add(
+                cgroup['memory_max'], cgroup=path)
+        if cgroup['memory_high']:
+            family('coresense_cgroup_memory_high_bytes', 'gauge', 'Effective memory.high limit.').add(
+                cgroup['memory_high'], cgroup=path)
+
+    plugins = snapshot.get('plugins')
+    if plugins:
+        plugin_values = family('coresense_plugin_value', 'gauge', 'Latest value reported by a collector plugin.')
+        for plugin, values in sorted(plugins.items()):
+            for metric, value in sorted(values.items()):
+                plugin_values.add(value, plugin=plugin, metric=metric)
+
+    processes = snapshot.get('processes', [])
+    family('coresense_processes', 'gauge', 'Number of running processes.').add(len(processes))
+
+    # Only the top-N by CPU and by RSS are exported, so each scrape carries
+    # at most 2 * top_n label sets. By default processes are summed by name:
+    # a pid label would mint new series on every restart and grow the
+    # Prometheus series count without bound over time.
+    if per_pid:
+        groups = {proc['pid']: {'pid': proc['pid'], 'name': proc.get('name') or '',
+                                'cpu_percent': proc.get('cpu_percent', 0.0), 'rss': proc.get('rss', 0)}
+                  for proc in processes}
+    else:
+        groups = {}
+        for proc in processes:
+            name = proc.get('name') or ''
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = {'name': name, 'cpu_percent': 0.0, 'rss': 0, 'count': 0}
+            group['cpu_percent'] += proc.get('cpu_percent', 0.0)
+            group['rss'] += proc.get('rss', 0)
+            group['count'] += 1
+    top = {}
+    for key, group in heapq.nlargest(top_n, groups.items(), key=lambda kv: kv[1]['cpu_percent']):
+        top[key] = group
+    for key, group in heapq.nlargest(top_n, groups.items(), key=lambda kv: kv[1]['rss']):
+        top[key] = group
+    what = f'the top {top_n} processes' if per_pid else f'the top {top_n} process names, summed by name'
+    proc_cpu = family('coresense_process_cpu_percent', 'gauge', f'CPU percent of {what}.')
+    proc_rss = family('coresense_process_resident_bytes', 'gauge', f'Resident memory of {what}.')
+    proc_count = None if per_pid else family('coresense_process_instances', 'gauge',
+                                             f'Running processes under each of the top {top_n} names.')
+    for key, group in sorted(top.items()):
+        labels = {'name': group['name'][:64]}
+        if per_pid:
+            labels = {'pid': group['pid'], **labels}
+        proc_cpu.add(group['cpu_percent'], **labels)
+        proc_rss.add(group['rss'], **labels)
+        if proc_count is not None:
+            proc_count.add(group['count'], **labels)
+
+    lines = []
+    for fam in families:
+        lines.extend(fam.lines)
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class MetricsExporter:
+    def __init__(self, collector, host='127.0.0.1', port=9464, top_n=10, per_pid=False):
+        self.collector = collector
+        self.host = host
+        self.port = port
+        self.top_n = top_n
+        self.per_pid = per_pid
+        self._buffer = b''
+        self._server = None
+        self._thread = None
+
+    def on_snapshot(self, snapshot):
+        # Rendered once per collection tick; scrapes only ever read this buffer
+        self._buffer = render_metrics(snapshot, self.top_n, self.per_pid)
+
+    def start(self):
+        if self._server:
+            return
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = exporter._buffer
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        latest = self.collector.get_latest()
+        if latest:
+            self.on_snapshot(latest)
+        self.collector.subscribe(self.on_snapshot)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server:
+            self.collector.unsubscribe(self.on_snapshot)
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
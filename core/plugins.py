@@ -0,0 +1,220 @@
+import importlib.util
+import os
+import re
+import threading
+import time
+
+from core.profiler import get_profiler
+
+# A collector plugin is a module with a collect() function returning
+# {metric: number} (or a single number). Optional module constants INTERVAL
+# and TIMEOUT, in seconds, set how often it runs and how long a call may take.
+# Plugins come from *.py files in plugins/ (plus CORESENSE_PLUGIN_PATH) and
+# from the 'coresense.collectors' entry point group. Each one is imported and
+# run on its own thread, so a slow or hung plugin only delays itself; the
+# collector tick just picks up whatever values are fresh.
+PLUGIN_DIR = os.path.join(os.path.dirname(__file__), '..', 'plugins')
+PLUGIN_PATH_ENV = 'CORESENSE_PLUGIN_PATH'
+ENTRY_POINT_GROUP = 'coresense.collectors'
+DEFAULT_INTERVAL = 10.0
+DEFAULT_TIMEOUT = 5.0
+MAX_BACKOFF = 300.0
+
+_NAME_RE = re.compile(r'[^a-z0-9_]+')
+
+
+def metric_name(name):
+    # Alert rules lower-case metric names and split plugin from metric on '.'
+    return _NAME_RE.sub('_', str(name).lower()).strip('_') or 'value'
+
+
+def _numeric(raw):
+    if isinstance(raw, (int, float)):
+        raw = {'value': raw}
+    values = {}
+    for key, value in (raw or {}).items():
+        if isinstance(value, bool):
+            value = float(value)
+        if isinstance(value, (int, float)):
+            values[metric_name(key)] = float(value)
+    return values
+
+
+class CollectorPlugin:
+    def __init__(self, name, load, source):
+        self.name = metric_name(name)
+        self.source = source
+        self._load = load
+        self.collect = None
+        self.interval = DEFAULT_INTERVAL
+        self.timeout = DEFAULT_TIMEOUT
+        self.values = {}
+        self.updated = None
+        self.last_duration = None
+        self.error = None
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.thread = None
+
+    def load(self):
+        target = self._load()
+        collect = getattr(target, 'collect', target)
+        if not callable(collect):
+            raise TypeError(f"plugin '{self.name}' has no collect()")
+        self.collect = collect
+        self.interval = float(getattr(target, 'INTERVAL', DEFAULT_INTERVAL))
+        self.timeout = float(getattr(target, 'TIMEOUT', min(DEFAULT_TIMEOUT, self.interval)))
+
+    def is_fresh(self, now):
+        return self.updated is not None and now - self.updated <= self.interval + self.timeout
+
+
+def _load_file(name, path):
+    def load():
+        spec = importlib.util.spec_from_file_location(f'coresense_plugins.{name}', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return load
+
+
+def discover(dirs=None, group=ENTRY_POINT_GROUP):
+    # Lists plugins without importing any of them
+    if dirs is None:
+        dirs = [PLUGIN_DIR] + [d for d in os.environ.get(PLUGIN_PATH_ENV, '').split(os.pathsep) if d]
+    found = {}
+    for directory in dirs:
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            continue
+        for filename in names:
+            if filename.endswith('.py') and not filename.startswith('_'):
+                name = metric_name(filename[:-3])
+                path = os.path.join(directory, filename)
+                found.setdefault(name, CollectorPlugin(name, _load_file(name, path), path))
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group=group)
+    except Exception as e:
+        print(f"Plugin entry point error: {e}")
+        eps = []
+    for ep in eps:
+        found.setdefault(metric_name(ep.name), CollectorPlugin(ep.name, ep.load, ep.value))
+    return list(found.values())
+
+
+class PluginManager:
+    def __init__(self, dirs=None, group=ENTRY_POINT_GROUP):
+        self.dirs = dirs
+        self.group = group
+        self.plugins = []
+        self.discovered = None
+        self.running = False
+        self.profiler = get_profiler()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._discover_callbacks = []
+
+    def on_discovered(self, callback):
+        # callback(names) after discovery; at once if it already happened
+        with self._lock:
+            names = self.discovered
+            if names is None:
+                self._discover_callbacks.append(callback)
+        if names is not None:
+            callback(names)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        # A fresh event per start, so threads from an earlier run still
+        # stuck in a slow collect() exit instead of resuming
+        self._stop_event = threading.Event()
+        # Entry point discovery reads package metadata; keep it off the caller
+        threading.Thread(target=self._start_plugins, args=(self._stop_event,),
+                         name='plugins.discover', daemon=True).start()
+
+    def stop(self):
+        self.running = False
+        self._stop_event.set()
+
+    def _start_plugins(self, stop_event):
+        plugins = discover(self.dirs, self.group)
+        with self._lock:
+            self.plugins = plugins
+            self.discovered = [p.name for p in plugins]
+            callbacks, self._discover_callbacks = self._discover_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self.discovered)
+            except Exception as e:
+                print(f"Plugin discovery subscriber error: {e}")
+        for plugin in plugins:
+            plugin.thread = threading.Thread(target=self._run, args=(plugin, stop_event),
+                                             name=f'plugin.{plugin.name}', daemon=True)
+            plugin.thread.start()
+
+    def _run(self, plugin, stop_event):
+        try:
+            with self.profiler.timer(f'plugin.{plugin.name}.import'):
+                plugin.load()
+        except Exception as e:
+            plugin.error = f"load failed: {e}"
+            print(f"Plugin '{plugin.name}' {plugin.error}")
+            return
+
+        consecutive = 0
+        while not stop_event.is_set():
+            start = time.perf_counter()
+            try:
+                with self.profiler.timer(f'plugin.{plugin.name}'):
+                    values = _numeric(plugin.collect())
+                duration = time.perf_counter() - start
+                plugin.runs += 1
+                plugin.last_duration = duration
+                if duration > plugin.timeout:
+                    # Too late to trust as "now"; the previous values age out
+                    plugin.timeouts += 1
+                    plugin.error = f"took {duration:.1f}s, budget {plugin.timeout:.1f}s"
+                    self.profiler.count('plugins.timeouts')
+                else:
+                    with self._lock:
+                        plugin.values = values
+                        plugin.updated = time.time()
+                    plugin.error = None
+                    consecutive = 0
+            except Exception as e:
+                duration = time.perf_counter() - start
+                plugin.failures += 1
+                consecutive += 1
+                if plugin.error != str(e):
+                    print(f"Plugin '{plugin.name}' error: {e}")
+                plugin.error = str(e)
+                self.profiler.count('plugins.errors')
+            delay = plugin.interval * 2 ** min(consecutive, 8) if consecutive else plugin.interval
+            stop_event.wait(max(min(delay, MAX_BACKOFF) - duration, 0.0))
+
+    def values(self, now=None):
+        # Called from the collector tick: never waits on a plugin
+        now = time.time() if now is None else now
+        with self._lock:
+            return {p.name: dict(p.values) for p in self.plugins if p.is_fresh(now)}
+
+    def status(self):
+        with self._lock:
+            plugins = list(self.plugins)
+        return [{
+            'name': p.name,
+            'source': p.source,
+            'interval': p.interval,
+            'timeout': p.timeout,
+            'runs': p.runs,
+            'failures': p.failures,
+            'timeouts': p.timeouts,
+            'last_duration': p.last_duration,
+            'updated': p.updated,
+            'error': p.error
+        } for p in plugins]
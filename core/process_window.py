@@ -0,0 +1,119 @@
+import threading
+
+import numpy as np
+
+from core.keyed_ring import RegressionRing
+
+
+class ProcessWindowStats:
+    # Sliding window of per-process CPU and RSS samples, updated once per
+    # collector tick. CPU p90 and RSS slope are derived lazily (at most once
+    # per tick), so Booster scans are lookups instead of fresh sampling.
+
+    def __init__(self, window_seconds=60, interval=2.0, min_samples=5, capacity=512):
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.window = max(int(round(window_seconds / interval)), 2)
+
+        self._lock = threading.Lock()
+        self._ring = RegressionRing(self.window, series=('cpu', 'rss'), regress='rss',
+                                    time_unit=60.0, capacity=capacity)
+        self._dirty = True
+        self._p90 = None
+        self._slope = None
+        self._pids = np.empty(0, dtype=np.int64)
+        self._pid_slots = np.empty(0, dtype=np.intp)
+
+    def on_snapshot(self, snapshot):
+        self.add_sample(snapshot['time'], snapshot.get('processes', []))
+
+    def add_sample(self, timestamp, processes):
+        keys = [(proc['pid'], proc.get('name') or "") for proc in processes]
+        cpu = [proc.get('cpu_percent', 0.0) for proc in processes]
+        rss = [proc.get('rss', 0) / (1024 * 1024) for proc in processes]
+        with self._lock:
+            self._ring.add(timestamp, keys, cpu=cpu, rss=rss)
+            self._dirty = True
+
+    def _refresh(self):
+        if not self._dirty:
+            return
+        ring = self._ring
+        # Nearest-rank p90: missing samples sort first as -inf, so the valid
+        # ones occupy the last n columns of each sorted row.
+        n = ring.counts()
+        rows = np.nonzero(n > 0)[0]
+        values = ring.table['cpu'][:, rows].T
+        values = np.where(np.isnan(values), -np.inf, values)
+        values.sort(axis=1)
+        counts = n[rows].astype(np.intp)
+        rank = self.window - counts + np.ceil(0.9 * counts).astype(np.intp) - 1
+        self._p90 = np.zeros(ring.table.capacity)
+        self._p90[rows] = values[np.arange(rows.size), rank]
+
+        _, self._slope, _ = ring.fit()
+        # pid -> slot as two sorted arrays, so lookup() is one searchsorted
+        slots = ring.table.slots
+        pids = np.fromiter((key[0] for key in slots), dtype=np.int64, count=len(slots))
+        order = np.argsort(pids, kind='stable')
+        self._pids = pids[order]
+        self._pid_slots = np.fromiter(slots.values(), dtype=np.intp, count=len(slots))[order]
+        self._dirty = False
+
+    def is_warm(self):
+        return self._ring.ticks >= self.min_samples
+
+    def lookup(self, pids):
+        # Returns (cpu_p90, rss_slope_mb_per_min) arrays aligned with pids;
+        # NaN where a process has too few samples to judge.
+        with self._lock:
+            self._refresh()
+            pids = np.asarray(pids, dtype=np.int64)
+            p90 = np.full(pids.size, np.nan)
+            slope = np.full(pids.size, np.nan)
+            if not self._pids.size:
+                return p90, slope
+            idx = np.minimum(np.searchsorted(self._pids, pids), self._pids.size - 1)
+            slots = self._pid_slots[idx]
+            known = (self._pids[idx] == pids) & (self._ring.counts()[slots] >= self.min_samples)
+            p90[known] = self._p90[slots[known]]
+            slope[known] = self._slope[slots[known]]
+            return p90, slope
+
+    def get_heavy(self, cpu_limit=40, ram_limit=500, limit=10, skip_pids=(), skip_names=()):
+        with self._lock:
+            self._refresh()
+            ring = self._ring
+            n = ring.counts()
+            latest_rss = ring.latest('rss')
+            mask = (n >= self.min_samples) & ((self._p90 > cpu_limit) | (latest_rss > ram_limit))
+            heavy = []
+            for slot in np.nonzero(mask)[0]:
+                pid, name = ring.table.keys[slot]
+                if pid in skip_pids or name.lower() in skip_names:
+                    continue
+                heavy.append({
+                    'pid': pid,
+                    'name': name,
+                    'cpu': round(float(self._p90[slot]), 1),
+                    'ram_mb': round(float(latest_rss[slot]), 1),
+                    'rss_slope_mb_min': round(float(self._slope[slot]), 2),
+                    'samples': int(n[slot])
+                })
+        heavy.sort(key=lambda x: (x['cpu'], x['ram_mb']), reverse=True)
+        return heavy[:limit]
+
+
+_process_window = None
+_process_window_lock = threading.Lock()
+
+
+def get_process_window():
+    global _process_window
+    with _process_window_lock:
+        if _process_window is None:
+            from core.collector import get_collector
+            collector = get_collector()
+            _process_window = ProcessWindowStats(interval=collector.interval)
+            collector.subscribe(_process_window.on_snapshot)
+        return _process_window
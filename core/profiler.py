@@ -0,0 +1,154 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+import psutil
+
+from core import tracing
+
+PROFILE_DUMP_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+class _Timer:
+    __slots__ = ('count', 'total', 'max', 'last', 'recent')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.recent = deque(maxlen=200)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.recent.append(seconds)
+        if seconds > self.max:
+            self.max = seconds
+
+    def summary(self):
+        recent = sorted(self.recent)
+        return {
+            'count': self.count,
+            'total_ms': self.total * 1000,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p95_ms': recent[min(int(len(recent) * 0.95), len(recent) - 1)] * 1000 if recent else 0.0,
+            'max_ms': self.max * 1000,
+            'last_ms': self.last * 1000
+        }
+
+
+class SelfProfiler:
+    # CoreSense's own cost: wall time per named section (collector steps, UI
+    # updates, tree rebuilds, graph draws) and plain event counters. Always
+    # on; a timed section costs a perf_counter pair and a dict update.
+
+    def __init__(self):
+        self.started = time.time()
+        self._timers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._process = psutil.Process(os.getpid())
+        self._process.cpu_percent(interval=None)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.record(name, duration)
+            tracer = tracing.get_tracer()
+            if tracer is not None:
+                tracer.complete(name, start, duration)
+
+    def record(self, name, seconds):
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = self._timers[name] = _Timer()
+            timer.add(seconds)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def after(self, widget, ms, callback, *args, name=None):
+        # widget.after() that counts callbacks queued vs executed and times
+        # each one, so a backed-up Tk queue shows as a growing gap
+        name = name or f"ui.{getattr(callback, '__name__', 'callback')}"
+        self.count('tk.callbacks_queued')
+        tracer = tracing.get_tracer()
+        flow_id = tracer.flow_start(name) if tracer is not None else None
+
+        def run():
+            self.count('tk.callbacks_executed')
+            with self.timer(name):
+                if flow_id is not None:
+                    tracer.flow_end(name, flow_id)
+                callback(*args)
+        return widget.after(ms, run)
+
+    def snapshot(self):
+        try:
+            with self._process.oneshot():
+                own = {
+                    'cpu_percent': self._process.cpu_percent(interval=None),
+                    'rss': self._process.memory_info().rss,
+                    'threads': self._process.num_threads()
+                }
+        except (psutil.Error, OSError):
+            own = {}
+        with self._lock:
+            timers = {name: t.summary() for name, t in self._timers.items()}
+            counters = dict(self._counters)
+        counters['tk.callbacks_pending'] = counters.get('tk.callbacks_queued', 0) - counters.get('tk.callbacks_executed', 0)
+        return {
+            'time': time.time(),
+            'uptime_seconds': time.time() - self.started,
+            'process': own,
+            'timers': timers,
+            'counters': counters
+        }
+
+    def dump(self, path=None):
+        if path is None:
+            path = os.path.join(PROFILE_DUMP_DIR, f"coresense_profile_{datetime.now():%Y%m%d_%H%M%S}.json")
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._timers = {}
+            self._counters = {}
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = SelfProfiler()
+        return _profiler
+
+
+def profiled(name):
+    # Decorator form of SelfProfiler.timer
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_profiler().timer(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
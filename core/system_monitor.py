@@ -1,38 +1,61 @@
 import psutil
 import platform
+import os
+import signal
+import threading
+import time
 from datetime import datetime
 
-class SystemMonitor:
-    def __init__(self):
-        self.system_info = self._get_system_info()
+from core.profiler import get_profiler
+from core.tracing import traced
 
-    def _get_system_info(self):
-        try:
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.now() - boot_time
+_static_facts = None
+_static_facts_lock = threading.Lock()
 
-            processor = platform.processor() or ""
-            processor = ' '.join(processor.split())
-            if '@' in processor:
-                processor = processor.split('@')[0].strip()
 
-            return {
-                'os_name': platform.system(),
-                'os_version': platform.version(),
-                'os_release': platform.release(),
-                'architecture': platform.machine(),
-                'processor': processor,
-                'hostname': platform.node(),
-                'cpu_count_physical': psutil.cpu_count(logical=False),
-                'cpu_count_logical': psutil.cpu_count(logical=True),
-                'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S'),
-                'uptime_days': uptime.days,
-                'uptime_hours': uptime.seconds // 3600,
-                'uptime_minutes': (uptime.seconds % 3600) // 60
-            }
-        except Exception:
-            return {}
+def _get_static_facts():
+    # OS, CPU model, core counts and boot time can't change while we run;
+    # probe them once per process (platform.processor() may fork uname).
+    global _static_facts
+    with _static_facts_lock:
+        if _static_facts is None:
+            try:
+                processor = platform.processor() or ""
+                processor = ' '.join(processor.split())
+                if '@' in processor:
+                    processor = processor.split('@')[0].strip()
 
+                boot_time = psutil.boot_time()
+                _static_facts = {
+                    'os_name': platform.system(),
+                    'os_version': platform.version(),
+                    'os_release': platform.release(),
+                    'architecture': platform.machine(),
+                    'processor': processor,
+                    'hostname': platform.node(),
+                    'cpu_count_physical': psutil.cpu_count(logical=False),
+                    'cpu_count_logical': psutil.cpu_count(logical=True),
+                    'boot_timestamp': boot_time,
+                    'boot_time': datetime.fromtimestamp(boot_time).strftime('%Y-%m-%d %H:%M:%S')
+                }
+            except Exception:
+                _static_facts = {}
+        return _static_facts
+
+
+class SystemMonitor:
+    @property
+    def system_info(self):
+        # Static facts plus uptime, which is derived on every read
+        info = dict(_get_static_facts())
+        if 'boot_timestamp' in info:
+            uptime = int(time.time() - info['boot_timestamp'])
+            info['uptime_days'] = uptime // 86400
+            info['uptime_hours'] = uptime % 86400 // 3600
+            info['uptime_minutes'] = uptime % 3600 // 60
+        return info
+
+    @traced('SystemMonitor.get_cpu_usage')
     def get_cpu_usage(self, interval=0.1):
         try:
             return psutil.cpu_percent(interval=interval)
@@ -45,6 +68,7 @@ class SystemMonitor:
         except Exception:
             return []
 
+    @traced('SystemMonitor.get_memory_usage')
     def get_memory_usage(self):
         try:
             mem = psutil.virtual_memory()
@@ -57,11 +81,120 @@ class SystemMonitor:
                 'total_gb': mem.total / (1024 ** 3),
                 'available_gb': mem.available / (1024 ** 3),
                 'used_gb': mem.used / (1024 ** 3),
-                'free_gb': mem.free / (1024 ** 3)
+                'free_gb': mem.free / (1024 ** 3),
+                **self._memory_breakdown(mem)
             }
         except Exception:
             return {'total':0, 'available':0, 'used':0, 'free':0, 'percent':0.0}
 
+    @staticmethod
+    def _memory_breakdown(mem):
+        # Only some platforms report these (all of them on Linux)
+        breakdown = {}
+        for field in ('cached', 'buffers', 'shared', 'slab'):
+            value = getattr(mem, field, None)
+            if value is not None:
+                breakdown[field] = value
+                breakdown[f'{field}_gb'] = value / (1024 ** 3)
+        return breakdown
+
+    @traced('SystemMonitor.get_pressure')
+    def get_pressure(self):
+        # Linux pressure stall information: share of time tasks were stalled
+        # on each resource, plus the cumulative stall time in microseconds.
+        # Empty where the kernel has no PSI (pre-4.20, Windows, macOS).
+        pressure = {}
+        for resource in ('cpu', 'memory', 'io'):
+            try:
+                with open(f'/proc/pressure/{resource}') as f:
+                    lines = f.read().splitlines()
+            except OSError:
+                continue
+            pressure[resource] = {}
+            for line in lines:
+                kind, _, fields = line.partition(' ')
+                try:
+                    values = dict(field.split('=') for field in fields.split())
+                    pressure[resource][kind] = {
+                        'avg10': float(values['avg10']),
+                        'avg60': float(values['avg60']),
+                        'avg300': float(values['avg300']),
+                        'total': int(values['total'])
+                    }
+                except (KeyError, ValueError):
+                    continue
+        return pressure
+
+    def get_load_average(self):
+        try:
+            return list(os.getloadavg())
+        except (AttributeError, OSError):
+            pass
+        try:
+            return list(psutil.getloadavg())
+        except Exception:
+            return [0.0, 0.0, 0.0]
+
+    def get_cpu_counters(self):
+        try:
+            stats = psutil.cpu_stats()
+            return {
+                'ctx_switches': stats.ctx_switches,
+                'interrupts': stats.interrupts,
+                'soft_interrupts': stats.soft_interrupts
+            }
+        except Exception:
+            return {}
+
+    def get_vm_counters(self):
+        # Cumulative swap traffic (bytes) and page faults. One read of
+        # /proc/vmstat on Linux; swap totals from psutil elsewhere.
+        try:
+            with open('/proc/vmstat') as f:
+                vmstat = dict(line.split() for line in f if line.startswith(('pswp', 'pgfault', 'pgmajfault')))
+            page = os.sysconf('SC_PAGE_SIZE')
+            major = int(vmstat['pgmajfault'])
+            return {
+                'swap_in_bytes': int(vmstat['pswpin']) * page,
+                'swap_out_bytes': int(vmstat['pswpout']) * page,
+                'major_faults': major,
+                'minor_faults': int(vmstat['pgfault']) - major
+            }
+        except (OSError, KeyError, ValueError, AttributeError):
+            pass
+        try:
+            swap = psutil.swap_memory()
+            return {'swap_in_bytes': swap.sin, 'swap_out_bytes': swap.sout}
+        except Exception:
+            return {}
+
+    def get_process_major_faults(self, pid):
+        # Field 12 of /proc/<pid>/stat, counted after the parenthesised name
+        # because the name itself may contain spaces.
+        try:
+            with open(f'/proc/{pid}/stat', 'rb') as f:
+                data = f.read()
+            return int(data[data.rindex(b')') + 2:].split()[9])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def get_cgroup_usage(self):
+        # CPU against cpu.max, memory against memory.max/high and throttling
+        # for the cgroup CoreSense runs in. None without cgroup v2.
+        from core.cgroups import get_cgroup_monitor
+        try:
+            return get_cgroup_monitor().sample()
+        except (OSError, ValueError):
+            return None
+
+    def get_cgroups(self, root='/', max_depth=3):
+        from core.cgroups import get_cgroup_monitor
+        try:
+            return get_cgroup_monitor().list_groups(root, max_depth=max_depth)
+        except (OSError, ValueError):
+            return []
+
+    @traced('SystemMonitor.get_disk_usage')
     def get_disk_usage(self, path='/'):
         try:
             disk = psutil.disk_usage(path)
@@ -77,6 +210,7 @@ class SystemMonitor:
         except Exception:
             return {}
 
+    @traced('SystemMonitor.get_top_processes')
     def get_top_processes(self, limit=50, sort_by='memory_percent'):
         try:
             procs = []
@@ -89,10 +223,13 @@ class SystemMonitor:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             procs.sort(key=lambda x: x.get(sort_by,0), reverse=True)
+            get_profiler().count('psutil.process_scans')
+            get_profiler().count('psutil.process_queries', len(procs))
             return procs[:limit]
         except Exception:
             return []
 
+    @traced('SystemMonitor.search_processes')
     def search_processes(self, search_term):
         try:
             s = (search_term or "").lower()
@@ -107,29 +244,144 @@ class SystemMonitor:
                         matches.append(info)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
+            get_profiler().count('psutil.process_scans')
             return matches
         except Exception:
             return []
 
-    def kill_process(self, pid):
-        try:
-            if pid in (0, 4):
-                return False, 
-            proc = psutil.Process(pid)
-            name = proc.name()
+    def kill_process(self, pid, grace=3.0):
+        report = self.kill_processes([pid], grace=grace)
+        outcome = report.get(pid, {'outcome': 'not_found', 'name': ''})
+        name = outcome.get('name') or ''
+        if outcome['outcome'] in ('terminated', 'killed', 'already_exited'):
+            return True, f"{outcome['outcome'].replace('_', ' ').capitalize()}: {name} (PID {pid})"
+        if outcome['outcome'] == 'protected':
+            return False, "Protected system process"
+        if outcome['outcome'] == 'access_denied':
+            return False, "Permission denied"
+        if outcome['outcome'] == 'not_found':
+            return False, "Process not found"
+        return False, outcome.get('error') or f"Process {pid} did not exit"
+
+    @traced('SystemMonitor.kill_processes')
+    def kill_processes(self, pids, grace=3.0, kill_timeout=2.0, groups=False):
+        report = {}
+        procs = []
+        group_ids = set()
+        group_of = {}
+        protected = {0, 4, os.getpid()}
+        own_group = os.getpgid(0) if hasattr(os, 'getpgid') else None
+
+        for pid in dict.fromkeys(pids):
+            if pid in protected:
+                report[pid] = {'name': '', 'outcome': 'protected', 'returncode': None}
+                continue
+            try:
+                proc = psutil.Process(pid)
+                report[pid] = {'name': proc.name(), 'outcome': 'pending', 'returncode': None}
+                procs.append(proc)
+            except psutil.NoSuchProcess:
+                report[pid] = {'name': '', 'outcome': 'not_found', 'returncode': None}
+                continue
+            except (psutil.AccessDenied, OSError):
+                report[pid] = {'name': '', 'outcome': 'access_denied', 'returncode': None}
+                continue
+            if groups and own_group is not None:
+                # Without a group the process is still signalled on its own
+                try:
+                    pgid = os.getpgid(pid)
+                except OSError:
+                    continue
+                if pgid != own_group:
+                    group_ids.add(pgid)
+                    group_of[pid] = pgid
+
+        if group_ids:
+            # Only for the report and the wait: the signals go to the whole
+            # group with killpg, so members forked after this still get them
+            seen = {p.pid for p in procs}
+            for proc in psutil.process_iter(['pid', 'name']):
+                try:
+                    if proc.pid in seen or proc.pid in protected:
+                        continue
+                    pgid = os.getpgid(proc.pid)
+                    if pgid in group_ids:
+                        report[proc.pid] = {'name': proc.info.get('name') or '', 'outcome': 'pending', 'returncode': None}
+                        procs.append(proc)
+                        group_of[proc.pid] = pgid
+                        seen.add(proc.pid)
+                except (psutil.NoSuchProcess, OSError):
+                    continue
+
+        # Signal everything first, then wait on the whole set at once, so the
+        # batch costs one grace period rather than one per process.
+        signalled = []
+        group_errors = self._signal_groups(group_ids, signal.SIGTERM)
+        for proc in procs:
+            pgid = group_of.get(proc.pid)
+            if pgid is not None:
+                error = group_errors.get(pgid)
+                if error is None:
+                    signalled.append(proc)
+                else:
+                    report[proc.pid]['outcome'] = error
+                continue
             try:
                 proc.terminate()
-                return True, f"Terminated: {name} (PID {pid})"
+                signalled.append(proc)
+            except psutil.NoSuchProcess:
+                report[proc.pid]['outcome'] = 'already_exited'
             except psutil.AccessDenied:
-                return False, "Permission denied"
+                report[proc.pid]['outcome'] = 'access_denied'
             except Exception as e:
-                return False, str(e)
-        except psutil.NoSuchProcess:
-            return False, "Process not found"
-        except psutil.AccessDenied:
-            return False, "Permission denied"
-        except Exception as e:
-            return False, str(e)
+                report[proc.pid].update(outcome='error', error=str(e))
+
+        def on_terminate(proc):
+            report[proc.pid]['returncode'] = proc.returncode
+
+        gone, alive = psutil.wait_procs(signalled, timeout=grace, callback=on_terminate)
+        for proc in gone:
+            report[proc.pid]['outcome'] = 'terminated'
+
+        # A group that still exists gets SIGKILL even if every member we
+        # listed is gone: anything it forked meanwhile goes with it
+        live_groups = {pgid for pgid in group_ids if not self._signal_groups([pgid], 0)}
+        if alive or live_groups:
+            group_errors = self._signal_groups(live_groups, signal.SIGKILL)
+            for proc in alive:
+                pgid = group_of.get(proc.pid)
+                if pgid is not None:
+                    if group_errors.get(pgid) == 'access_denied':
+                        report[proc.pid]['outcome'] = 'access_denied'
+                    continue
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except psutil.AccessDenied:
+                    report[proc.pid]['outcome'] = 'access_denied'
+            gone, alive = psutil.wait_procs(alive, timeout=kill_timeout, callback=on_terminate)
+            for proc in gone:
+                if report[proc.pid]['outcome'] == 'pending':
+                    report[proc.pid]['outcome'] = 'killed'
+            for proc in alive:
+                if report[proc.pid]['outcome'] == 'pending':
+                    report[proc.pid]['outcome'] = 'survived'
+
+        return report
+
+    @staticmethod
+    def _signal_groups(group_ids, sig):
+        # Returns {pgid: outcome} for the groups that could not be signalled
+        errors = {}
+        for pgid in group_ids:
+            try:
+                os.killpg(pgid, sig)
+            except ProcessLookupError:
+                errors[pgid] = 'already_exited'
+            except PermissionError:
+                errors[pgid] = 'access_denied'
+        return errors
 
     def lower_priority(self, pid):
         try:
@@ -149,11 +401,79 @@ class SystemMonitor:
         except Exception:
             return False
 
-    def get_heavy_processes(self, cpu_limit=40, ram_limit=500):
+    def set_nice(self, pid, value=10):
+        try:
+            if pid in (0, 4):
+                return False
+            psutil.Process(pid).nice(value)
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        except Exception:
+            return False
+
+    def set_ionice(self, pid, ioclass='idle', value=None):
+        try:
+            if pid in (0, 4) or not hasattr(psutil.Process, 'ionice'):
+                return False
+            proc = psutil.Process(pid)
+            if platform.system() == "Windows":
+                levels = {'idle': psutil.IOPRIO_VERYLOW, 'best-effort': psutil.IOPRIO_LOW}
+                proc.ionice(levels.get(ioclass, psutil.IOPRIO_NORMAL))
+            else:
+                classes = {'idle': psutil.IOPRIO_CLASS_IDLE, 'best-effort': psutil.IOPRIO_CLASS_BE,
+                           'realtime': psutil.IOPRIO_CLASS_RT, 'none': psutil.IOPRIO_CLASS_NONE}
+                if ioclass == 'best-effort':
+                    proc.ionice(classes[ioclass], value if value is not None else 7)
+                else:
+                    proc.ionice(classes[ioclass])
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError):
+            return False
+        except Exception:
+            return False
+
+    def set_affinity(self, pid, cpus):
+        try:
+            if pid in (0, 4) or not hasattr(psutil.Process, 'cpu_affinity'):
+                return False
+            psutil.Process(pid).cpu_affinity(list(cpus))
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError):
+            return False
+        except Exception:
+            return False
+
+    def suspend_process(self, pid):
+        try:
+            if pid in (0, 4) or pid == os.getpid():
+                return False
+            psutil.Process(pid).suspend()
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        except Exception:
+            return False
+
+    def resume_process(self, pid):
+        try:
+            psutil.Process(pid).resume()
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+        except Exception:
+            return False
+
+    @traced('SystemMonitor.get_heavy_processes')
+    def get_heavy_processes(self, cpu_limit=40, ram_limit=500, window=None):
         heavy = []
         skip_pids = {0,4}
         skip_names = {"system", "system idle process", "idle", "registry", "smss.exe"}
 
+        if window is not None and window.is_warm():
+            return window.get_heavy(cpu_limit, ram_limit, limit=10,
+                                    skip_pids=skip_pids, skip_names=skip_names)
+
         for proc in psutil.process_iter(['pid','name']):
             try:
                 pid = proc.pid
@@ -181,27 +501,14 @@ class SystemMonitor:
             except Exception:
                 continue
 
+        get_profiler().count('psutil.process_scans')
         heavy.sort(key=lambda x: (x['cpu'], x['ram_mb']), reverse=True)
         return heavy[:10]
 
-    def clear_temp_files(self):
+    def clear_temp_files(self, min_age_minutes=60, dry_run=False, progress=None):
+        from core.temp_cleaner import TempCleaner
         try:
-            import tempfile, os, shutil
-            temp_path = tempfile.gettempdir()
-            cleaned = 0
-            for entry in os.listdir(temp_path):
-                full = os.path.join(temp_path, entry)
-                try:
-                    if os.path.isfile(full) or os.path.islink(full):
-                        os.remove(full)
-                        cleaned += 1
-                    elif os.path.isdir(full):
-                        shutil.rmtree(full, ignore_errors=True)
-                        cleaned += 1
-                except PermissionError:
-                    continue
-                except Exception:
-                    continue
-            return True
-        except Exception:
+            return TempCleaner(min_age_minutes=min_age_minutes, dry_run=dry_run).run(progress)
+        except Exception as e:
+            print(f"Temp cleanup error: {e}")
             return False
@@ -0,0 +1,249 @@
+import errno
+import os
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+# Where the OS allows it the walk goes by directory file descriptor: each
+# directory is opened relative to its parent with O_NOFOLLOW and checked
+# against the (st_dev, st_ino) seen when it was listed, and files are
+# unlinked relative to that descriptor. Someone swapping a directory in
+# /tmp for a symlink mid-scan can then not steer the cleaner outside root.
+_FD_WALK = (os.open in os.supports_dir_fd and os.unlink in os.supports_dir_fd
+            and os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY') and hasattr(os, 'O_NOFOLLOW'))
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+
+
+def _open_file_ids(root):
+    # (st_dev, st_ino) of every file under root that some process holds
+    # open. On Linux this reads /proc/<pid>/fd directly, which is far
+    # cheaper than psutil's open_files() for every process.
+    root = os.path.realpath(root)
+    prefix = root.rstrip(os.sep) + os.sep
+    ids = set()
+    if os.path.isdir('/proc/self/fd'):
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            fd_dir = f'/proc/{pid}/fd'
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    if os.readlink(f'{fd_dir}/{fd}').startswith(prefix):
+                        st = os.stat(f'{fd_dir}/{fd}')
+                        ids.add((st.st_dev, st.st_ino))
+                except OSError:
+                    continue
+        return ids
+
+    for proc in psutil.process_iter():
+        try:
+            for f in proc.open_files():
+                if f.path.startswith(prefix):
+                    st = os.stat(f.path)
+                    ids.add((st.st_dev, st.st_ino))
+        except (psutil.Error, OSError):
+            continue
+    return ids
+
+
+class TempCleaner:
+    # Walks the temp directory with os.scandir, one task per directory on a
+    # thread pool. Files younger than min_age_minutes (newest of atime, mtime
+    # and ctime, as systemd-tmpfiles does) or held open by a process are left
+    # alone; directories are removed afterwards, deepest first, once empty.
+    # A dry run predicts the same thing from how many entries each scanned
+    # directory keeps, so a directory is only counted if the real run would
+    # be able to remove it. Directories are named by their path components
+    # under root, never by a joined path string.
+
+    def __init__(self, root=None, min_age_minutes=60, workers=8, dry_run=False, skip_open=True,
+                 progress_interval=0.25):
+        self.root = root or tempfile.gettempdir()
+        self.min_age = min_age_minutes * 60
+        self.workers = workers
+        self.dry_run = dry_run
+        self.skip_open = skip_open
+        self.progress_interval = progress_interval
+        self.stats = {'files': 0, 'dirs': 0, 'bytes': 0, 'scanned': 0,
+                      'skipped_young': 0, 'skipped_open': 0, 'skipped_denied': 0, 'errors': 0}
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._done = threading.Event()
+        self._dirs = []
+        self._remaining = {}
+        self._open = set()
+        self._cutoff = 0.0
+        self._root_fd = None
+        self._pool = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self, progress=None):
+        start = time.perf_counter()
+        self._cutoff = time.time() - self.min_age
+        if self.skip_open:
+            self._open = _open_file_ids(self.root)
+        if _FD_WALK:
+            # root itself may be a symlink (/tmp on macOS); nothing below it
+            self._root_fd = os.open(self.root, os.O_RDONLY | os.O_DIRECTORY)
+
+        reporter = None
+        if progress is not None:
+            reporter = threading.Thread(target=self._report, args=(progress,), daemon=True)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                self._pool = pool
+                self._submit((), None)
+                if reporter is not None:
+                    reporter.start()
+                self._done.wait()
+            self._pool = None
+            self._remove_dirs()
+        finally:
+            if self._root_fd is not None:
+                os.close(self._root_fd)
+                self._root_fd = None
+
+        result = dict(self.stats, seconds=time.perf_counter() - start, dry_run=self.dry_run, root=self.root)
+        if reporter is not None:
+            reporter.join()
+            progress(dict(result, finished=True))
+        return result
+
+    def _remove_dirs(self):
+        # Children before parents, so a directory emptied by this run goes too
+        for parts in sorted(self._dirs, key=len, reverse=True):
+            if self._cancel.is_set():
+                break
+            if self.dry_run:
+                if self._remaining.get(parts) != 0:
+                    continue
+            else:
+                try:
+                    parent = self._open_dir(parts[:-1])
+                except OSError:
+                    continue
+                try:
+                    self._remove(parent, parts[-1], os.rmdir)
+                except OSError:
+                    continue
+                finally:
+                    self._close_dir(parent)
+            self.stats['dirs'] += 1
+            if parts[:-1] in self._remaining:
+                self._remaining[parts[:-1]] -= 1
+
+    def _open_dir(self, parts, expect=None):
+        # Returns a descriptor (or, without dir_fd support, a path) for
+        # root/parts, opening one component at a time without following
+        # symlinks; expect is the (st_dev, st_ino) the directory was listed as
+        if not _FD_WALK:
+            return os.path.join(self.root, *parts)
+        fd = os.dup(self._root_fd)
+        try:
+            for name in parts:
+                child = os.open(name, _DIR_FLAGS, dir_fd=fd)
+                os.close(fd)
+                fd = child
+            if expect is not None:
+                st = os.fstat(fd)
+                if (st.st_dev, st.st_ino) != expect:
+                    raise OSError(errno.ESTALE, "directory replaced during scan", os.path.join(*parts))
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    @staticmethod
+    def _close_dir(handle):
+        if _FD_WALK:
+            os.close(handle)
+
+    @staticmethod
+    def _remove(handle, name, remove):
+        if _FD_WALK:
+            remove(name, dir_fd=handle)
+        else:
+            remove(os.path.join(handle, name))
+
+    def _report(self, progress):
+        while not self._done.wait(self.progress_interval):
+            with self._lock:
+                snapshot = dict(self.stats)
+            progress(dict(snapshot, finished=False))
+
+    def _submit(self, parts, expect):
+        with self._lock:
+            self._pending += 1
+        self._pool.submit(self._scan, parts, expect)
+
+    def _scan(self, parts, expect):
+        files = young = busy = denied = errors = freed = scanned = subdirs = 0
+        handle = None
+        try:
+            if self._cancel.is_set():
+                return
+            handle = self._open_dir(parts, expect)
+            with os.scandir(handle) as it:
+                for entry in it:
+                    scanned += 1
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        if stat.S_ISDIR(st.st_mode):
+                            # Stays until the removal pass takes it out
+                            subdirs += 1
+                            child = parts + (entry.name,)
+                            if max(st.st_mtime, st.st_ctime) < self._cutoff:
+                                self._dirs.append(child)
+                            self._submit(child, (st.st_dev, st.st_ino) if _FD_WALK else None)
+                            continue
+                        if max(st.st_atime, st.st_mtime, st.st_ctime) >= self._cutoff:
+                            young += 1
+                            continue
+                        if (st.st_dev, st.st_ino) in self._open:
+                            busy += 1
+                            continue
+                        if not self.dry_run:
+                            self._remove(handle, entry.name, os.unlink)
+                        files += 1
+                        freed += getattr(st, 'st_blocks', 0) * 512 or st.st_size
+                    except PermissionError:
+                        # Windows refuses to delete files that are still open;
+                        # elsewhere it is another user's file in a sticky dir
+                        if os.name == 'nt':
+                            busy += 1
+                        else:
+                            denied += 1
+                    except OSError:
+                        errors += 1
+            # Only a complete listing says whether the directory would empty
+            self._remaining[parts] = young + busy + denied + errors + subdirs
+        except OSError:
+            errors += 1
+        finally:
+            if handle is not None:
+                self._close_dir(handle)
+            with self._lock:
+                s = self.stats
+                s['files'] += files
+                s['bytes'] += freed
+                s['scanned'] += scanned
+                s['skipped_young'] += young
+                s['skipped_open'] += busy
+                s['skipped_denied'] += denied
+                s['errors'] += errors
+                self._pending -= 1
+                if self._pending == 0:
+                    self._done.set()
@@ -0,0 +1,302 @@
+import json
+import os
+import signal
+import threading
+import time
+
+import psutil
+
+from core.system_monitor import SystemMonitor
+
+# Processes the duty cycle may have left stopped; rewritten whenever the set
+# changes and removed once they have all been continued
+THROTTLE_STATE_PATH = os.path.join(os.path.dirname(__file__), '..', 'throttled_pids.json')
+
+
+def parse_cpu_list(text):
+    # "0-1,3" -> [0, 1, 3]
+    cpus = set()
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        if '-' in part:
+            lo, hi = part.split('-', 1)
+            cpus.update(range(int(lo), int(hi) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def default_contain_cpus():
+    # The upper half of the cores, leaving the lower ones to everything else
+    count = psutil.cpu_count() or 1
+    if count == 1:
+        return "0"
+    return f"{count // 2}-{count - 1}" if count > 2 else f"{count - 1}"
+
+
+def resume_leftover_throttled(path=THROTTLE_STATE_PATH):
+    # A crash or SIGKILL mid-cycle leaves throttled processes SIGSTOPped;
+    # continue the ones that are still the same process
+    try:
+        with open(path, 'r') as f:
+            leftover = json.load(f)
+    except (OSError, ValueError):
+        return []
+    resumed = []
+    for item in leftover:
+        try:
+            proc = psutil.Process(item['pid'])
+            if proc.create_time() == item['create_time']:
+                proc.resume()
+                resumed.append(item['pid'])
+        except (psutil.Error, KeyError, TypeError):
+            continue
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return resumed
+
+
+class _Tracked:
+    def __init__(self, proc):
+        self.pid = proc.pid
+        self.name = proc.name()
+        self.create_time = proc.create_time()
+        self.nice = None
+        self.ionice = None
+        self.affinity = None
+        self.suspended = False
+        self.share = None
+
+
+class ThrottleManager:
+    # Every change goes through here so the original nice, ionice and
+    # affinity are captured before the first modification and a single
+    # restore_all() can put everything back. Affinity, ionice (idle and
+    # best-effort) and SIGSTOP/SIGCONT are all reversible without root for
+    # the user's own processes; lowering nice back is not, so restoring a
+    # renice may be refused by the kernel and is reported as such.
+
+    def __init__(self, period=0.2, state_path=THROTTLE_STATE_PATH):
+        self.period = period
+        self.state_path = state_path
+        self.sm = SystemMonitor()
+        self._tracked = {}
+        self._lock = threading.Lock()
+        self._duty_thread = None
+        self._duty_stop = threading.Event()
+
+    def _track(self, pid):
+        entry = self._tracked.get(pid)
+        try:
+            proc = psutil.Process(pid)
+            if entry is not None and entry.create_time == proc.create_time():
+                return entry, proc
+            entry = self._tracked[pid] = _Tracked(proc)
+            return entry, proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None, None
+
+    def set_nice(self, pid, value=10):
+        with self._lock:
+            entry, proc = self._track(pid)
+            if entry is None:
+                return False
+            if entry.nice is None:
+                try:
+                    entry.nice = proc.nice()
+                except psutil.Error:
+                    return False
+            return self.sm.set_nice(pid, value)
+
+    def set_ionice(self, pid, ioclass='idle', value=None):
+        with self._lock:
+            entry, proc = self._track(pid)
+            if entry is None or not hasattr(proc, 'ionice'):
+                return False
+            if entry.ionice is None:
+                try:
+                    entry.ionice = proc.ionice()
+                except psutil.Error:
+                    return False
+            return self.sm.set_ionice(pid, ioclass, value)
+
+    def set_affinity(self, pid, cpus):
+        with self._lock:
+            entry, proc = self._track(pid)
+            if entry is None or not hasattr(proc, 'cpu_affinity'):
+                return False
+            if entry.affinity is None:
+                try:
+                    entry.affinity = proc.cpu_affinity()
+                except psutil.Error:
+                    return False
+            return self.sm.set_affinity(pid, cpus)
+
+    def suspend(self, pid):
+        with self._lock:
+            entry, _ = self._track(pid)
+            if entry is None:
+                return False
+            entry.suspended = self.sm.suspend_process(pid)
+            return entry.suspended
+
+    def throttle(self, pid, share=0.25):
+        if not hasattr(signal, 'SIGSTOP') or pid == os.getpid():
+            return False
+        with self._lock:
+            entry, _ = self._track(pid)
+            if entry is None:
+                return False
+            # Signal 0 runs the kernel's permission check without sending
+            # anything; another user's process would otherwise be reported as
+            # throttled while every SIGSTOP fails
+            try:
+                os.kill(pid, 0)
+            except OSError:
+                return False
+            entry.share = min(max(float(share), 0.05), 0.95)
+            # The duty thread clears _duty_thread under this lock when it
+            # exits, so a pid added here is never left to a finishing thread
+            if self._duty_thread is None or not self._duty_thread.is_alive():
+                self._duty_stop.clear()
+                self._duty_thread = threading.Thread(target=self._duty_cycle, daemon=True)
+                self._duty_thread.start()
+            return True
+
+    def contain(self, pid, cpus=None, ioclass='idle', share=None):
+        results = []
+        if cpus:
+            results.append(self.set_affinity(pid, cpus))
+        if ioclass:
+            results.append(self.set_ionice(pid, ioclass))
+        if share:
+            results.append(self.throttle(pid, share))
+        return bool(results) and any(results)
+
+    def _duty_cycle(self):
+        # Each period every throttled process runs for share * period, then
+        # is stopped until the next period starts.
+        saved = None
+        while not self._duty_stop.is_set():
+            with self._lock:
+                schedule = sorted((e.share, e.pid) for e in self._tracked.values() if e.share)
+                if not schedule:
+                    if self._duty_thread is threading.current_thread():
+                        self._duty_thread = None
+                    self._save_state([])
+                    return
+                state = sorted((e.pid, e.create_time) for e in self._tracked.values() if e.share)
+            if state != saved:
+                self._save_state(state)
+                saved = state
+            start = time.monotonic()
+            for _, pid in schedule:
+                self._signal(pid, signal.SIGCONT)
+            for share, pid in schedule:
+                delay = start + share * self.period - time.monotonic()
+                if delay > 0 and self._duty_stop.wait(delay):
+                    break
+                self._signal(pid, signal.SIGSTOP)
+            delay = start + self.period - time.monotonic()
+            if delay > 0:
+                self._duty_stop.wait(delay)
+        with self._lock:
+            pids = [e.pid for e in self._tracked.values() if e.share]
+        for pid in pids:
+            self._signal(pid, signal.SIGCONT)
+        self._save_state([])
+
+    def _save_state(self, state):
+        try:
+            if not state:
+                if os.path.exists(self.state_path):
+                    os.remove(self.state_path)
+                return
+            tmp = self.state_path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump([{'pid': pid, 'create_time': created} for pid, created in state], f)
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            print(f"Throttle state save error: {e}")
+
+    def _signal(self, pid, sig):
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            with self._lock:
+                entry = self._tracked.get(pid)
+                if entry is not None:
+                    entry.share = None
+        except OSError:
+            pass
+
+    def get_tracked(self):
+        with self._lock:
+            return [{
+                'pid': e.pid,
+                'name': e.name,
+                'nice': e.nice is not None,
+                'ionice': e.ionice is not None,
+                'affinity': e.affinity is not None,
+                'suspended': e.suspended,
+                'share': e.share
+            } for e in self._tracked.values()]
+
+    def stop_throttling(self):
+        # Ends the duty cycle and leaves every throttled process running
+        self._duty_stop.set()
+        if self._duty_thread is not None:
+            self._duty_thread.join(timeout=self.period * 2 + 1)
+            self._duty_thread = None
+
+    def restore_all(self):
+        self.stop_throttling()
+
+        report = []
+        with self._lock:
+            tracked = list(self._tracked.values())
+            self._tracked = {}
+
+        for entry in tracked:
+            try:
+                proc = psutil.Process(entry.pid)
+                if proc.create_time() != entry.create_time:
+                    raise psutil.NoSuchProcess(entry.pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                report.append({'pid': entry.pid, 'name': entry.name, 'restored': [], 'failed': ['exited']})
+                continue
+
+            restored, failed = [], []
+            steps = []
+            if entry.share or entry.suspended:
+                steps.append(('resume', proc.resume))
+            if entry.affinity is not None:
+                steps.append(('affinity', lambda: proc.cpu_affinity(entry.affinity)))
+            if entry.ionice is not None:
+                steps.append(('ionice', lambda: proc.ionice(entry.ionice.ioclass, entry.ionice.value)
+                              if hasattr(entry.ionice, 'ioclass') else proc.ionice(entry.ionice)))
+            if entry.nice is not None:
+                steps.append(('nice', lambda: proc.nice(entry.nice)))
+            for label, step in steps:
+                try:
+                    step()
+                    restored.append(label)
+                except (psutil.Error, ValueError, OSError):
+                    failed.append(label)
+            report.append({'pid': entry.pid, 'name': entry.name, 'restored': restored, 'failed': failed})
+        return report
+
+
+_throttle_manager = None
+_throttle_manager_lock = threading.Lock()
+
+
+def get_throttle_manager():
+    global _throttle_manager
+    with _throttle_manager_lock:
+        if _throttle_manager is None:
+            _throttle_manager = ThrottleManager()
+        return _throttle_manager
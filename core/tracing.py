@@ -0,0 +1,172 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Chrome trace event format (chrome://tracing, ui.perfetto.dev). Disabled
+# unless main.py gets --trace PATH or CORESENSE_TRACE is set; while disabled
+# span() returns a shared no-op context and traced() adds one global check.
+_tracer = None
+_NULL_SPAN = nullcontext()
+
+
+class Tracer:
+    # Events stream to the file as a JSON array: a background thread appends
+    # what has been buffered every flush_interval seconds (or sooner once
+    # flush_events are waiting), so memory holds one batch and a crash loses
+    # at most that batch. close() writes the closing bracket; chrome://tracing
+    # and Perfetto also load a file cut off without it.
+
+    def __init__(self, path, max_events=1_000_000, flush_events=10_000, flush_interval=5.0):
+        self.path = path
+        self.max_events = max_events
+        self.flush_events = flush_events
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._accepted = 0
+        self._pending = []
+        self._threads = {}
+        self._flow_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._pid = os.getpid()
+        self._file = open(path, 'w')
+        self._file.write('[')
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='tracing.flush', daemon=True)
+        self._thread.start()
+
+    def _add(self, event):
+        thread = threading.current_thread()
+        event['pid'] = self._pid
+        event['tid'] = thread.ident
+        with self._lock:
+            if self._closed:
+                return
+            if self._accepted >= self.max_events:
+                self.dropped += 1
+                return
+            if thread.ident not in self._threads:
+                self._threads[thread.ident] = thread.name
+                self._pending.append({'name': 'thread_name', 'ph': 'M', 'pid': self._pid,
+                                      'tid': thread.ident, 'args': {'name': thread.name}})
+            self._pending.append(event)
+            self._accepted += 1
+            if len(self._pending) >= self.flush_events:
+                self._wake.set()
+
+    def complete(self, name, start, duration, cat='coresense', args=None):
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6}
+        if args:
+            event['args'] = args
+        self._add(event)
+
+    def flow_start(self, name):
+        # Arrow from here to wherever flow_end(id) runs, e.g. a worker
+        # thread handing a widget update to the Tk main loop
+        flow_id = next(self._flow_ids)
+        self._add({'name': name, 'cat': 'handoff', 'ph': 's', 'id': flow_id, 'ts': time.perf_counter() * 1e6})
+        return flow_id
+
+    def flow_end(self, name, flow_id):
+        self._add({'name': name, 'cat': 'handoff', 'ph': 'f', 'bp': 'e', 'id': flow_id,
+                   'ts': time.perf_counter() * 1e6})
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except (OSError, ValueError) as e:
+                print(f"Trace write error: {e}")
+                return
+
+    def flush(self):
+        with self._file_lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        # Caller holds _file_lock: batches are taken and written under it, so
+        # they reach the file in order and none is taken after close()
+        if self._file.closed:
+            return
+        with self._lock:
+            events, self._pending = self._pending, []
+        if not events:
+            return
+        self._file.write(('' if self.written == 0 else ',') +
+                         ','.join('\n' + json.dumps(e) for e in events))
+        self._file.flush()
+        self.written += len(events)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        with self._file_lock:
+            self._write_pending()
+            if not self._file.closed:
+                self._file.write('\n]\n')
+                self._file.close()
+        return self.written
+
+
+def enable(path):
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+        atexit.register(_write_on_exit)
+    return _tracer
+
+
+def _write_on_exit():
+    if _tracer is not None:
+        try:
+            count = _tracer.close()
+            dropped = f", {_tracer.dropped} dropped over the cap" if _tracer.dropped else ""
+            print(f"Trace: {count} events written to {_tracer.path}{dropped}")
+        except OSError as e:
+            print(f"Trace write error: {e}")
+
+
+def get_tracer():
+    return _tracer
+
+
+def span(name, **args):
+    if _tracer is None:
+        return _NULL_SPAN
+    return _span(name, args)
+
+
+@contextmanager
+def _span(name, args):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _tracer.complete(name, start, time.perf_counter() - start, args=args or None)
+
+
+def traced(name):
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _tracer.complete(name, start, time.perf_counter() - start)
+        return wrapper
+    return decorate
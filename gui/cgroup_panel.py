@@ -0,0 +1,148 @@
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+import psutil
+
+from core.cgroups import get_cgroup_monitor
+
+
+def _format_mb(value):
+    return f"{value / 1024 ** 2:,.0f} MB" if value is not None else "-"
+
+
+def format_cgroup_usage(cgroup):
+    parts = []
+    cores = cgroup.get('cpu_cores_used')
+    if cores is not None:
+        if cgroup['cpu_quota_cores']:
+            parts.append(f"CPU {cores:.2f} / {cgroup['cpu_quota_cores']:.2f} cores "
+                         f"({cgroup['cpu_percent_of_quota']:.0f}%)")
+        else:
+            parts.append(f"CPU {cores:.2f} cores (no quota)")
+    if cgroup.get('memory_current') is not None:
+        limit = cgroup['memory_max']
+        if limit:
+            parts.append(f"Mem {_format_mb(cgroup['memory_current'])} / {_format_mb(limit)} "
+                         f"({cgroup['memory_percent_of_max']:.0f}%)")
+        else:
+            parts.append(f"Mem {_format_mb(cgroup['memory_current'])} (no limit)")
+        if cgroup['memory_high']:
+            parts.append(f"high {_format_mb(cgroup['memory_high'])}")
+    if cgroup.get('throttled_percent') is not None:
+        parts.append(f"throttled {cgroup['throttled_percent']:.0f}% of periods")
+    if cgroup.get('oom_kills'):
+        parts.append(f"{cgroup['oom_kills']} OOM kills")
+    return " · ".join(parts) if parts else "no accounting data"
+
+
+class CgroupWindow:
+    def __init__(self, parent, refresh_ms=2000):
+        self.cgroups = get_cgroup_monitor()
+        self.refresh_ms = refresh_ms
+        self.closed = False
+        self.members = {}
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Cgroups")
+        self.window.geometry("900x560")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        top = tk.Frame(self.window)
+        top.pack(fill='x', padx=8, pady=(6, 0))
+        self.status = tk.Label(top, text="", anchor='w')
+        self.status.pack(side='left', fill='x', expand=True)
+        # Which subtree to list; typing a path works too
+        self.root_var = tk.StringVar(value='/')
+        self.root_box = ttk.Combobox(top, textvariable=self.root_var, width=40)
+        self.root_box.pack(side='right')
+        tk.Label(top, text="Subtree:").pack(side='right', padx=(0, 4))
+        self.root_box.bind('<<ComboboxSelected>>', lambda e: self.tree.delete(*self.tree.get_children()))
+
+        frame = tk.Frame(self.window)
+        frame.pack(fill='both', expand=True, padx=8, pady=6)
+        columns = ('Procs', 'CPU', 'Quota', 'Throttled', 'Memory', 'Limit')
+        self.tree = ttk.Treeview(frame, columns=columns, show='tree headings', selectmode='browse')
+        self.tree.heading('#0', text='Cgroup')
+        self.tree.column('#0', width=330)
+        for col, width in zip(columns, (60, 80, 80, 80, 90, 110)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor='e')
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        self.tree.bind('<<TreeviewOpen>>', self.show_members)
+
+        if not self.cgroups.available:
+            self.status.config(text="cgroup v2 is not available on this system")
+            return
+        self.status.config(text=f"cgroup v2 at {self.cgroups.mount}, CoreSense is in {self.cgroups.own_path}")
+        subtrees = ['/']
+        own = self.cgroups.own_path
+        if own and own != '/':
+            subtrees += [os.path.dirname(own), own]
+        self.root_box['values'] = list(dict.fromkeys(subtrees))
+        self.refresh()
+
+    def refresh(self):
+        if self.closed:
+            return
+
+        root = '/' + self.root_var.get().strip().strip('/')
+
+        def worker():
+            groups = self.cgroups.list_groups(root)
+            try:
+                self.window.after(0, self._show, groups)
+            except tk.TclError:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show(self, groups):
+        if self.closed:
+            return
+        opened = {item for item in self.tree.get_children() if self.tree.item(item, 'open')}
+        self.tree.delete(*self.tree.get_children())
+        self.members = {g['path']: g['pids'] for g in groups}
+        for g in groups:
+            cores = g.get('cpu_cores_used')
+            quota = g.get('cpu_quota_cores')
+            limit = g.get('memory_max')
+            self.tree.insert('', 'end', iid=g['path'], text=g['path'], open=g['path'] in opened, values=(
+                g['processes'],
+                f"{cores:.2f}" if cores is not None else "-",
+                f"{quota:.2f}" if quota else "max",
+                f"{g['throttled_percent']:.0f}%" if g.get('throttled_percent') is not None else "-",
+                _format_mb(g.get('memory_current')),
+                _format_mb(limit) if limit else "max"
+            ))
+            if g['pids']:
+                # Placeholder so the row can be expanded; members load on open
+                self.tree.insert(g['path'], 'end', iid=f"{g['path']}#pids", text='')
+                if g['path'] in opened:
+                    self._fill_members(g['path'])
+        self.window.after(self.refresh_ms, self.refresh)
+
+    def show_members(self, event=None):
+        item = self.tree.focus()
+        if item and not item.endswith('#pids'):
+            self._fill_members(item)
+
+    def _fill_members(self, path):
+        placeholder = f"{path}#pids"
+        if not self.tree.exists(placeholder):
+            return
+        self.tree.delete(placeholder)
+        for pid in self.members.get(path, []):
+            try:
+                name = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            self.tree.insert(path, 'end', text=f"{pid}  {name}")
+
+    def close(self):
+        self.closed = True
+        self.window.destroy()
@@ -0,0 +1,148 @@
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, filedialog
+
+from core.disk_analyzer import get_disk_analyzer
+
+
+def _format_bytes(value):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if value < 1024 or unit == 'TB':
+            return f"{value:.1f} {unit}" if unit != 'B' else f"{value} B"
+        value /= 1024
+
+
+class DiskUsageWindow:
+    def __init__(self, parent, path):
+        self.analyzer = get_disk_analyzer()
+        self.current = os.path.abspath(path)
+        self.scanning = False
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Disk Usage")
+        self.window.geometry("760x520")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        bar = tk.Frame(self.window)
+        bar.pack(fill='x', padx=8, pady=6)
+        ttk.Button(bar, text="⬆ Up", width=6, command=self.go_up).pack(side='left')
+        self.path_var = tk.StringVar(value=self.current)
+        entry = ttk.Entry(bar, textvariable=self.path_var)
+        entry.pack(side='left', fill='x', expand=True, padx=5)
+        entry.bind('<Return>', lambda e: self.scan(self.path_var.get()))
+        ttk.Button(bar, text="Browse...", command=self.browse).pack(side='left', padx=2)
+        ttk.Button(bar, text="Scan", command=lambda: self.scan(self.path_var.get())).pack(side='left', padx=2)
+        ttk.Button(bar, text="Full Rescan", command=self.full_rescan).pack(side='left', padx=2)
+
+        self.status = tk.Label(self.window, text="", anchor='w')
+        self.status.pack(fill='x', padx=8)
+
+        frame = tk.Frame(self.window)
+        frame.pack(fill='both', expand=True, padx=8, pady=6)
+        columns = ('Size', 'Share', 'Files')
+        self.tree = ttk.Treeview(frame, columns=columns, show='tree headings', selectmode='browse')
+        self.tree.heading('#0', text='Name')
+        self.tree.column('#0', width=280)
+        self.tree.heading('Size', text='Size')
+        self.tree.column('Size', width=90, anchor='e')
+        self.tree.heading('Share', text='Share of parent')
+        self.tree.column('Share', width=220)
+        self.tree.heading('Files', text='Files')
+        self.tree.column('Files', width=90, anchor='e')
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        self.tree.bind('<Double-1>', self.open_selected)
+
+        self.scan(self.current)
+
+    def browse(self):
+        path = filedialog.askdirectory(parent=self.window, initialdir=self.current)
+        if path:
+            self.scan(path)
+
+    def go_up(self):
+        parent = os.path.dirname(self.current)
+        if parent and parent != self.current:
+            self.navigate(parent)
+
+    def open_selected(self, event=None):
+        selected = self.tree.selection()
+        if selected and selected[0] != self.current:
+            self.navigate(selected[0])
+
+    def navigate(self, path):
+        # Already-scanned directories come straight from the cache
+        if self.analyzer.get_total(path) is not None:
+            self.current = path
+            self.path_var.set(path)
+            self.show(path)
+        else:
+            self.scan(path)
+
+    def full_rescan(self):
+        self.analyzer.clear_cache()
+        self.scan(self.current)
+
+    def scan(self, path):
+        if self.scanning:
+            return
+        path = os.path.abspath(os.path.expanduser(path))
+        if not os.path.isdir(path):
+            self.status.config(text=f"Not a directory: {path}")
+            return
+        self.scanning = True
+        self.current = path
+        self.path_var.set(path)
+        self.status.config(text=f"Scanning {path}...")
+
+        def progress(stats):
+            try:
+                self.window.after(0, self._show_progress, stats)
+            except tk.TclError:
+                pass
+
+        def worker():
+            result = self.analyzer.scan(path, progress=progress)
+            try:
+                self.window.after(0, self._scan_done, path, result)
+            except tk.TclError:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_progress(self, stats):
+        if not stats.get('finished'):
+            self.status.config(text=f"Scanning... {stats['dirs']:,} directories "
+                                    f"({stats['listed']:,} listed, {stats['cached']:,} unchanged)")
+
+    def _scan_done(self, path, result):
+        self.scanning = False
+        if result is None:
+            self.status.config(text=f"Cannot read {path}")
+            return
+        self.status.config(text=f"{_format_bytes(result['bytes'])} in {result['files']:,} files, "
+                                f"{result['dirs']:,} directories  ({result['listed']:,} listed, "
+                                f"{result['cached']:,} unchanged, {result['errors']:,} unreadable) "
+                                f"in {result['seconds']:.1f}s")
+        self.show(path)
+
+    def show(self, path):
+        self.tree.delete(*self.tree.get_children())
+        total = self.analyzer.get_total(path)
+        if total is None:
+            return
+        rows = self.analyzer.children(path)
+        parent_bytes = total[0] or 1
+        for row in rows[:500]:
+            share = row['bytes'] / parent_bytes
+            bar = '█' * int(round(share * 20))
+            self.tree.insert('', 'end', iid=row['path'] if row['is_dir'] else path,
+                             text=('📁 ' if row['is_dir'] else '') + row['name'],
+                             values=(_format_bytes(row['bytes']), f"{bar} {share:.1%}", f"{row['files']:,}"))
+
+    def close(self):
+        self.analyzer.cancel()
+        self.window.destroy()
@@ -0,0 +1,109 @@
+import tkinter as tk
+from tkinter import ttk
+import time
+
+
+class FleetPanel:
+    def __init__(self, parent, aggregator):
+        self.parent = parent
+        self.aggregator = aggregator
+        self.detail_windows = {}
+        parent.configure(bg='#f2f6fc')
+
+        container = tk.Frame(parent, bg='#f2f6fc')
+        container.pack(fill='both', expand=True, padx=10, pady=5)
+
+        status_frame = ttk.LabelFrame(container, text=" Aggregator", padding=8)
+        status_frame.pack(fill='x', pady=(0, 10))
+        self.status_label = tk.Label(status_frame, text=f"Listening on port {aggregator.port}",
+                                     font=('Segoe UI', 10, 'bold'))
+        self.status_label.pack(side='left', padx=5)
+
+        list_frame = ttk.LabelFrame(container, text=" Fleet (double-click a host for details)", padding=5)
+        list_frame.pack(fill='both', expand=True)
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+
+        columns = ('Host', 'Address', 'Status', 'CPU %', 'Mem %', 'Processes', 'Last Seen', 'Traffic')
+        widths = (180, 120, 90, 70, 70, 80, 90, 110)
+        self.host_tree = ttk.Treeview(list_frame, columns=columns, show='headings', selectmode='browse')
+        for col, width in zip(columns, widths):
+            self.host_tree.heading(col, text=col)
+            self.host_tree.column(col, width=width, stretch=(col == 'Host'))
+        self.host_tree.tag_configure('offline', foreground='#95a5a6')
+        self.host_tree.tag_configure('hot', foreground='#e74c3c')
+
+        v_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.host_tree.yview)
+        self.host_tree.configure(yscrollcommand=v_scrollbar.set)
+        self.host_tree.grid(row=0, column=0, sticky='nsew')
+        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.host_tree.bind('<Double-1>', self.open_host_details)
+
+        self.refresh()
+
+    def refresh(self):
+        hosts = self.aggregator.get_hosts()
+        now = time.time()
+        for item in self.host_tree.get_children():
+            self.host_tree.delete(item)
+        for h in hosts:
+            tags = ()
+            if not h['connected']:
+                tags = ('offline',)
+            elif h['cpu_percent'] > 80 or h['mem_percent'] > 80:
+                tags = ('hot',)
+            self.host_tree.insert('', 'end', iid=h['id'], values=(
+                h['name'],
+                h['address'],
+                "Online" if h['connected'] else "Offline",
+                f"{h['cpu_percent']:.1f}",
+                f"{h['mem_percent']:.1f}",
+                h['processes'],
+                f"{now - h['last_seen']:.0f}s ago",
+                f"{h['bytes'] / 1024:.1f} KB"
+            ), tags=tags)
+        online = sum(1 for h in hosts if h['connected'])
+        self.status_label.config(text=f"Listening on port {self.aggregator.port}  |  {online}/{len(hosts)} hosts online")
+
+        for host, (win, tree) in list(self.detail_windows.items()):
+            if win.winfo_exists():
+                self._fill_process_tree(host, tree)
+            else:
+                del self.detail_windows[host]
+
+        self.parent.after(1000, self.refresh)
+
+    def open_host_details(self, event=None):
+        selected = self.host_tree.selection()
+        if not selected:
+            return
+        host = selected[0]
+        if host in self.detail_windows and self.detail_windows[host][0].winfo_exists():
+            self.detail_windows[host][0].lift()
+            return
+
+        win = tk.Toplevel(self.parent)
+        win.title(f"Host: {host}")
+        win.geometry("600x500")
+
+        columns = ('PID', 'Name', 'CPU %', 'RSS MB')
+        tree = ttk.Treeview(win, columns=columns, show='headings')
+        for col, width in zip(columns, (70, 250, 80, 100)):
+            tree.heading(col, text=col)
+            tree.column(col, width=width, stretch=(col == 'Name'))
+        tree.pack(fill='both', expand=True, padx=10, pady=10)
+
+        self.detail_windows[host] = (win, tree)
+        self._fill_process_tree(host, tree)
+
+    def _fill_process_tree(self, host, tree):
+        processes = self.aggregator.get_host_processes(host, limit=100)
+        for item in tree.get_children():
+            tree.delete(item)
+        for proc in processes:
+            tree.insert('', 'end', values=(
+                proc['pid'],
+                proc['name'][:40],
+                f"{proc.get('cpu_percent', 0.0):.1f}",
+                f"{proc.get('rss', 0) / (1024 * 1024):.1f}"
+            ))
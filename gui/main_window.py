@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from gui.task_panel import TaskPanel
-from gui.monitor_panel import MonitorPanel
-from gui.performance_panel import PerformanceBoosterPanel
+from core.collector import get_collector
+from core.alert_rules import get_alert_engine
+from core.memory_diagnostics import get_memory_diagnostics
 
 class CoreSenseApp:
-    def __init__(self, root):
+    def __init__(self, root, metrics_port=0, metrics_per_pid=False):
         self.root = root
         self.root.title("CoreSense - Task & System Monitor")
         self.root.geometry("1400x900")
@@ -14,6 +14,15 @@ class CoreSenseApp:
         self.root.grid_columnconfigure(1, weight=1)
         self.root.grid_rowconfigure(1, weight=1)
 
+        self.collector = get_collector()
+        self.alert_engine = get_alert_engine()
+        self.metrics_exporter = None
+        if metrics_port:
+            self._start_metrics_exporter(metrics_port, metrics_per_pid)
+        self.collector.start()
+        self._register_memory_counts()
+        self._resume_leftover_throttled()
+
         self.style = ttk.Style()
         self._configure_styles()
 
@@ -25,8 +34,40 @@ class CoreSenseApp:
         self.active_panel = None
         self.show_panel("tasks")
 
+        self.profiler_overlay = None
+        self.root.bind('<F12>', lambda e: self.toggle_profiler())
+
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _start_metrics_exporter(self, port, per_pid=False):
+        from core.metrics_exporter import MetricsExporter
+        try:
+            self.metrics_exporter = MetricsExporter(self.collector, port=port, per_pid=per_pid)
+            self.metrics_exporter.start()
+        except OSError as e:
+            self.metrics_exporter = None
+            print(f"Metrics endpoint error: {e}")
+
+    def _resume_leftover_throttled(self):
+        from core.throttle import resume_leftover_throttled
+        resumed = resume_leftover_throttled()
+        if resumed:
+            print(f"Resumed {len(resumed)} process(es) left stopped by a previous session: {resumed}")
+
+    def _register_memory_counts(self):
+        # Plain attribute reads only; these run on the diagnostics thread
+        def tasks():
+            return self.task_panel.task_manager.tasks if hasattr(self, 'task_panel') else []
+
+        def monitor(attr, default):
+            return getattr(self.monitor_panel, attr) if hasattr(self, 'monitor_panel') else default
+
+        diag = get_memory_diagnostics()
+        diag.register_count('tasks', lambda: len(tasks()))
+        diag.register_count('tasks.tree_rows', lambda: sum(1 + len(t.get('subtasks', [])) for t in tasks()))
+        diag.register_count('monitor.process_rows', lambda: monitor('process_rows', 0))
+        diag.register_count('monitor.graph_windows', lambda: len(monitor('graph_windows', ())))
+
     def _configure_styles(self):
         self.style.configure('Header.TLabel',
             font=('Segoe UI', 16, 'bold'), padding=15)
@@ -74,35 +115,35 @@ class CoreSenseApp:
         self.panel_container = tk.Frame(self.content_frame, bg="#f9fbfe")
         self.panel_container.pack(fill="both", expand=True, padx=20, pady=16)
 
-        self.task_panel_frame = tk.Frame(self.panel_container, bg="#f9fbfe")
-        self.task_panel = TaskPanel(self.task_panel_frame)
+        # Panels are built the first time they are shown, so startup only
+        # pays for the task panel
+        self.panel_frames = {}
 
-        self.monitor_panel_frame = tk.Frame(self.panel_container, bg="#f9fbfe")
-        self.monitor_panel = MonitorPanel(self.monitor_panel_frame)
-
-        self.booster_panel_frame = tk.Frame(self.panel_container, bg="#f9fbfe")
-        self.booster_panel = PerformanceBoosterPanel(self.booster_panel_frame)
+    def _build_panel(self, which):
+        frame = tk.Frame(self.panel_container, bg="#f9fbfe")
+        if which == "tasks":
+            from gui.task_panel import TaskPanel
+            self.task_panel = TaskPanel(frame)
+        elif which == "monitor":
+            from gui.monitor_panel import MonitorPanel
+            self.monitor_panel = MonitorPanel(frame)
+        elif which == "booster":
+            from gui.performance_panel import PerformanceBoosterPanel
+            self.booster_panel = PerformanceBoosterPanel(frame)
+        self.panel_frames[which] = frame
+        return frame
 
     def show_panel(self, which):
-        for frame in [self.task_panel_frame,
-                      self.monitor_panel_frame,
-                      self.booster_panel_frame]:
+        for frame in self.panel_frames.values():
             frame.pack_forget()
 
         if self.active_panel == "monitor":
             self.monitor_panel.stop_monitoring()
 
-        if which == "tasks":
-            self.panel_header.config(text="Task Manager")
-            self.task_panel_frame.pack(fill="both", expand=True)
-
-        elif which == "monitor":
-            self.panel_header.config(text="System Monitor")
-            self.monitor_panel_frame.pack(fill="both", expand=True)
-
-        elif which == "booster":
-            self.panel_header.config(text="Performance Booster")
-            self.booster_panel_frame.pack(fill="both", expand=True)
+        titles = {"tasks": "Task Manager", "monitor": "System Monitor", "booster": "Performance Booster"}
+        self.panel_header.config(text=titles[which])
+        frame = self.panel_frames.get(which) or self._build_panel(which)
+        frame.pack(fill="both", expand=True)
 
         self.active_panel = which
 
@@ -110,10 +151,41 @@ class CoreSenseApp:
         footer = ttk.Frame(self.root)
         footer.grid(row=2, column=0, columnspan=2, sticky="ew")
         ttk.Label(footer, text="CoreSense v2.1", style='Footer.TLabel').pack(side='left', padx=10)
+        ttk.Button(footer, text="⏱ Self-Profile (F12)", command=self.toggle_profiler).pack(side='left', padx=5)
+        self.alert_label = tk.Label(footer, text="", font=('Segoe UI', 9, 'bold'), fg='#e74c3c')
+        self.alert_label.pack(side='right', padx=10)
+        self._seen_alerts = 0
+        self._poll_alerts()
+
+    def toggle_profiler(self):
+        from gui.profiler_overlay import ProfilerOverlay
+        if self.profiler_overlay is not None and not self.profiler_overlay.closed:
+            self.profiler_overlay.close()
+            self.profiler_overlay = None
+        else:
+            self.profiler_overlay = ProfilerOverlay(self.root)
+
+    def _poll_alerts(self):
+        alerts = self.alert_engine.get_recent_alerts(limit=1)
+        total = self.alert_engine.alert_count
+        if alerts and total != self._seen_alerts:
+            self._seen_alerts = total
+            latest = alerts[-1]
+            self.alert_label.config(text=f"⚠ {latest['time'][11:19]}  {latest['message']}")
+            self.root.bell()
+        self.root.after(1000, self._poll_alerts)
 
     def on_closing(self):
+        self.collector.stop()
+        # Never leave duty-cycled processes stopped behind us
+        from core.throttle import get_throttle_manager
+        get_throttle_manager().stop_throttling()
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+        get_memory_diagnostics().stop()
         if hasattr(self, 'monitor_panel'):
             self.monitor_panel.stop_monitoring()
+            self.monitor_panel.close_graphs()
         if hasattr(self, 'task_panel'):
             if messagebox.askokcancel("Quit", "Save tasks before closing?"):
                 self.task_panel.save_tasks()
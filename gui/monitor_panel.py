@@ -1,27 +1,35 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from core.system_monitor import SystemMonitor
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.animation as animation
+from core.leak_detector import get_leak_detector
+from core.anomaly_detector import get_anomaly_detector
+from core.collector import get_collector
+from core.profiler import get_profiler, profiled
+from core.tracing import span
+from gui.cgroup_panel import CgroupWindow, format_cgroup_usage
 from collections import deque
 import threading
 import time
-import numpy as np
 
 
 class MonitorPanel:
     def __init__(self, parent):
         self.parent = parent
         self.monitor = SystemMonitor()
+        self.leak_detector = get_leak_detector()
+        self.anomaly_detector = get_anomaly_detector()
+        self.profiler = get_profiler()
         self.monitoring = False
         self.refreshing = False
         self.monitor_thread = None
         self.cpu_data = deque([0] * 60, maxlen=60)
         self.mem_data = deque([0] * 60, maxlen=60)
+        self.graph_windows = set()
+        self.process_rows = 0
         parent.configure(bg='#f2f6fc')
 
         self._create_main_layout()
+        self._refresh_leak_suspects()
 
     def _create_main_layout(self):
         main_container = tk.Frame(self.parent, bg='#f2f6fc')
@@ -36,19 +44,43 @@ class MonitorPanel:
         self._create_control_panel(left_panel)
         self._create_stats_display(left_panel)
         self._create_graph_buttons(left_panel)
+        self._create_leak_section(left_panel)
 
         self._create_search_bar(right_panel)
         self._create_process_list(right_panel)
 
     def _create_system_info_section(self, parent):
-        info = self.monitor.system_info
         info_frame = ttk.LabelFrame(parent, text=" System Information", padding=8)
         info_frame.pack(fill='x', pady=(0, 10))
 
+        # Rows are laid out now and filled in from a worker thread, so the
+        # panel paints before the memory/disk queries return
+        keys = ("OS:", "Version:", "Hostname:", "Architecture:", "CPU Cores:", "RAM Total:", "Disk Total:", "Uptime:")
+        self.info_labels = {}
+        for i, key in enumerate(keys):
+            tk.Label(info_frame, text=key, font=('Segoe UI', 9, 'bold')).grid(row=i, column=0, sticky='w', padx=5, pady=2)
+            self.info_labels[key] = tk.Label(info_frame, text="…", font=('Segoe UI', 9))
+            self.info_labels[key].grid(row=i, column=1, sticky='w', padx=5, pady=2)
+
+        ttk.Button(info_frame, text="💾 Analyze Disk Usage", command=self.show_disk_usage).grid(
+            row=len(keys), column=0, columnspan=2, sticky='w', padx=5, pady=(6, 2))
+        ttk.Button(info_frame, text="📦 Cgroups", command=self.show_cgroups).grid(
+            row=len(keys) + 1, column=0, columnspan=2, sticky='w', padx=5, pady=2)
+
+        def load_info():
+            try:
+                items = self._system_info_items()
+                self.parent.after(0, self._show_system_info, items)
+            except Exception as e:
+                print(f"System info error: {e}")
+
+        threading.Thread(target=load_info, daemon=True).start()
+
+    def _system_info_items(self):
+        info = self.monitor.system_info
         mem_info = self.monitor.get_memory_usage()
         disk_info = self.monitor.get_disk_usage('/' if info.get('os_name') != 'Windows' else 'C:\\')
-
-        items = [
+        return [
             ("OS:", f"{info.get('os_name', 'N/A')} {info.get('os_release', '')}"),
             ("Version:", (info.get('os_version', 'N/A')[:50] + '...') if len(info.get('os_version', '')) > 50 else info.get('os_version', 'N/A')),
             ("Hostname:", info.get('hostname', 'N/A')),
@@ -59,9 +91,28 @@ class MonitorPanel:
             ("Uptime:", f"{info.get('uptime_days', 0)}d {info.get('uptime_hours', 0)}h {info.get('uptime_minutes', 0)}m")
         ]
 
-        for i, (key, value) in enumerate(items):
-            tk.Label(info_frame, text=key, font=('Segoe UI', 9, 'bold')).grid(row=i, column=0, sticky='w', padx=5, pady=2)
-            tk.Label(info_frame, text=value, font=('Segoe UI', 9)).grid(row=i, column=1, sticky='w', padx=5, pady=2)
+    def _show_system_info(self, items):
+        for key, value in items:
+            self.info_labels[key].config(text=value)
+        self._refresh_uptime()
+
+    def _refresh_uptime(self):
+        # Uptime is derived on each read of system_info, so just re-read it
+        info = self.monitor.system_info
+        try:
+            self.info_labels["Uptime:"].config(
+                text=f"{info.get('uptime_days', 0)}d {info.get('uptime_hours', 0)}h {info.get('uptime_minutes', 0)}m")
+            self.parent.after(60000, self._refresh_uptime)
+        except tk.TclError:
+            pass
+
+    def show_disk_usage(self):
+        from gui.disk_panel import DiskUsageWindow
+        info = self.monitor.system_info
+        DiskUsageWindow(self.parent, '/' if info.get('os_name') != 'Windows' else 'C:\\')
+
+    def show_cgroups(self):
+        CgroupWindow(self.parent)
 
 
     def _create_control_panel(self, parent):
@@ -93,6 +144,18 @@ class MonitorPanel:
         self.mem_details = tk.Label(stats_frame, text="Used: 0.00 GB / Total: 0.00 GB", font=('Segoe UI', 8))
         self.mem_details.grid(row=2, column=0, columnspan=3, sticky='w', pady=3, padx=5)
 
+        tk.Label(stats_frame, text="Pressure", font=('Segoe UI', 10, 'bold')).grid(row=3, column=0, sticky='w', pady=5, padx=5)
+        self.pressure_label = tk.Label(stats_frame, text="N/A", font=('Segoe UI', 9))
+        self.pressure_label.grid(row=3, column=1, columnspan=2, sticky='w', pady=5)
+
+        tk.Label(stats_frame, text="Paging", font=('Segoe UI', 10, 'bold')).grid(row=4, column=0, sticky='w', pady=5, padx=5)
+        self.paging_label = tk.Label(stats_frame, text="N/A", font=('Segoe UI', 9))
+        self.paging_label.grid(row=4, column=1, columnspan=2, sticky='w', pady=5)
+
+        tk.Label(stats_frame, text="Cgroup", font=('Segoe UI', 10, 'bold')).grid(row=5, column=0, sticky='w', pady=5, padx=5)
+        self.cgroup_label = tk.Label(stats_frame, text="N/A", font=('Segoe UI', 9))
+        self.cgroup_label.grid(row=5, column=1, columnspan=2, sticky='w', pady=5)
+
     def _create_graph_buttons(self, parent):
         graph_frame = ttk.LabelFrame(parent, text=" Performance Graphs", padding=8)
         graph_frame.pack(fill='x', pady=(0, 10))
@@ -111,6 +174,46 @@ class MonitorPanel:
         )
         mem_btn.pack(side='top', fill='x', pady=4, ipady=8)
 
+        ttk.Button(
+            graph_frame,
+            text="Show Pressure & Load Graph",
+            command=self.show_pressure_graph
+        ).pack(side='top', fill='x', pady=4, ipady=8)
+
+        ttk.Button(
+            graph_frame,
+            text="Show Plugin Metrics Graph",
+            command=self.show_plugin_graph
+        ).pack(side='top', fill='x', pady=4, ipady=8)
+
+    def _create_leak_section(self, parent):
+        leak_frame = ttk.LabelFrame(parent, text=" Suspected Memory Leaks", padding=6)
+        leak_frame.pack(fill='both', expand=True, pady=(0, 10))
+
+        columns = ('PID', 'Name', 'RSS MB', 'MB/h', 'Conf')
+        self.leak_tree = ttk.Treeview(leak_frame, columns=columns, show='headings', selectmode='browse', height=4)
+        for col, width in zip(columns, (60, 150, 70, 70, 50)):
+            self.leak_tree.heading(col, text=col)
+            self.leak_tree.column(col, width=width, stretch=(col == 'Name'))
+        self.leak_tree.pack(fill='both', expand=True)
+
+    def _refresh_leak_suspects(self):
+        try:
+            suspects = self.leak_detector.get_suspects(limit=10)
+            for item in self.leak_tree.get_children():
+                self.leak_tree.delete(item)
+            for s in suspects:
+                self.leak_tree.insert('', 'end', values=(
+                    s['pid'],
+                    s['name'][:30],
+                    f"{s['rss_mb']:.1f}",
+                    f"+{s['growth_mb_per_hour']:.1f}",
+                    f"{s['confidence']:.2f}"
+                ))
+        except Exception as e:
+            print(f"Leak suspects update error: {e}")
+        self.parent.after(10000, self._refresh_leak_suspects)
+
     def _create_search_bar(self, parent):
         search_frame = ttk.LabelFrame(parent, text=" Search Processes", padding=6)
         search_frame.pack(fill='x', pady=(0, 8))
@@ -148,7 +251,7 @@ class MonitorPanel:
         )
         self.loading_dots_label.pack()
 
-        columns = ('PID', 'Name', 'CPU %', 'Memory %')
+        columns = ('PID', 'Name', 'CPU %', 'Memory %', 'Faults')
         self.process_tree = ttk.Treeview(list_frame, columns=columns, show='headings', selectmode='browse', height=15)
         self.process_tree.heading('PID', text='PID')
         self.process_tree.column('PID', width=60, stretch=False)
@@ -158,6 +261,9 @@ class MonitorPanel:
         self.process_tree.column('CPU %', width=70, stretch=False)
         self.process_tree.heading('Memory %', text='Mem %')
         self.process_tree.column('Memory %', width=70, stretch=False)
+        self.process_tree.heading('Faults', text='Maj flt/s')
+        self.process_tree.column('Faults', width=70, stretch=False)
+        self.process_tree.tag_configure('anomaly', background='#f5e1fa')
 
         v_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.process_tree.yview)
         self.process_tree.configure(yscrollcommand=v_scrollbar.set)
@@ -192,9 +298,10 @@ class MonitorPanel:
     def _continuous_monitor(self):
         while self.monitoring:
             try:
-                self._update_system_stats()
-                if not self.loading_overlay.winfo_ismapped():
-                    self._update_process_list()
+                with span('monitor.tick'):
+                    self._update_system_stats()
+                    if not self.loading_overlay.winfo_ismapped():
+                        self._update_process_list()
                 time.sleep(1)
             except Exception as e:
                 print(f"Monitoring error: {e}")
@@ -227,12 +334,13 @@ class MonitorPanel:
                 def clear_tree():
                     for item in self.process_tree.get_children():
                         self.process_tree.delete(item)
-                self.parent.after(0, clear_tree)
+                self.profiler.after(self.parent, 0, clear_tree, name='ui.monitor.clear_tree')
                 
                 time.sleep(0.3)
                 
-                self._update_system_stats()
-                self._update_process_list()
+                with span('monitor.refresh'):
+                    self._update_system_stats()
+                    self._update_process_list()
                 
                 time.sleep(0.2)
                 
@@ -256,8 +364,10 @@ class MonitorPanel:
                     self.cpu_label.config(foreground='#f39c12')
                 else:
                     self.cpu_label.config(foreground='#27ae60')
+                if self.anomaly_detector.is_anomalous('cpu'):
+                    self.cpu_label.config(text=f"{cpu_percent:.1f}% ⚠ unusual", foreground='#8e44ad')
             
-            self.parent.after(0, update_ui)
+            self.profiler.after(self.parent, 0, update_ui, name='ui.monitor.update_cpu')
             
             mem_info = self.monitor.get_memory_usage()
             self.mem_data.append(mem_info['percent'])
@@ -265,39 +375,107 @@ class MonitorPanel:
             def update_mem_ui():
                 self.mem_label.config(text=f"{mem_info['percent']:.1f}%")
                 self.mem_progress['value'] = mem_info['percent']
-                self.mem_details.config(text=f"Used: {mem_info['used_gb']:.2f} GB / Total: {mem_info['total_gb']:.2f} GB")
+                details = f"Used: {mem_info['used_gb']:.2f} GB / Total: {mem_info['total_gb']:.2f} GB"
+                breakdown = [f"{name.capitalize()} {mem_info[f'{name}_gb']:.2f}"
+                             for name in ('cached', 'buffers', 'shared', 'slab') if f'{name}_gb' in mem_info]
+                if breakdown:
+                    details += "   (" + " · ".join(breakdown) + " GB)"
+                self.mem_details.config(text=details)
                 if mem_info['percent'] > 80:
                     self.mem_label.config(foreground='#e74c3c')
                 elif mem_info['percent'] > 50:
                     self.mem_label.config(foreground='#f39c12')
                 else:
                     self.mem_label.config(foreground='#27ae60')
+                if self.anomaly_detector.is_anomalous('memory'):
+                    self.mem_label.config(text=f"{mem_info['percent']:.1f}% ⚠ unusual", foreground='#8e44ad')
             
-            self.parent.after(0, update_mem_ui)
+            self.profiler.after(self.parent, 0, update_mem_ui, name='ui.monitor.update_mem')
+
+            latest = get_collector().get_latest()
+            if latest is not None:
+                self.profiler.after(self.parent, 0, self._update_pressure_label, latest, name='ui.monitor.update_pressure')
             
         except Exception as e:
             print(f"Stats update error: {e}")
 
+    def _update_pressure_label(self, snapshot):
+        # Read from the collector's latest snapshot rather than sampled here
+        parts = []
+        psi = snapshot.get('psi', {})
+        if psi:
+            stalls = []
+            for resource, label in (('cpu', 'CPU'), ('memory', 'Mem'), ('io', 'IO')):
+                some = psi.get(resource, {}).get('some')
+                if some is not None:
+                    stalls.append(f"{label} {some['avg10']:.1f}%")
+            parts.append("stalled " + " · ".join(stalls))
+        load = snapshot.get('load')
+        if load:
+            parts.append("load " + " ".join(f"{v:.2f}" for v in load))
+        rates = snapshot.get('rates', {})
+        if 'ctx_switches_per_sec' in rates:
+            parts.append(f"{rates['ctx_switches_per_sec']:,.0f} ctx/s · {rates['interrupts_per_sec']:,.0f} irq/s")
+        self.pressure_label.config(text="   ".join(parts) if parts else "N/A")
+
+        paging = []
+        if 'swap_in_bytes_per_sec' in rates:
+            paging.append(f"swap in {rates['swap_in_bytes_per_sec'] / 1024 ** 2:.2f} / "
+                          f"out {rates['swap_out_bytes_per_sec'] / 1024 ** 2:.2f} MB/s")
+        if 'major_faults_per_sec' in rates:
+            paging.append(f"faults {rates['major_faults_per_sec']:,.0f} major · "
+                          f"{rates['minor_faults_per_sec']:,.0f} minor /s")
+        swapping = rates.get('swap_in_bytes_per_sec', 0) + rates.get('swap_out_bytes_per_sec', 0) > 1024 ** 2
+        self.paging_label.config(text="   ".join(paging) if paging else "N/A",
+                                 foreground='#e74c3c' if swapping else '#2c3e50')
+        high = max((psi.get(r, {}).get('some', {}).get('avg10', 0.0) for r in psi), default=0.0)
+        self.pressure_label.config(foreground='#e74c3c' if high > 20 else '#f39c12' if high > 5 else '#2c3e50')
+
+        cgroup = snapshot.get('cgroup')
+        if cgroup:
+            self.cgroup_label.config(text=f"{cgroup['path']}   " + format_cgroup_usage(cgroup),
+                                     foreground='#e74c3c' if cgroup.get('throttled_percent', 0) > 10 else '#2c3e50')
+
     def _update_process_list(self):
         try:
             processes = self.monitor.get_top_processes(limit=50)
+            anomalous = self.anomaly_detector.get_anomalous_pids()
+            # Major-fault rates are tracked by the collector for its top processes
+            latest = get_collector().get_latest() or {}
+            faults = {p['pid']: p['major_faults_per_sec'] for p in latest.get('processes', [])
+                      if 'major_faults_per_sec' in p}
             
             def update_tree():
-                for item in self.process_tree.get_children():
-                    self.process_tree.delete(item)
+                rows = []
                 for proc in processes:
-                    self.process_tree.insert('', 'end', values=(
+                    rate = faults.get(proc['pid'])
+                    rows.append(((
                         proc['pid'],
                         proc['name'][:30],
                         f"{proc['cpu_percent']:.1f}",
-                        f"{proc['memory_percent']:.1f}"
-                    ))
+                        f"{proc['memory_percent']:.1f}",
+                        f"{rate:.1f}" if rate is not None else ""
+                    ), ('anomaly',) if proc['pid'] in anomalous else ()))
+                self._fill_process_tree(rows)
             
-            self.parent.after(0, update_tree)
+            self.profiler.after(self.parent, 0, update_tree, name='ui.monitor.update_tree')
             
         except Exception as e:
             print(f"Process list update error: {e}")
 
+    def _fill_process_tree(self, rows):
+        # Reuse the existing rows instead of deleting and inserting the whole
+        # list every tick; a long session otherwise churns through Tk items
+        items = self.process_tree.get_children()
+        for i, (values, tags) in enumerate(rows):
+            if i < len(items):
+                self.process_tree.item(items[i], values=values, tags=tags)
+            else:
+                self.process_tree.insert('', 'end', values=values, tags=tags)
+        if len(items) > len(rows):
+            self.process_tree.delete(*items[len(rows):])
+        self.process_rows = len(rows)
+
     def search_processes(self):
         search_term = self.search_var.get().strip()
         if not search_term:
@@ -318,9 +496,10 @@ class MonitorPanel:
                 def clear_tree():
                     for item in self.process_tree.get_children():
                         self.process_tree.delete(item)
-                self.parent.after(0, clear_tree)
+                self.profiler.after(self.parent, 0, clear_tree, name='ui.monitor.clear_tree')
                 
-                processes = self.monitor.search_processes(search_term)
+                with span('monitor.search', term=search_term):
+                    processes = self.monitor.search_processes(search_term)
                 
                 def update_results():
                     self.loading_label.config(text="Refreshing...")
@@ -332,18 +511,17 @@ class MonitorPanel:
                             self.monitoring = True
                         return
                     
-                    for proc in processes:
-                        self.process_tree.insert('', 'end', values=(
-                            proc['pid'],
-                            proc['name'][:30],
-                            f"{proc['cpu_percent']:.1f}",
-                            f"{proc['memory_percent']:.1f}"
-                        ))
+                    self._fill_process_tree([((
+                        proc['pid'],
+                        proc['name'][:30],
+                        f"{proc['cpu_percent']:.1f}",
+                        f"{proc['memory_percent']:.1f}"
+                    ), ()) for proc in processes])
                     
                     self.hide_loading_overlay()
                     
                 time.sleep(0.3)
-                self.parent.after(0, update_results)
+                self.profiler.after(self.parent, 0, update_results, name='ui.monitor.search_results')
                 
             except Exception as e:
                 self.parent.after(0, lambda: self.loading_label.config(text="Refreshing..."))
@@ -374,9 +552,121 @@ class MonitorPanel:
         self._show_graph("CPU Usage", self.cpu_data, "CPU %", "#BAD7F6", "#3498db")
 
     def show_memory_graph(self):
-        self._show_graph("Memory Usage", self.mem_data, "Memory %", "#b8f2df", "#27ae60")
+        self._show_graph("Memory Usage", self.mem_data, "Memory %", "#b8f2df", "#27ae60", swap_overlay=True)
+
+    def show_pressure_graph(self):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        import matplotlib.animation as animation
+        collector = get_collector()
+        graph_window = tk.Toplevel(self.parent)
+        graph_window.title("Pressure & Load")
+        graph_window.geometry("700x620")
+        graph_window.configure(bg='#f8f9fa')
+
+        fig = Figure(figsize=(7, 6), facecolor='#f8f9fa', dpi=100)
+        axes = fig.subplots(3, 1, sharex=True)
+        panels = [
+            (axes[0], "Stalled time (PSI some, %)",
+             [('psi_cpu', 'CPU', '#3498db'), ('psi_memory', 'Memory', '#27ae60'), ('psi_io', 'IO', '#e67e22')]),
+            (axes[1], "Load average (1 min)", [('load1', 'Load', '#8e44ad')]),
+            (axes[2], "Per second", [('ctx_per_sec', 'Context switches', '#2c3e50'), ('irq_per_sec', 'Interrupts', '#c0392b')]),
+        ]
+        lines = []
+        for ax, title, series in panels:
+            ax.set_title(title, fontsize=10, color='#222222')
+            ax.grid(True, alpha=0.15)
+            ax.set_facecolor('#fcfcfc')
+            for key, label, color in series:
+                line, = ax.plot([], [], color=color, linewidth=1.8, label=label)
+                lines.append((ax, key, line))
+            if len(series) > 1:
+                ax.legend(loc='upper left', fontsize=8)
+        axes[2].set_xlabel("Seconds ago", fontsize=10, color='#626973')
+        fig.tight_layout(pad=1.5)
+
+        canvas = FigureCanvasTkAgg(fig, master=graph_window)
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        # draw_idle() ends up in canvas.draw(), so this times every redraw
+        canvas.draw = profiled('graph.pressure.draw')(canvas.draw)
+
+        def animate(frame):
+            history = collector.get_history(since=time.time() - 600)
+            now = time.time()
+            for ax, key, line in lines:
+                points = [(s['time'] - now, s[key]) for s in history if s.get(key) is not None]
+                line.set_data([p[0] for p in points], [p[1] for p in points])
+            for ax, _, _ in panels:
+                ax.relim()
+                ax.autoscale_view()
+                ax.set_ylim(bottom=0)
+            if not any(s.get('psi_cpu') is not None for s in history):
+                axes[0].set_title("Stalled time (PSI not available on this system)", fontsize=10, color='#95a5a6')
+            return [line for _, _, line in lines]
+
+        animate(0)
+        canvas.draw()
+        graph_window.ani = animation.FuncAnimation(fig, profiled('graph.pressure.update')(animate),
+                                                   interval=int(collector.interval * 1000),
+                                                   blit=False, cache_frame_data=False)
+        self._track_graph(graph_window)
+
+    def show_plugin_graph(self):
+        collector = get_collector()
+        plugins = sorted((collector.get_latest() or {}).get('plugins', {}).items())
+        if not plugins:
+            messagebox.showinfo("Plugin Metrics", "No collector plugins are reporting.\n"
+                                "Add a module with a collect() function to the plugins folder.")
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        import matplotlib.animation as animation
+        graph_window = tk.Toplevel(self.parent)
+        graph_window.title("Plugin Metrics")
+        graph_window.geometry(f"700x{min(220 * len(plugins), 880)}")
+        graph_window.configure(bg='#f8f9fa')
 
-    def _show_graph(self, title, data_deque, ylabel, gradient_color, line_color):
+        fig = Figure(figsize=(7, 2.2 * len(plugins)), facecolor='#f8f9fa', dpi=100)
+        axes = fig.subplots(len(plugins), 1, sharex=True, squeeze=False)[:, 0]
+        lines = []
+        for ax, (plugin, values) in zip(axes, plugins):
+            ax.set_title(plugin, fontsize=10, color='#222222')
+            ax.grid(True, alpha=0.15)
+            ax.set_facecolor('#fcfcfc')
+            for metric in sorted(values):
+                line, = ax.plot([], [], linewidth=1.8, label=metric)
+                lines.append((f'{plugin}.{metric}', line))
+            ax.legend(loc='upper left', fontsize=8)
+        axes[-1].set_xlabel("Seconds ago", fontsize=10, color='#626973')
+        fig.tight_layout(pad=1.5)
+
+        canvas = FigureCanvasTkAgg(fig, master=graph_window)
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        canvas.draw = profiled('graph.plugins.draw')(canvas.draw)
+
+        def animate(frame):
+            history = collector.get_history(since=time.time() - 600)
+            now = time.time()
+            for key, line in lines:
+                points = [(s['time'] - now, s[key]) for s in history if s.get(key) is not None]
+                line.set_data([p[0] for p in points], [p[1] for p in points])
+            for ax in axes:
+                ax.relim()
+                ax.autoscale_view()
+            return [line for _, line in lines]
+
+        animate(0)
+        canvas.draw()
+        graph_window.ani = animation.FuncAnimation(fig, profiled('graph.plugins.update')(animate),
+                                                   interval=int(collector.interval * 1000),
+                                                   blit=False, cache_frame_data=False)
+        self._track_graph(graph_window)
+
+    def _show_graph(self, title, data_deque, ylabel, gradient_color, line_color, swap_overlay=False):
+        # matplotlib costs ~0.4s to import, so it waits for the first graph
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        import matplotlib.animation as animation
         graph_window = tk.Toplevel(self.parent)
         graph_window.title(title)
         graph_window.geometry("600x400")
@@ -398,7 +688,7 @@ class MonitorPanel:
         ax.spines['left'].set_color('#dedede')
         ax.spines['bottom'].set_color('#dedede')
 
-        x_data = np.arange(-59, 1, 1)
+        x_data = list(range(-59, 1))
         y_data = list(data_deque)
         line, = ax.plot(x_data, y_data, color=line_color, linewidth=2.5, antialiased=True)
         ax.fill_between(x_data, y_data, color=gradient_color, alpha=0.22)
@@ -413,15 +703,29 @@ class MonitorPanel:
             bbox=dict(boxstyle='round,pad=0.22', fc='#eeeeee', ec='#bbbbbb', alpha=0.95)
         )
 
+        swap_lines = None
+        if swap_overlay:
+            # Swap traffic from the collector on a second axis, so thrashing
+            # shows up even while memory % looks flat
+            swap_ax = ax.twinx()
+            swap_ax.set_ylabel("Swap MB/s", fontsize=10, color='#c0392b')
+            swap_ax.spines['top'].set_visible(False)
+            swap_in, = swap_ax.plot([], [], color='#c0392b', linewidth=1.5, linestyle='--', label='swap in')
+            swap_out, = swap_ax.plot([], [], color='#e67e22', linewidth=1.5, linestyle=':', label='swap out')
+            swap_ax.legend(loc='upper left', fontsize=8)
+            swap_lines = (swap_ax, swap_in, swap_out)
+
         fig.tight_layout(pad=2.0)
 
+        key = title.lower().replace(' ', '_')
         canvas = FigureCanvasTkAgg(fig, master=graph_window)
+        canvas.draw = profiled(f'graph.{key}.draw')(canvas.draw)
         canvas.get_tk_widget().pack(pady=20, padx=20)
         canvas.draw()
 
         def animate(frame):
             y_data = list(data_deque)
-            x_data = np.arange(-len(y_data) + 1, 1, 1)
+            x_data = list(range(-len(y_data) + 1, 1))
             
             line.set_data(x_data, y_data)
             
@@ -434,14 +738,41 @@ class MonitorPanel:
             value_annot.xy = (0, val)
             
             ax.set_xlim(x_data[0] if len(x_data) > 0 else -59, 0)
+
+            if swap_lines is not None:
+                swap_ax, swap_in, swap_out = swap_lines
+                now = time.time()
+                history = [s for s in get_collector().get_history(since=now - 60) if s.get('swap_in_per_sec') is not None]
+                xs = [s['time'] - now for s in history]
+                swap_in.set_data(xs, [s['swap_in_per_sec'] / 1024 ** 2 for s in history])
+                swap_out.set_data(xs, [s['swap_out_per_sec'] / 1024 ** 2 for s in history])
+                peak = max([s['swap_in_per_sec'] + s['swap_out_per_sec'] for s in history] or [0]) / 1024 ** 2
+                swap_ax.set_ylim(0, max(peak * 1.2, 1.0))
             
             return line, value_annot
 
-        ani = animation.FuncAnimation(fig, animate, interval=1000, blit=False, cache_frame_data=False)
+        ani = animation.FuncAnimation(fig, profiled(f'graph.{key}.update')(animate), interval=1000, blit=False, cache_frame_data=False)
         
         graph_window.ani = ani
-        
-        graph_window.protocol("WM_DELETE_WINDOW", graph_window.destroy)
+        self._track_graph(graph_window)
+
+    def _track_graph(self, graph_window):
+        self.graph_windows.add(graph_window)
+        graph_window.protocol("WM_DELETE_WINDOW", lambda: self._close_graph(graph_window))
+
+    def _close_graph(self, graph_window):
+        # The animation's timer holds the figure and its closure; destroying
+        # the Toplevel alone leaves it ticking against a dead canvas
+        ani = getattr(graph_window, 'ani', None)
+        if ani is not None:
+            ani.event_source.stop()
+            del graph_window.ani
+        self.graph_windows.discard(graph_window)
+        graph_window.destroy()
+
+    def close_graphs(self):
+        for graph_window in list(self.graph_windows):
+            self._close_graph(graph_window)
 
     def kill_process(self):
         selected = self.process_tree.selection()
@@ -452,8 +783,11 @@ class MonitorPanel:
         pid = int(values[0])
         name = values[1]
         if messagebox.askyesno("Confirm", f"⚠️ Terminate process '{name}' (PID: {pid})?"):
-            success, message = self.monitor.kill_process(pid)
-            if success:
-                messagebox.showinfo("Success", message)
-            else:
-                messagebox.showerror("Error", message)
+            def kill_thread():
+                success, message = self.monitor.kill_process(pid)
+                if success:
+                    self.parent.after(0, lambda: messagebox.showinfo("Success", message))
+                else:
+                    self.parent.after(0, lambda: messagebox.showerror("Error", message))
+
+            threading.Thread(target=kill_thread, daemon=True).start()
@@ -2,15 +2,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
-import psutil
-import json
-import os
 from datetime import datetime
-import matplotlib
-matplotlib.use("TkAgg")     
-import matplotlib.pyplot as plt
 
-HISTORY_PATH = os.path.join(os.path.dirname(__file__), '..', 'boost_history.json')
+
+def _pyplot():
+    # Imported on the first graph rather than at startup
+    import matplotlib
+    matplotlib.use("TkAgg")
+    import matplotlib.pyplot as plt
+    return plt
 
 
 class PerformanceBoosterPanel:
@@ -36,11 +36,62 @@ class PerformanceBoosterPanel:
         ttk.Radiobutton(mode_frame, text="Extreme Boost (Aggressive)", variable=self.boost_mode,
                         value="extreme").pack(side='left', padx=10)
 
+        ttk.Radiobutton(mode_frame, text="Contain (throttle, no kill)", variable=self.boost_mode,
+                        value="contain").pack(side='left', padx=10)
+
+        from core.throttle import default_contain_cpus
+        contain_frame = ttk.LabelFrame(container, text=" Contain Settings ", padding=8)
+        contain_frame.pack(fill="x", pady=(10, 0))
+
+        ttk.Label(contain_frame, text="Pin to cores:").pack(side='left')
+        self.contain_cpus = tk.StringVar(value=default_contain_cpus())
+        ttk.Entry(contain_frame, textvariable=self.contain_cpus, width=10).pack(side='left', padx=(5, 15))
+
+        ttk.Label(contain_frame, text="CPU share %:").pack(side='left')
+        self.contain_share = tk.IntVar(value=25)
+        ttk.Spinbox(contain_frame, from_=5, to=95, increment=5, textvariable=self.contain_share,
+                    width=5).pack(side='left', padx=(5, 15))
+
+        self.contain_ionice = tk.BooleanVar(value=True)
+        ttk.Checkbutton(contain_frame, text="Idle I/O priority", variable=self.contain_ionice).pack(side='left')
+
+        governor_frame = ttk.LabelFrame(container, text=" Auto-Boost Governor ", padding=8)
+        governor_frame.pack(fill="x", pady=(10, 0))
+
+        self.governor_enabled = tk.BooleanVar(value=False)
+        ttk.Checkbutton(governor_frame, text="Boost automatically under sustained pressure",
+                        variable=self.governor_enabled, command=self.toggle_governor).pack(side='left')
+        self.governor_status = tk.Label(governor_frame, text="Off", bg='white')
+        self.governor_status.pack(side='left', padx=15)
+        self._governor_seen = 0
+        self._governor_polling = False
+
+        measure_frame = ttk.LabelFrame(container, text=" Measurement ", padding=8)
+        measure_frame.pack(fill="x", pady=(10, 0))
+
+        ttk.Label(measure_frame, text="Compare the last").pack(side='left')
+        self.pre_window = tk.IntVar(value=30)
+        ttk.Spinbox(measure_frame, from_=10, to=600, increment=10, textvariable=self.pre_window,
+                    width=5).pack(side='left', padx=5)
+        ttk.Label(measure_frame, text="s before the boost with").pack(side='left')
+        self.post_window = tk.IntVar(value=30)
+        ttk.Spinbox(measure_frame, from_=10, to=600, increment=10, textvariable=self.post_window,
+                    width=5).pack(side='left', padx=5)
+        ttk.Label(measure_frame, text="s after it").pack(side='left')
+
+        ttk.Label(measure_frame, text="Deep Boost cleans temp files older than").pack(side='left', padx=(25, 0))
+        self.temp_age = tk.IntVar(value=60)
+        ttk.Spinbox(measure_frame, from_=0, to=10080, increment=30, textvariable=self.temp_age,
+                    width=6).pack(side='left', padx=5)
+        ttk.Label(measure_frame, text="min").pack(side='left')
+
         ctrl = ttk.LabelFrame(container, text=" Controls ", padding=8)
         ctrl.pack(fill="x", pady=(15, 5))
 
         ttk.Button(ctrl, text="⚡ Run Booster", width=18, command=self.start_boost).pack(side='left', padx=5)
         ttk.Button(ctrl, text="Scan Only", width=12, command=self.scan_only).pack(side='left', padx=5)
+        ttk.Button(ctrl, text="Dry Run", width=10, command=self.dry_run).pack(side='left', padx=5)
+        ttk.Button(ctrl, text="↺ Restore", width=10, command=self.restore).pack(side='left', padx=5)
         ttk.Button(ctrl, text="Show Graphs (Last Boost)", width=25,
                    command=self.show_last_graphs).pack(side='left', padx=5)
         ttk.Button(ctrl, text="Show History", width=12, command=self.show_history).pack(side='left', padx=5)
@@ -57,9 +108,60 @@ class PerformanceBoosterPanel:
         self.output.pack(fill='both', expand=True)
 
         try:
-            os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
-        except:
-            pass
+            from core.booster_policy import get_booster_policy
+            get_booster_policy()
+        except Exception as e:
+            print(f"Booster policy error: {e}")
+
+    def toggle_governor(self):
+        from core.governor import get_governor
+        governor = get_governor()
+        if self.governor_enabled.get():
+            governor.start()
+            self._governor_seen = governor.event_count
+            self.output.insert(tk.END, f"Governor enabled ({governor.mode.upper()} mode).\n")
+            if not self._governor_polling:
+                self._governor_polling = True
+                self.master.after(1000, self._poll_governor)
+        else:
+            governor.stop()
+            self.governor_status.config(text="Off", fg='black')
+            self.output.insert(tk.END, "Governor disabled.\n")
+
+    def _poll_governor(self):
+        from core.governor import get_governor
+        if not self.governor_enabled.get():
+            self._governor_polling = False
+            return
+        governor = get_governor()
+        status = governor.get_status()
+        if status['under_pressure']:
+            self.governor_status.config(text=f"Under pressure ({status['actions_last_minute']} actions/min)",
+                                        fg='#c0392b')
+        else:
+            self.governor_status.config(text="Watching", fg='#27ae60')
+
+        new = governor.event_count - self._governor_seen
+        if new > 0:
+            for event in governor.get_recent_events(limit=min(new, 200)):
+                self.output.insert(tk.END, self._describe_governor_event(event) + "\n")
+            self.output.see(tk.END)
+            self._governor_seen = governor.event_count
+        self.master.after(1000, self._poll_governor)
+
+    def _describe_governor_event(self, event):
+        stamp = datetime.fromtimestamp(event['time']).strftime('%H:%M:%S')
+        if event['event'] == 'pressure':
+            triggers = ', '.join(f"{k}={v}" for k, v in event['triggers'].items())
+            return f"[{stamp}] Governor: sustained pressure ({triggers})"
+        if event['event'] == 'action':
+            actions = '; '.join(f"{a['action']} {a['name']} (PID {a['pid']}): {a['outcome']}"
+                                for a in event['actions'])
+            return f"[{stamp}] Governor: {actions}"
+        if event['event'] == 'effect':
+            delta = ', '.join(f"{k} {v:+.1f}" for k, v in event['delta'].items())
+            return f"[{stamp}] Governor: effect after {event['time'] - event['action_time']:.0f}s: {delta or 'n/a'}"
+        return f"[{stamp}] Governor: pressure cleared"
 
     def set_status(self, text):
         self.status.config(text=text)
@@ -85,126 +187,222 @@ class PerformanceBoosterPanel:
         self.output.insert(tk.END, "Scanning for heavy processes...\n")
 
         try:
-            from core.system_monitor import SystemMonitor
-            sm = SystemMonitor()
-            heavy = sm.get_heavy_processes()
+            from core.collector import get_collector
+            from core.process_window import get_process_window
+            sm = get_collector().monitor
+            window = get_process_window()
+            heavy = sm.get_heavy_processes(window=window)
+            if not window.is_warm():
+                self.output.insert(tk.END, "(Sliding window still warming up, using an instant sample)\n")
 
             if not heavy:
                 self.output.insert(tk.END, "No heavy processes found.\n")
                 return
 
             for p in heavy:
+                growth = f"  RSS {p['rss_slope_mb_min']:+.1f}MB/min" if 'rss_slope_mb_min' in p else ""
                 self.output.insert(tk.END,
-                    f"PID {p['pid']} {p['name']}  CPU:{p['cpu']}%  RAM:{p['ram_mb']}MB\n"
+                    f"PID {p['pid']} {p['name']}  CPU:{p['cpu']}%  RAM:{p['ram_mb']}MB{growth}\n"
                 )
         except Exception as e:
             self.output.insert(tk.END, f"Scan failed: {e}\n")
+        finally:
+            self._report_leak_suspects()
+
+    def _report_leak_suspects(self):
+        from core.leak_detector import get_leak_detector
+        suspects = get_leak_detector().get_suspects(limit=10)
+        if not suspects:
+            return
+
+        self.output.insert(tk.END, "\nSuspected memory leaks (RSS growth trend):\n")
+        for s in suspects:
+            self.output.insert(tk.END,
+                f"PID {s['pid']} {s['name']}  RSS:{s['rss_mb']}MB  "
+                f"+{s['growth_mb_per_hour']}MB/h  (confidence {s['confidence']:.2f})\n"
+            )
 
     def run_booster(self):
-        from core.system_monitor import SystemMonitor
-        sm = SystemMonitor()
+        from core.booster_policy import apply_plan
+        from core.collector import get_collector
+        from core.measurement import SETTLE_SECONDS, measure, format_report
+        collector = get_collector()
+        sm = collector.monitor
 
         mode = self.boost_mode.get()
+        pre_seconds = self.pre_window.get()
+        post_seconds = self.post_window.get()
         self.output.delete("1.0", tk.END)
         self.output.insert(tk.END, f"Starting {mode.upper()} boost...\n\n")
 
-        cpu_before = sm.get_cpu_usage(interval=0.1)
-        mem_before = sm.get_memory_usage().get('used_gb', 0.0)
+        boost_start = time.time()
+        plan = self._plan_boost(mode)
 
-        heavy = sm.get_heavy_processes(cpu_limit=35, ram_limit=200)
-
-        if not heavy:
+        if not plan:
             self.output.insert(tk.END, "No heavy processes found.\n")
         else:
-            for p in heavy:
-                pid = p['pid']
-                name = (p['name'] or "").lower()
-                cpu = p['cpu'] or 0.0
-
-                if pid in (0, 4) or name in ("system", "system idle process"):
-                    self.output.insert(tk.END, f"Skipped protected: {name} (PID {pid})\n")
-                    continue
-
-                if pid == os.getpid():
-                    self.output.insert(tk.END, f"Skipped self: {name} (PID {pid})\n")
-                    continue
-
-                safe_names = ["coresense", "python", "pythonw", "py", "main"]
-                if any(s in name for s in safe_names):
-                    self.output.insert(tk.END, f"Skipped (CoreSense Safe): {name}\n")
-                    continue
-
-                ok, msg = sm.kill_process(pid)
-                self.output.insert(tk.END, msg + "\n")
+            for r in apply_plan(plan, sm, grace=3.0):
+                self.output.insert(tk.END,
+                    f"{r['outcome'].replace('_', ' ').capitalize()}: {self._describe(r)}\n"
+                )
 
         if mode == "deep":
-            self.output.insert(tk.END, "\nCleaning temp files...\n")
-            threading.Thread(target=sm.clear_temp_files, daemon=True).start()
+            self._clean_temp_files(sm, dry_run=False)
 
-        time.sleep(1)
+        boost_end = time.time()
+        settle = SETTLE_SECONDS
+        self.output.insert(tk.END, f"\nMeasuring the effect over the next {post_seconds}s...\n")
+        self.set_status("Measuring...")
+        # Wait for one more collector tick past the window so it is complete
+        time.sleep(max(boost_end + settle + post_seconds + collector.interval - time.time(), 0))
 
-        cpu_after = psutil.cpu_percent(interval=0.5)
-        mem_after = sm.get_memory_usage().get('used_gb', 0.0)
+        result = measure(collector.get_history(since=boost_start - pre_seconds),
+                         boost_start, boost_end, pre_seconds, post_seconds, settle=settle)
 
         self.output.insert(tk.END,
             f"\n--- PERFORMANCE REPORT ---\n"
-            f"CPU: {cpu_before:.1f}% → {cpu_after:.1f}%\n"
-            f"RAM: {mem_before:.2f}GB → {mem_after:.2f}GB\n"
+            f"{format_report(result)}\n"
             f"--------------------------\n"
             f"\n✔ Booster Completed!\n"
         )
 
+        metrics = result['metrics']
+        total_gb = ((collector.get_latest() or {}).get('memory', {}).get('total', 0)) / (1024 ** 3)
+
+        def mean(key, side, scale=1.0):
+            summary = metrics[key][side]
+            return summary['mean'] * scale if summary else 0.0
+
+        cpu_before, cpu_after = mean('cpu_percent', 'before'), mean('cpu_percent', 'after')
+        mem_before = mean('mem_percent', 'before', total_gb / 100)
+        mem_after = mean('mem_percent', 'after', total_gb / 100)
+
         self._last_boost = {
             'timestamp': datetime.now().isoformat(),
             'mode': mode,
             'cpu_before': cpu_before,
             'cpu_after': cpu_after,
             'mem_before': mem_before,
-            'mem_after': mem_after
+            'mem_after': mem_after,
+            'measurement': result
         }
 
-        self._save_history_entry(mode, cpu_before, cpu_after, mem_before, mem_after)
+        self._save_history_entry(mode, cpu_before, cpu_after, mem_before, mem_after, result)
+
+
+    def _plan_boost(self, mode):
+        from core.collector import get_collector
+        from core.booster_policy import get_booster_policy
+
+        collector = get_collector()
+        snapshot = collector.get_latest()
+        if snapshot is None:
+            snapshot = collector.collect_once()
+        plan = get_booster_policy().evaluate(snapshot, mode)
+
+        # The contain controls are the user's explicit choice, so they win
+        # over the rule's defaults (e.g. unchecking idle I/O priority)
+        contain = self._contain_args()
+        for action in plan:
+            if action['action'] in ('throttle', 'contain'):
+                action['args'] = dict(action['args'], **contain)
+        return plan
+
+    def _clean_temp_files(self, sm, dry_run):
+        self.output.insert(tk.END, f"\n{'Scanning' if dry_run else 'Cleaning'} temp files older than "
+                                   f"{self.temp_age.get()} min...\n")
+        self.output.mark_set('cleaner', 'end-1c')
+        self.output.mark_gravity('cleaner', 'left')
+        self.output.insert(tk.END, "\n")
+        progress = lambda stats: self.master.after(0, self._show_cleaner_progress, stats)
+        result = sm.clear_temp_files(min_age_minutes=self.temp_age.get(), dry_run=dry_run, progress=progress)
+        if result is False:
+            self.master.after(0, self.output.insert, 'cleaner', "Temp cleanup failed")
+        return result
+
+    def _show_cleaner_progress(self, stats):
+        verb = "would be freed" if stats.get('dry_run') else "freed"
+        line = (f"{stats['files']:,} files, {stats['bytes'] / (1024 * 1024):.1f} MB {verb}  "
+                f"({stats['scanned']:,} scanned, {stats['skipped_young']:,} too new, "
+                f"{stats['skipped_open']:,} in use, {stats['skipped_denied']:,} not ours)")
+        if stats.get('finished'):
+            line += f" in {stats['seconds']:.1f}s"
+        self.output.delete('cleaner', 'cleaner lineend')
+        self.output.insert('cleaner', line)
+
+    def _contain_args(self):
+        from core.throttle import parse_cpu_list
+        args = {'share': min(max(self.contain_share.get(), 5), 95) / 100.0}
+        try:
+            cpus = parse_cpu_list(self.contain_cpus.get())
+        except ValueError:
+            cpus = []
+        if cpus:
+            args['cpus'] = cpus
+        if not self.contain_ionice.get():
+            args['ioclass'] = None
+        return args
+
+    def restore(self):
+        threading.Thread(target=self._restore_worker, daemon=True).start()
+
+    def _restore_worker(self):
+        from core.throttle import get_throttle_manager
+        report = get_throttle_manager().restore_all()
+        self.master.after(0, self._show_restore_report, report)
+
+    def _show_restore_report(self, report):
+        self.output.delete("1.0", tk.END)
+        if not report:
+            self.output.insert(tk.END, "Nothing to restore.\n")
+            return
 
+        self.output.insert(tk.END, "Restoring process settings...\n\n")
+        for r in report:
+            line = f"PID {r['pid']} {r['name']}: "
+            if r['restored']:
+                line += f"restored {', '.join(r['restored'])}"
+            if r['failed']:
+                line += ("; " if r['restored'] else "") + f"could not restore {', '.join(r['failed'])}"
+            self.output.insert(tk.END, line + "\n")
 
-    def handle_processes(self, heavy, sm, mode):
-        for p in heavy:
-            pid = p["pid"]
-            name = p["name"] or ""
-            cpu = p["cpu"] or 0.0
+    def _describe(self, action):
+        from core.booster_policy import describe_action
+        return (f"{describe_action(action)} {action['name']} (PID {action['pid']})  "
+                f"CPU:{action['cpu']}% RAM:{action['rss_mb']}MB  [{action['rule']}]")
 
-            if pid in (0, 4) or name.lower() in ("system", "system idle process"):
-                self.output.insert(tk.END, f"Skipped protected: {name} (PID {pid})\n")
-                continue
+    def dry_run(self):
+        from core.booster_policy import estimate_freed
 
-            if mode == "fast":
-                sm.lower_priority(pid)
-                if cpu > 85:
-                    ok, msg = sm.kill_process(pid)
-                    self.output.insert(tk.END, msg + "\n")
-                else:
-                    self.output.insert(tk.END, f"Lowered priority: {name}\n")
-
-            elif mode == "deep":
-                sm.lower_priority(pid)
-                time.sleep(0.02)
-                if cpu > 70:
-                    ok, msg = sm.kill_process(pid)
-                    self.output.insert(tk.END, msg + "\n")
-
-            elif mode == "extreme":
-                current_pid = os.getpid()
-                if pid == current_pid:
-                    self.output.insert(tk.END, f"Skipped self: {name}\n")
-                    continue
-
-                if any(x in name.lower() for x in ["chrome", "firefox", "edge", "code"]):
-                    ok, msg = sm.kill_process(pid)
-                    self.output.insert(tk.END, msg + "\n")
-                else:
-                    sm.lower_priority(pid)
-                    self.output.insert(tk.END, f"Lowered priority: {name}\n")
+        mode = self.boost_mode.get()
+        self.output.delete("1.0", tk.END)
+        self.output.insert(tk.END, f"Dry run of {mode.upper()} boost (nothing will be changed)...\n\n")
+        try:
+            plan = self._plan_boost(mode)
+        except Exception as e:
+            self.output.insert(tk.END, f"Policy error: {e}\n")
+            return
 
-    def _save_history_entry(self, mode, cpu_b, cpu_a, mem_b, mem_a):
+        if not plan:
+            self.output.insert(tk.END, "No processes match the booster policy.\n")
+        else:
+            for action in plan:
+                self.output.insert(tk.END, f"Would {self._describe(action)}\n")
+
+            freed = estimate_freed(plan)
+            self.output.insert(tk.END,
+                f"\n--- ESTIMATE ---\n"
+                f"Processes affected: {len(plan)}\n"
+                f"RAM freed: ~{freed['rss_mb']:.0f} MB\n"
+                f"CPU freed: ~{freed['cpu']:.1f}%\n"
+                f"CPU deprioritised: ~{freed['cpu_deprioritised']:.1f}%\n"
+            )
+
+        if mode == "deep":
+            from core.collector import get_collector
+            threading.Thread(target=self._clean_temp_files, args=(get_collector().monitor, True), daemon=True).start()
+
+    def _save_history_entry(self, mode, cpu_b, cpu_a, mem_b, mem_a, measurement=None):
         entry = {
             "time": datetime.now().isoformat(),
             "mode": mode,
@@ -213,53 +411,131 @@ class PerformanceBoosterPanel:
             "mem_before": mem_b,
             "mem_after": mem_a
         }
+        if measurement:
+            entry["measurement"] = measurement
 
         try:
-            hist = []
-            if os.path.exists(HISTORY_PATH):
-                with open(HISTORY_PATH, "r") as f:
-                    hist = json.load(f)
-
-            hist.insert(0, entry)
-            hist = hist[:30]
-
-            with open(HISTORY_PATH, "w") as f:
-                json.dump(hist, f, indent=2)
-        except:
-            pass
+            from core.boost_history import get_boost_history
+            get_boost_history().append(entry)
+        except Exception as e:
+            print(f"Boost history error: {e}")
 
     def show_history(self):
-        try:
-            with open(HISTORY_PATH, "r") as f:
-                hist = json.load(f)
-        except:
-            messagebox.showinfo("History", "No history available.")
-            return
+        from core.boost_history import get_boost_history
+        history = get_boost_history()
+        page_size = 50
 
         win = tk.Toplevel(self.master)
         win.title("Boost History")
-        win.geometry("600x400")
-
-        txt = tk.Text(win)
-        txt.pack(fill='both', expand=True)
-
-        for e in hist:
-            txt.insert(tk.END,
-                f"{e['time']} | {e['mode'].upper()} | "
-                f"CPU {e['cpu_before']:.1f}% → {e['cpu_after']:.1f}% | "
-                f"RAM {e['mem_before']:.2f} → {e['mem_after']:.2f} GB\n"
-            )
+        win.geometry("820x460")
+
+        filters = tk.Frame(win)
+        filters.pack(fill='x', padx=8, pady=6)
+        ttk.Label(filters, text="Mode:").pack(side='left')
+        mode_var = tk.StringVar(value="all")
+        ttk.Combobox(filters, textvariable=mode_var, width=9, state='readonly',
+                     values=["all", "fast", "deep", "extreme", "contain"]).pack(side='left', padx=(5, 15))
+        ttk.Label(filters, text="From (YYYY-MM-DD):").pack(side='left')
+        since_var = tk.StringVar()
+        ttk.Entry(filters, textvariable=since_var, width=11).pack(side='left', padx=(5, 15))
+        ttk.Label(filters, text="To:").pack(side='left')
+        until_var = tk.StringVar()
+        ttk.Entry(filters, textvariable=until_var, width=11).pack(side='left', padx=5)
+
+        columns = ('Time', 'Mode', 'CPU %', 'RAM GB', 'CPU Δ (95% CI)')
+        widths = (170, 70, 130, 130, 200)
+        tree = ttk.Treeview(win, columns=columns, show='headings', selectmode='browse')
+        for col, width in zip(columns, widths):
+            tree.heading(col, text=col)
+            tree.column(col, width=width, stretch=(col == 'CPU Δ (95% CI)'))
+        tree.pack(fill='both', expand=True, padx=8)
+
+        nav = tk.Frame(win)
+        nav.pack(fill='x', padx=8, pady=6)
+        page_label = tk.Label(nav, text="")
+        state = {'offset': 0, 'total': 0, 'entries': {}}
+
+        def parse_day(text, end=False):
+            text = text.strip()
+            if not text:
+                return None
+            day = datetime.strptime(text, "%Y-%m-%d")
+            return day.timestamp() + (86400 if end else 0)
+
+        def load():
+            try:
+                since, until = parse_day(since_var.get()), parse_day(until_var.get(), end=True)
+            except ValueError:
+                page_label.config(text="Dates must be YYYY-MM-DD")
+                return
+            mode = None if mode_var.get() == "all" else mode_var.get()
+            entries, total = history.query(mode=mode, since=since, until=until,
+                                           offset=state['offset'], limit=page_size)
+            state['total'] = total
+            state['entries'] = {}
+            tree.delete(*tree.get_children())
+            for e in entries:
+                change = e.get('measurement', {}).get('metrics', {}).get('cpu_percent', {}).get('change')
+                if change and change.get('ci95') is not None:
+                    delta = f"{change['delta']:+.1f} ± {change['ci95']:.1f}" + (" *" if change['significant'] else "")
+                else:
+                    delta = "n/a"
+                iid = tree.insert('', 'end', values=(
+                    e['time'][:19].replace('T', ' '), e['mode'].upper(),
+                    f"{e['cpu_before']:.1f} → {e['cpu_after']:.1f}",
+                    f"{e['mem_before']:.2f} → {e['mem_after']:.2f}", delta))
+                state['entries'][iid] = e
+            if total:
+                page_label.config(text=f"{state['offset'] + 1}–{state['offset'] + len(entries)} of {total}"
+                                       f"   (* significant; double-click to plot)")
+            else:
+                page_label.config(text="No matching history.")
+
+        def apply_filters():
+            state['offset'] = 0
+            load()
+
+        def newer():
+            if state['offset'] > 0:
+                state['offset'] = max(state['offset'] - page_size, 0)
+                load()
+
+        def older():
+            if state['offset'] + page_size < state['total']:
+                state['offset'] += page_size
+                load()
+
+        def plot_selected(event=None):
+            selected = tree.selection()
+            entry = state['entries'].get(selected[0]) if selected else None
+            if entry and entry.get('measurement'):
+                self._plot_measurement(entry['measurement'], f"{entry['mode'].upper()} boost at {entry['time'][:19]}")
+
+        ttk.Button(filters, text="Apply", command=apply_filters).pack(side='left', padx=10)
+        ttk.Button(nav, text="◀ Newer", command=newer).pack(side='left')
+        ttk.Button(nav, text="Older ▶", command=older).pack(side='left', padx=5)
+        page_label.pack(side='left', padx=10)
+        tree.bind('<Double-1>', plot_selected)
+        load()
 
     def show_last_graphs(self):
         self.master.after(10, self._open_graph_window)
 
     def _open_graph_window(self):
         if not hasattr(self, "_last_boost"):
-            messagebox.showinfo("Graphs", "No boost performed yet.")
-            return
+            from core.boost_history import get_boost_history
+            latest = get_boost_history().latest()
+            if latest is None:
+                messagebox.showinfo("Graphs", "No boost performed yet.")
+                return
+            self._last_boost = dict(latest, timestamp=latest['time'])
 
         lb = self._last_boost
+        if lb.get("measurement"):
+            self._plot_measurement(lb["measurement"], f"{lb['mode'].upper()} boost at {lb['timestamp'][11:19]}")
+            return
 
+        plt = _pyplot()
         fig, axs = plt.subplots(1, 2, figsize=(10, 4))
 
         axs[0].bar(["Before", "After"], [lb["cpu_before"], lb["cpu_after"]], color="skyblue")
@@ -273,3 +549,37 @@ class PerformanceBoosterPanel:
         fig.suptitle("Boost Performance Summary", fontsize=14)
         plt.tight_layout()
         plt.show()
+
+    def _plot_measurement(self, result, title):
+        from core.measurement import SETTLE_SECONDS
+        series = result["series"]
+        # Entries saved before settle_seconds was recorded used the default
+        post_start = result["boost_seconds"] + result.get("settle_seconds", SETTLE_SECONDS)
+        plt = _pyplot()
+        fig, axs = plt.subplots(2, 2, figsize=(11, 6), sharex=True)
+
+        for ax, (key, metric) in zip(axs.flat, result["metrics"].items()):
+            points = [(t, v) for t, v in zip(series["t"], series[key]) if v is not None]
+            if points:
+                ax.plot([p[0] for p in points], [p[1] for p in points], color="#2980b9", marker=".")
+            ax.axvspan(0, result["boost_seconds"], color="#f39c12", alpha=0.2)
+            for side, start, end in (("before", -result["pre_seconds"], 0),
+                                     ("after", post_start, post_start + result["post_seconds"])):
+                summary = metric[side]
+                if summary:
+                    ax.hlines(summary["mean"], start, end, colors="#27ae60" if side == "after" else "#7f8c8d")
+                    if summary["ci95"] is not None:
+                        ax.fill_between([start, end], summary["mean"] - summary["ci95"],
+                                        summary["mean"] + summary["ci95"], color="#bdc3c7", alpha=0.4)
+            change = metric["change"]
+            if change and change["ci95"] is not None:
+                ax.set_title(f"{metric['label']}  Δ {change['delta']:+.2f} ± {change['ci95']:.2f}")
+            else:
+                ax.set_title(metric["label"])
+            ax.grid(True, alpha=0.3)
+
+        for ax in axs[1]:
+            ax.set_xlabel("Seconds from boost")
+        fig.suptitle(title, fontsize=14)
+        plt.tight_layout()
+        plt.show()
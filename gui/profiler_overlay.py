@@ -0,0 +1,91 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from core.profiler import get_profiler
+from core.memory_diagnostics import get_memory_diagnostics
+
+
+class ProfilerOverlay:
+    # Small always-on-top window with CoreSense's own cost; toggled from the
+    # main window (F12)
+    def __init__(self, parent, refresh_ms=1000):
+        self.profiler = get_profiler()
+        self.memory = get_memory_diagnostics()
+        self.refresh_ms = refresh_ms
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("CoreSense Self-Profile")
+        self.window.geometry("620x620")
+        self.window.attributes('-topmost', True)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.summary = tk.Label(self.window, text="", anchor='w', font=('Segoe UI', 10, 'bold'))
+        self.summary.pack(fill='x', padx=8, pady=(6, 0))
+        self.counters = tk.Label(self.window, text="", anchor='w', justify='left', font=('Consolas', 9))
+        self.counters.pack(fill='x', padx=8, pady=4)
+        self.memory_label = tk.Label(self.window, text="", anchor='w', justify='left', font=('Consolas', 9))
+        self.memory_label.pack(fill='x', padx=8)
+
+        columns = ('Calls', 'Mean ms', 'p95 ms', 'Max ms', 'Total s')
+        self.tree = ttk.Treeview(self.window, columns=columns, show='tree headings', height=14)
+        self.tree.heading('#0', text='Section')
+        self.tree.column('#0', width=240)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=70, anchor='e')
+        self.tree.pack(fill='both', expand=True, padx=8)
+
+        buttons = tk.Frame(self.window)
+        buttons.pack(fill='x', padx=8, pady=6)
+        ttk.Button(buttons, text="Dump JSON...", command=self.dump).pack(side='left')
+        ttk.Button(buttons, text="Reset", command=self.profiler.reset).pack(side='left', padx=5)
+
+        self.closed = False
+        self.refresh()
+
+    def refresh(self):
+        if self.closed:
+            return
+        snap = self.profiler.snapshot()
+        own = snap['process']
+        if own:
+            self.summary.config(text=f"CoreSense: CPU {own['cpu_percent']:.1f}%   RSS {own['rss'] / 1024 ** 2:.1f} MB   "
+                                     f"{own['threads']} threads   up {snap['uptime_seconds'] / 60:.0f} min")
+        counters = snap['counters']
+        self.counters.config(text="\n".join(
+            f"{name:<32}{value:>12,}" for name, value in sorted(counters.items())))
+
+        self.memory_label.config(text=self._memory_text())
+
+        self.tree.delete(*self.tree.get_children())
+        for name, t in sorted(snap['timers'].items(), key=lambda kv: kv[1]['total_ms'], reverse=True):
+            self.tree.insert('', 'end', text=name, values=(
+                f"{t['count']:,}", f"{t['mean_ms']:.2f}", f"{t['p95_ms']:.2f}",
+                f"{t['max_ms']:.1f}", f"{t['total_ms'] / 1000:.2f}"))
+        self.window.after(self.refresh_ms, self.refresh)
+
+    def _memory_text(self):
+        last = self.memory.last
+        if last is None:
+            return "Memory checks off (--memory-budget / --memory-diagnostics)" if not self.memory.running else ""
+        budget = f" / budget {last['budget_mb']:.0f} MB" if last['budget_mb'] else ""
+        rss = f"{last['rss_mb']:.1f} MB" if last['rss_mb'] is not None else "unknown"
+        lines = [f"Memory: RSS {rss}{budget}   {self.memory.evictions} evictions"]
+        lines += [f"{name:<32}{value if value is not None else '?':>12}" for name, value in sorted(last['counts'].items())]
+        lines += [f"{site['size_diff_kb']:+10.1f} KB  {site['site']}" for site in last['growth'][:5]]
+        return "\n".join(lines)
+
+    def dump(self):
+        path = filedialog.asksaveasfilename(parent=self.window, defaultextension='.json',
+                                            initialfile='coresense_profile.json',
+                                            filetypes=[('JSON', '*.json')])
+        if not path:
+            return
+        try:
+            self.profiler.dump(path)
+        except OSError as e:
+            messagebox.showerror("Dump failed", str(e), parent=self.window)
+
+    def close(self):
+        self.closed = True
+        self.window.destroy()
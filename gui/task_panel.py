@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 from datetime import datetime, timedelta
 from core.task_manager import TaskManager
+from core.profiler import profiled
 import json
 
 class TaskPanel:
@@ -205,6 +206,7 @@ class TaskPanel:
         ttk.Button(btn_frame, text="Add Subtask", command=self.add_subtask_dialog, width=11).pack(side='left', padx=2)
         ttk.Button(btn_frame, text="Edit Subtasks", command=self.edit_subtask_progress_dialog, width=12).pack(side='left', padx=2)
    
+    @profiled('ui.tasks.refresh_task_list')
     def refresh_task_list(self, tasks=None):
         for item in self.task_tree.get_children():
             self.task_tree.delete(item)
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+import argparse
 import sys
 import os
 
@@ -14,9 +15,108 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from gui.main_window import CoreSenseApp
 
+def env_number(name, cast, default):
+    # A malformed environment value falls back to the default instead of
+    # failing argument parsing for every mode
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        print(f"Ignoring {name}={value!r}: not a valid {cast.__name__}")
+        return default
+
+def host_port(value):
+    host, _, port = value.rpartition(':')
+    try:
+        port = int(port)
+    except ValueError:
+        port = -1
+    if not 0 < port < 65536:
+        raise argparse.ArgumentTypeError(f"expected HOST:PORT with a port from 1 to 65535, got {value!r}")
+    return host or '127.0.0.1', port
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CoreSense - Task & System Monitor")
+    parser.add_argument('--metrics-port', type=int,
+                        default=env_number('CORESENSE_METRICS_PORT', int, 0),
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument('--metrics-per-pid', action='store_true',
+                        help="label process metrics by pid as well as name (series count grows as pids churn)")
+    parser.add_argument('--agent', metavar='HOST:PORT', type=host_port,
+                        help="run headless and stream snapshots to a CoreSense aggregator")
+    parser.add_argument('--agent-name', help="host name reported by the agent (default: hostname)")
+    parser.add_argument('--aggregator', type=int, metavar='PORT',
+                        help="open the fleet view and accept agent connections on PORT")
+    parser.add_argument('--aggregator-bind', metavar='ADDR', default='127.0.0.1',
+                        help="address the aggregator listens on; the port is unauthenticated, "
+                             "so only widen this (e.g. 0.0.0.0) on a trusted network")
+    parser.add_argument('--trace', metavar='PATH', default=os.environ.get('CORESENSE_TRACE'),
+                        help="stream a Chrome trace (chrome://tracing, ui.perfetto.dev) to PATH")
+    parser.add_argument('--memory-budget', type=float, metavar='MB',
+                        default=env_number('CORESENSE_MEMORY_BUDGET_MB', float, 0.0),
+                        help="evict caches and warn when CoreSense's own RSS exceeds MB")
+    parser.add_argument('--memory-diagnostics', action='store_true',
+                        default=bool(os.environ.get('CORESENSE_MEMORY_DIAGNOSTICS')),
+                        help="diff tracemalloc snapshots to find growing allocation sites (slower)")
+    parser.add_argument('--memory-interval', type=float, default=60.0,
+                        help="seconds between memory checks")
+    parser.add_argument('--host-rate', type=float, default=2.0,
+                        help="max snapshots per second accepted from each agent")
+    return parser.parse_args()
+
+def run_agent(args):
+    import time
+    from core.collector import get_collector
+    from core.fleet import FleetAgent
+
+    host, port = args.agent
+    collector = get_collector()
+    agent = FleetAgent(collector, host, port, hostname=args.agent_name)
+    agent.start()
+    collector.start()
+    print(f"CoreSense agent '{agent.hostname}' streaming to {host}:{port}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        agent.stop()
+        collector.stop()
+
+def run_aggregator(args):
+    from core.fleet import FleetAggregator
+    from gui.fleet_panel import FleetPanel
+
+    aggregator = FleetAggregator(host=args.aggregator_bind, port=args.aggregator,
+                                 max_frames_per_sec=args.host_rate)
+    aggregator.start()
+    root = tk.Tk()
+    root.title("CoreSense - Fleet")
+    root.geometry("1000x600")
+    FleetPanel(root, aggregator)
+    root.mainloop()
+    aggregator.stop()
+
 def main():
+    args = parse_args()
+    if args.trace:
+        from core import tracing
+        tracing.enable(os.path.abspath(args.trace))
+    if args.memory_budget or args.memory_diagnostics:
+        from core.memory_diagnostics import get_memory_diagnostics
+        diag = get_memory_diagnostics()
+        diag.budget_mb = args.memory_budget or None
+        diag.interval = args.memory_interval
+        diag.start(snapshots=args.memory_diagnostics)
+    if args.agent:
+        run_agent(args)
+        return
+    if args.aggregator:
+        run_aggregator(args)
+        return
     root = tk.Tk()
-    app = CoreSenseApp(root)
+    app = CoreSenseApp(root, metrics_port=args.metrics_port, metrics_per_pid=args.metrics_per_pid)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+# Example collector plugin. Files starting with '_' are skipped; copy this to
+# plugins/app_counters.py to enable it. Its metrics then show up as
+# app_counters.<name> in history, the plugin graph and alert rules, e.g.
+#   app_counters.queue_depth > 500 for 1m
+import os
+
+INTERVAL = 5.0
+TIMEOUT = 1.0
+
+COUNTERS_PATH = os.environ.get('APP_COUNTERS_PATH', '/var/run/myapp/counters')
+
+
+def collect():
+    # One "name value" pair per line
+    values = {}
+    with open(COUNTERS_PATH) as f:
+        for line in f:
+            name, _, value = line.partition(' ')
+            try:
+                values[name] = float(value)
+            except ValueError:
+                continue
+    return values